@@ -19,10 +19,18 @@ from streamlit_folium import st_folium
 # --- Imports de vos modules ---
 from src.utils.i18n import i18n
 from src.auth import Authentication
-from src.config import APP_NAME, APP_VERSION, PUBLIC_DATA_HASH, COLORS, USE_REAL_DATA
+from src.config import (
+    APP_NAME, APP_VERSION, PUBLIC_DATA_HASH, COLORS, USE_REAL_DATA, EXCEL_STREAM_THRESHOLD_MB,
+    UPLOADS_DIR, UPLOADS_MAX_MB, UPLOADS_MAX_AGE_HOURS, UPLOADS_IN_USE_MINUTES
+)
 from src.utils.logger import setup_logger
 from src.data.sync import DataSynchronizer
+from src.data.uploads import UploadStore
+from src.connectors.compression import COMPRESSED_EXTENSIONS
 from src.finance.calculator import FinancialCalculator
+from src.finance.merkle import PeriodMerkleIndex
+from src.finance.comparison import PeriodComparator
+from src.finance.baseline import BaselineEstimator
 from src.visualization.components import UIComponents
 from src.visualization.charts import ChartGenerator
 from src.visualization.maps import MapGenerator
@@ -39,6 +47,44 @@ except ImportError:
 logger = setup_logger(__name__)
 
 
+@st.cache_resource
+def get_upload_store() -> UploadStore:
+    """Stockage des fichiers importés, partagé entre les sessions."""
+    return UploadStore(
+        UPLOADS_DIR, UPLOADS_MAX_MB * 1024 * 1024, UPLOADS_MAX_AGE_HOURS * 3600,
+        in_use_seconds=UPLOADS_IN_USE_MINUTES * 60
+    )
+
+
+def stored_upload(uploaded_file, suffix: str) -> str:
+    """
+    Chemin du fichier importé dans le stockage partagé. Le fichier n'est
+    écrit qu'une fois par import (file_id) ; les réexécutions suivantes
+    signalent seulement son utilisation, ce qui le protège de l'éviction.
+    """
+    store = get_upload_store()
+    saved = st.session_state.setdefault('saved_uploads', {})
+    path = saved.get(uploaded_file.file_id)
+    if path is None or not store.touch(path):
+        path = str(store.save(uploaded_file, suffix))
+        saved[uploaded_file.file_id] = path
+    return path
+
+
+def ingest_upload(sync: DataSynchronizer) -> None:
+    """
+    Intègre un fichier importé dans l'index de déduplication du secteur, une
+    fois par fichier ; le bilan (lignes nouvelles, déjà intégrées) est gardé
+    pour la barre latérale.
+    """
+    ingested = st.session_state.setdefault('ingested_uploads', set())
+    if not sync.sector.natural_key or sync.data_source in ingested:
+        return
+    new_rows = sync.ingest()
+    ingested.add(sync.data_source)
+    st.session_state.last_ingest = (len(new_rows), sync.last_duplicates)
+
+
 def main():
     try:
         # Langue
@@ -64,7 +110,15 @@ def main():
 
         # Initialisation des services
         data_sync = DataSynchronizer(use_real_data=USE_REAL_DATA)
-        finance_calc = FinancialCalculator(st.session_state)
+        if 'merkle_index' not in st.session_state:
+            st.session_state.merkle_index = PeriodMerkleIndex()
+        if 'baseline_estimator' not in st.session_state:
+            st.session_state.baseline_estimator = BaselineEstimator()
+        finance_calc = FinancialCalculator(
+            st.session_state,
+            merkle_index=st.session_state.merkle_index,
+            baseline_estimator=st.session_state.baseline_estimator
+        )
         chart_gen = ChartGenerator()
         map_gen = MapGenerator()
 
@@ -78,10 +132,25 @@ def main():
             if sector == 'port':
                 period_data = st.session_state.get('period_data')
                 if period_data is not None:
+                    if finance_calc._get_param('baseline_mode') == 'historical':
+                        # Alimente l'historique des baselines (seuls les jours nouveaux sont intégrés)
+                        try:
+                            reference = data_sync.load_reference_data(
+                                period_data.start_date, int(finance_calc._get_param('baseline_window_days'))
+                            )
+                            st.session_state.baseline_estimator.update(reference.daily_data)
+                        except Exception as e:
+                            logger.warning(f"Fenêtre de référence indisponible : {e}")
                     financial_metrics = finance_calc.calculate(period_data)
 
+                    try:
+                        comparison = PeriodComparator(data_sync, finance_calc).compare(period_data, financial_metrics)
+                    except Exception as e:
+                        logger.warning(f"Comparaison avec la période précédente indisponible : {e}")
+                        comparison = None
+
                     render_header(period_data.period_name)
-                    render_operational_summary(period_data, financial_metrics)
+                    render_operational_summary(period_data, financial_metrics, comparison)
                     render_performance_analysis(period_data, chart_gen)
                     render_equipment_performance(period_data, chart_gen)
                     render_realtime_map(map_gen)
@@ -724,6 +793,9 @@ def render_sidebar(data_sync):
             'retail': '🛒 Grande Distribution',
             'education': '🎓 Éducation'
         }
+        # Secteurs ajoutés par des plugins (points d'entrée opsgain.sectors)
+        for plugin_sector in SectorFactory.available():
+            sector_options.setdefault(plugin_sector, plugin_sector.capitalize())
         selected_sector_key = st.selectbox(
             "Choisissez le secteur",
             options=list(sector_options.keys()),
@@ -769,24 +841,30 @@ def render_sidebar(data_sync):
         data_mode = st.radio("Mode de données", ["Simulées", "Réelles"], key='data_mode')
 
         if data_mode == "Réelles":
-            source_type = st.selectbox("Type de source", ["Excel", "CSV", "API"], key='source_type')
+            source_type = st.selectbox("Type de source", ["Excel", "CSV", "Parquet", "API", "SQL"], key='source_type')
             if source_type == "Excel":
                 uploaded_file = st.file_uploader("Choisissez un fichier Excel", type=['xlsx', 'xls'], key='excel_file')
                 if uploaded_file:
-                    import tempfile
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp:
-                        tmp.write(uploaded_file.getvalue())
-                        st.session_state.data_source = tmp.name
-                        st.session_state.connector_type = 'excel'
-                        st.session_state.connector_config = {}
+                    suffix = '.xls' if uploaded_file.name.lower().endswith('.xls') else '.xlsx'
+                    st.session_state.data_source = stored_upload(uploaded_file, suffix)
+                    st.session_state.connector_type = 'excel'
+                    large_file = uploaded_file.size > EXCEL_STREAM_THRESHOLD_MB * 1024 * 1024
+                    st.session_state.connector_config = {'mode': 'stream'} if large_file else {}
             elif source_type == "CSV":
-                uploaded_file = st.file_uploader("Choisissez un fichier CSV", type=['csv'], key='csv_file')
+                uploaded_file = st.file_uploader(
+                    "Choisissez un fichier CSV (éventuellement compressé)",
+                    type=['csv', *COMPRESSED_EXTENSIONS], key='csv_file'
+                )
+                if uploaded_file:
+                    st.session_state.data_source = stored_upload(uploaded_file, '.csv')
+                    st.session_state.connector_type = 'csv'
+                    st.session_state.connector_config = {}
+            elif source_type == "Parquet":
+                uploaded_file = st.file_uploader("Choisissez un fichier Parquet", type=['parquet'], key='parquet_file')
                 if uploaded_file:
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as tmp:
-                        tmp.write(uploaded_file.getvalue())
-                        st.session_state.data_source = tmp.name
-                        st.session_state.connector_type = 'csv'
-                        st.session_state.connector_config = {}
+                    st.session_state.data_source = stored_upload(uploaded_file, '.parquet')
+                    st.session_state.connector_type = 'parquet'
+                    st.session_state.connector_config = {}
             elif source_type == "API":
                 url = st.text_input("URL de l'API")
                 method = st.selectbox("Méthode", ["GET", "POST"])
@@ -794,6 +872,16 @@ def render_sidebar(data_sync):
                     st.session_state.data_source = url
                     st.session_state.connector_type = 'api'
                     st.session_state.connector_config = {'method': method}
+            elif source_type == "SQL":
+                database = st.text_input("Base SQLite (chemin du fichier)")
+                table = st.text_input("Table des opérations")
+                if database and table:
+                    st.session_state.data_source = table
+                    st.session_state.connector_type = 'sql'
+                    st.session_state.connector_config = {'database': database}
+            if st.session_state.get('last_ingest'):
+                new_count, known = st.session_state.last_ingest
+                st.caption(f"Dernier import : {new_count} enregistrement(s) nouveau(x), {known} déjà intégré(s)")
         else:
             st.info("Données simulées générées automatiquement.")
 
@@ -841,9 +929,17 @@ def render_sidebar(data_sync):
                                 use_real_data=True,
                                 sector_name=sector_name,
                                 connector_type=st.session_state.connector_type,
-                                connector_config=st.session_state.connector_config
+                                connector_config=st.session_state.connector_config,
+                                data_source=st.session_state.data_source
+                            )
+                            if st.session_state.connector_type in ('excel', 'csv', 'parquet'):
+                                # Fichier importé : seules ses lignes jamais vues entrent dans l'index
+                                ingest_upload(sync)
+                            data = sync.load_data(
+                                st.session_state.data_source,
+                                st.session_state.get('start_date'),
+                                st.session_state.get('end_date')
                             )
-                            data = sync.load_data(st.session_state.data_source)
                             if data is not None:
                                 st.session_state.data = data
                                 st.session_state.data_loaded = True
@@ -1010,6 +1106,35 @@ def render_financial_params():
         )
         st.session_state.baseline_error_rate = baseline_error_input / 100
 
+    baseline_modes = {"fixed": "Valeurs contractuelles", "historical": "Historique (fenêtre de référence)"}
+    st.session_state.baseline_mode = st.selectbox(
+        "Source des valeurs de référence",
+        options=list(baseline_modes),
+        index=list(baseline_modes).index(st.session_state.baseline_mode),
+        format_func=lambda x: baseline_modes[x],
+        key="baseline_mode_input"
+    )
+    if st.session_state.baseline_mode == "historical":
+        col7, col8 = st.columns(2)
+        with col7:
+            baseline_methods = {"median": "Médiane", "trimmed_mean": "Moyenne tronquée", "seasonal": "Saisonnière"}
+            st.session_state.baseline_method = st.selectbox(
+                "Méthode",
+                options=list(baseline_methods),
+                index=list(baseline_methods).index(st.session_state.baseline_method),
+                format_func=lambda x: baseline_methods[x],
+                key="baseline_method_input"
+            )
+        with col8:
+            st.session_state.baseline_window_days = st.number_input(
+                "Fenêtre (jours)",
+                min_value=7,
+                max_value=730,
+                value=int(st.session_state.baseline_window_days),
+                step=7,
+                key="baseline_window_input"
+            )
+
     working_days = st.slider(
         i18n.get('sidebar.working_days'),
         20, 26,
@@ -1109,9 +1234,17 @@ def render_header(period_name):
         st.session_state.demo_launched = False
 
 
-def render_operational_summary(period_data, financial_metrics):
+def render_operational_summary(period_data, financial_metrics, comparison=None):
     st.markdown(f'<h2 class="section-title">{i18n.get("dashboard.operational_summary")}</h2>', unsafe_allow_html=True)
 
+    def vs_previous(key, fmt="{:+.1f}%"):
+        """Écart réel avec la période précédente (None si indisponible)."""
+        if comparison is None or not comparison.has_previous() or comparison.delta_pct.get(key) is None:
+            return None
+        return i18n.get('dashboard.vs_previous', delta=fmt.format(comparison.delta_pct[key]))
+
+    previous_help = f" — période précédente : {comparison.previous_period_name}" if comparison is not None else ""
+
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         total_ops = period_data.daily_data['nb_operations'].sum()
@@ -1119,36 +1252,38 @@ def render_operational_summary(period_data, financial_metrics):
         st.metric(
             label=i18n.get('dashboard.total_operations'),
             value=f"{total_ops:,}",
-            delta=f"{avg_daily_ops:,.0f}{i18n.get('common.per_day')}",
-            help=f"Total sur {len(period_data.daily_data)} jours"
+            delta=vs_previous('total_operations') or f"{avg_daily_ops:,.0f}{i18n.get('common.per_day')}",
+            help=f"Total sur {len(period_data.daily_data)} jours{previous_help}"
         )
     with col2:
-        avg_duration = period_data.daily_data['duree_moyenne'].mean()
-        prev_duration = avg_duration * 1.05
-        delta_pct = ((prev_duration - avg_duration) / prev_duration * 100) if prev_duration > 0 else 0
+        avg_duration = financial_metrics.period_summary.get('avg_duration', period_data.daily_data['duree_moyenne'].mean())
         st.metric(
             label=i18n.get('dashboard.avg_duration'),
             value=f"{avg_duration:.1f} {i18n.get('common.minutes')}",
-            delta=f"-{delta_pct:.1f}%" if delta_pct > 0 else None,
-            help="Moyenne pondérée par le nombre d'opérations"
+            delta=vs_previous('avg_duration'),
+            delta_color="inverse",
+            help=f"Moyenne pondérée par le nombre d'opérations{previous_help}"
         )
     with col3:
         total_errors = period_data.daily_data['erreurs'].sum()
         total_ops = period_data.daily_data['nb_operations'].sum()
         error_rate = (total_errors / total_ops * 100) if total_ops > 0 else 0
+        error_delta = None
+        if comparison is not None and comparison.has_previous():
+            error_delta = i18n.get('dashboard.vs_previous', delta=f"{comparison.deltas['error_rate']:+.1f} pts")
         st.metric(
             label=i18n.get('dashboard.error_rate'),
             value=f"{error_rate:.1f}%",
-            delta=f"{total_errors} {i18n.get('common.errors')}",
-            delta_color="normal" if error_rate < 2.5 else "inverse",
-            help=f"Total de {total_errors} erreurs sur la période"
+            delta=error_delta or f"{total_errors} {i18n.get('common.errors')}",
+            delta_color="inverse" if error_delta else ("normal" if error_rate < 2.5 else "inverse"),
+            help=f"Total de {total_errors} erreurs sur la période{previous_help}"
         )
     with col4:
         st.metric(
             label=i18n.get('dashboard.total_gains'),
             value=f"${financial_metrics.period_gains:,.0f}",
-            delta=f"${financial_metrics.daily_gains:,.0f}{i18n.get('common.per_day')}",
-            help=f"Gains estimés sur {len(period_data.daily_data)} jours"
+            delta=vs_previous('period_gains') or f"${financial_metrics.daily_gains:,.0f}{i18n.get('common.per_day')}",
+            help=f"Gains estimés sur {len(period_data.daily_data)} jours{previous_help}"
         )
     st.markdown("---")
 
@@ -1186,8 +1321,9 @@ def render_equipment_performance(period_data, chart_gen):
     with col2:
         st.markdown(f" {i18n.get('dashboard.equipment_to_monitor')}")
         if not period_data.engins_data.empty:
-            period_data.engins_data['taux_erreur'] = (period_data.engins_data['erreurs'] / period_data.engins_data['total_operations'] * 100)
-            problem_engins = period_data.engins_data[period_data.engins_data['taux_erreur'] > 1.5]
+            # Copie : les données de la période (gardées en session) ne sont pas modifiées
+            engins = period_data.engins_data.assign(taux_erreur=period_data.engins_data['erreurs'] / period_data.engins_data['total_operations'] * 100)
+            problem_engins = engins[engins['taux_erreur'] > 1.5]
             if not problem_engins.empty:
                 for _, engin in problem_engins.iterrows():
                     error_class = "badge-danger" if engin['taux_erreur'] > 3 else "badge-warning"
@@ -1248,8 +1384,8 @@ def render_alerts_and_activity(period_data):
             if latest_day['erreurs'] > 0 and (latest_day['erreurs'] / latest_day['nb_operations']) > 0.03:
                 alerts.append(i18n.get('alerts.critical_error_rate'))
         if not period_data.engins_data.empty:
-            period_data.engins_data['taux_erreur'] = (period_data.engins_data['erreurs'] / period_data.engins_data['total_operations'] * 100)
-            engins_problematiques = period_data.engins_data[period_data.engins_data['taux_erreur'] > 2.0]
+            engins = period_data.engins_data.assign(taux_erreur=period_data.engins_data['erreurs'] / period_data.engins_data['total_operations'] * 100)
+            engins_problematiques = engins[engins['taux_erreur'] > 2.0]
             for _, engin in engins_problematiques.iterrows():
                 alerts.append(i18n.get('alerts.maintenance_needed', equip=engin['engin'], rate=engin['taux_erreur']))
         if alerts:
@@ -1291,9 +1427,9 @@ def render_recommendations(period_data):
             nb_urgences = int(zone_urgences.max())
             recommendations.append(i18n.get('recommendations.optimize_zone', zone=zone_probleme, urgences=nb_urgences))
     if not period_data.engins_data.empty:
-        period_data.engins_data['taux_erreur'] = (period_data.engins_data['erreurs'] / period_data.engins_data['total_operations'] * 100)
-        if not period_data.engins_data.empty:
-            engin_probleme = period_data.engins_data.loc[period_data.engins_data['taux_erreur'].idxmax()]
+        engins = period_data.engins_data.assign(taux_erreur=period_data.engins_data['erreurs'] / period_data.engins_data['total_operations'] * 100)
+        if not engins.empty:
+            engin_probleme = engins.loc[engins['taux_erreur'].idxmax()]
             if engin_probleme['taux_erreur'] > 2.0:
                 recommendations.append(i18n.get('recommendations.maintenance', equip=engin_probleme['engin'], rate=engin_probleme['taux_erreur']))
     if not period_data.hourly_data.empty:
@@ -1375,6 +1511,10 @@ def render_financial_module(financial_metrics, period_data):
         fig_fin = chart_gen.create_financial_pie_chart(financial_metrics.breakdown)
         st.plotly_chart(fig_fin, use_container_width=True)
 
+        if financial_metrics.daily_series is not None and not financial_metrics.daily_series.empty:
+            fig_trend = chart_gen.create_daily_gains_chart(financial_metrics.daily_series)
+            st.plotly_chart(fig_trend, use_container_width=True)
+
     with col_resume:
         st.markdown(f" {i18n.get('financial.contract_summary')}")
 
@@ -1421,7 +1561,8 @@ def render_financial_module(financial_metrics, period_data):
         {i18n.get('financial.from', date=period_summary['start_date'])}  
         {i18n.get('financial.to', date=period_summary['end_date'])}  
         {i18n.get('financial.days_count', days=period_summary['total_days'])}  
-        {i18n.get('financial.data_hash', hash=PUBLIC_DATA_HASH)}
+        {i18n.get('financial.data_hash', hash=PUBLIC_DATA_HASH)}  
+        {i18n.get('financial.merkle_root', root=financial_metrics.merkle_root[:18])}
         """)
 
         col_btn1, col_btn2 = st.columns(2)
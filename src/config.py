@@ -15,6 +15,7 @@ BASE_DIR = Path(__file__).parent.parent
 ASSETS_DIR = BASE_DIR / "assets"
 DATA_DIR = BASE_DIR / "data"
 LOGS_DIR = BASE_DIR / "data" / "logs"
+CACHE_DIR = BASE_DIR / "data" / "cache"
 
 # Création des répertoires
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
@@ -43,7 +44,10 @@ FINANCIAL_PARAMS = {
     "baseline_error_rate": 0.032,
     "working_days": 22,
     "fuel_saving_per_truck": 1.5,
-    "maintenance_alert_cost": 500
+    "maintenance_alert_cost": 500,
+    "baseline_mode": "fixed",  # "fixed" (valeurs ci-dessus) ou "historical" (fenêtre de référence)
+    "baseline_method": "median",  # "median", "trimmed_mean" ou "seasonal"
+    "baseline_window_days": 90
 }
 
 # Configuration de la carte
@@ -74,7 +78,37 @@ COLORS = {
 APP_VERSION = "3.0.0"
 APP_NAME = "OPSGAIN PLATEFORM"
 APP_DESCRIPTION = "La plateforme qui transforme vos données opérationnelles en gains financiers vérifiables en temps réel"
+# Cache des réponses API (requêtes conditionnelles ETag / Last-Modified)
+API_CACHE_DIR = CACHE_DIR / "api"
+API_CACHE_MAX_MB = 256
+# Conversions Arrow des fichiers CSV/Excel importés (lecture par projection mémoire)
+CONVERSION_CACHE_DIR = CACHE_DIR / "conversions"
+CONVERSION_CACHE_MAX_MB = 1024
+# Sources plus volumineuses lues par blocs avec filtre de période, sans conversion
+# ni données complètes gardées en mémoire
+CONVERSION_CACHE_MAX_SOURCE_MB = 256
+# Données complètes des sources locales gardées en mémoire (toutes sources confondues)
+SECTOR_FRAMES_MAX_MB = 512
+CACHED_CONNECTORS = ("csv", "excel")
+
+# Fichiers importés (adressés par contenu, purgés par âge puis par taille)
+UPLOADS_DIR = DATA_DIR / "uploads"
+UPLOADS_MAX_MB = 2048
+UPLOADS_MAX_AGE_HOURS = 24
+# Fichier importé protégé de l'éviction tant qu'il a servi depuis moins de ce délai
+UPLOADS_IN_USE_MINUTES = 30
+
+# Clés naturelles déjà intégrées, par secteur (déduplication des réimports)
+DEDUPE_DIR = DATA_DIR / "dedupe"
+
 USE_REAL_DATA = False  # ou True si vous utilisez des données réelles
 
+# Données réelles : performance des engins recalculée sur la période à partir des
+# opérations, au lieu du cumul de equipment_performance.csv
+ENGINS_FROM_OPERATIONS = False
+
+# Au-delà de cette taille, les classeurs Excel importés sont lus en flux (mémoire bornée)
+EXCEL_STREAM_THRESHOLD_MB = 20
+
 # URLs
 DEFAULT_BASE_URL = "https://opsgain-plateform-kyrqqc6ibx2um8cbnqo5bg.streamlit.app"
@@ -1,28 +1,270 @@
-from typing import Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from http.cookiejar import DefaultCookiePolicy
 import requests
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
 from .base import BaseConnector
+from .http_cache import DEFAULT_MAX_BYTES, ResponseCache
+
+# Paramètres par défaut du pool HTTP
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = (5, 30)  # (connexion, lecture) en secondes
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Pagination : 'page' (numéro de page), 'offset' (décalage) ou 'cursor' (jeton suivant)
+PAGINATION_STRATEGIES = ('page', 'offset', 'cursor')
+PAGINATION_DEFAULTS = {
+    'page_size': 100,
+    'page_param': 'page',
+    'size_param': 'per_page',
+    'offset_param': 'offset',
+    'limit_param': 'limit',
+    'cursor_param': 'cursor',
+    'next_path': None,    # chemin JSON du jeton suivant (cursor)
+    'total_path': None,   # chemin JSON du nombre total d'éléments
+    'pages_path': None,   # chemin JSON du nombre total de pages
+    'max_pages': 10_000
+}
 
 class APIConnector(BaseConnector):
-    """Connecteur pour API REST."""
+    """
+    Connecteur pour API REST.
+
+    Les requêtes passent par un adaptateur HTTP partagé (keep-alive, pool de
+    connexions, reprises avec backoff exponentiel) : un adaptateur est créé par
+    configuration et monté sur la session propre à chaque instance ; le pool de
+    connexions d'urllib3 est sûr entre threads. Les sessions ne conservent
+    aucun cookie reçu : un connecteur partagé entre sources ou entre sessions
+    utilisateur ne renvoie jamais les cookies d'un autre appelant (seuls ceux
+    passés explicitement à read() sont envoyés).
+
+    Avec cache_dir, les lectures GET non paginées envoient des requêtes
+    conditionnelles et, sur 304, renvoient le DataFrame déjà analysé.
+    """
+
+    _adapters: Dict[Tuple, HTTPAdapter] = {}
+    _adapters_lock = threading.Lock()
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF,
+        cache_dir=None,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.cache = ResponseCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, **config) -> "APIConnector":
+        """Connecteur de l'application : cache des réponses dans data/cache/api."""
+        from ..config import API_CACHE_DIR, API_CACHE_MAX_MB
+        return cls(cache_dir=API_CACHE_DIR, cache_max_bytes=API_CACHE_MAX_MB * 1024 * 1024)
+
+    @property
+    def session(self) -> requests.Session:
+        """Session de ce connecteur, montée sur l'adaptateur partagé de sa configuration."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session(self.adapter)
+        return self._session
+
+    @property
+    def adapter(self) -> HTTPAdapter:
+        """Adaptateur (pool de connexions, reprises) partagé par les connecteurs de même configuration."""
+        key = (self.pool_size, self.retries, self.backoff_factor)
+        adapter = self._adapters.get(key)
+        if adapter is None:
+            with self._adapters_lock:
+                adapter = self._adapters.get(key)
+                if adapter is None:
+                    adapter = self._build_adapter(*key)
+                    self._adapters[key] = adapter
+        return adapter
+
+    @staticmethod
+    def _build_adapter(pool_size: int, retries: int, backoff_factor: float) -> HTTPAdapter:
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        return HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    @staticmethod
+    def _build_session(adapter: HTTPAdapter) -> requests.Session:
+        session = requests.Session()
+        # Aucun cookie reçu n'est conservé ni renvoyé par la session
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        # Encodages que urllib3 sait décompresser ici (gzip, deflate, br/zstd si installés)
+        session.headers.update(make_headers(accept_encoding=True))
+        return session
+
+    @classmethod
+    def close_sessions(cls):
+        """Ferme les adaptateurs partagés (libère les connexions)."""
+        with cls._adapters_lock:
+            for adapter in cls._adapters.values():
+                adapter.close()
+            cls._adapters.clear()
 
-    def read(self, url: str, method: str = 'GET', params: dict = None, headers: dict = None, json_path: str = None, **kwargs) -> pd.DataFrame:
+    def read(self, url: str, method: str = 'GET', params: dict = None, headers: dict = None, json_path: str = None,
+             timeout: Optional[Tuple[float, float]] = None, pagination: Optional[dict] = None,
+             concurrency: Optional[int] = None, **kwargs) -> pd.DataFrame:
+        """
+        Appelle l'API et retourne les enregistrements sous forme de DataFrame.
+
+        Args:
+            url: URL ou dictionnaire {'url', 'start_date', 'end_date'}.
+            json_path: Chemin pointé vers la liste d'enregistrements (ex. 'data.items').
+            pagination: Configuration de pagination ({'type': 'page'|'offset'|'cursor', ...},
+                voir PAGINATION_DEFAULTS). Sans configuration, une seule requête.
+            concurrency: Nombre maximal de pages téléchargées en parallèle (défaut : taille du pool).
+        """
         try:
-            response = requests.request(method, url, params=params, headers=headers, **kwargs)
-            response.raise_for_status()
-            data = response.json()
-            if isinstance(data, list):
-                df = pd.DataFrame(data)
-            elif isinstance(data, dict) and json_path:
-                for key in json_path.split('.'):
-                    data = data[key]
-                df = pd.DataFrame(data)
+            url, _, _ = self.resolve_source(url)
+            request = dict(method=method, headers=headers, timeout=timeout or self.timeout, **kwargs)
+            if pagination:
+                pages = self._read_pages(url, params or {}, json_path, pagination, concurrency or self.pool_size, request)
+                df = pd.DataFrame([record for page in pages for record in page])
+            elif self.cache is not None and method.upper() == 'GET':
+                df = self._read_cached(url, params, json_path, request)
             else:
-                raise ValueError("Format de réponse API non supporté.")
+                df = pd.DataFrame(self._records(self._fetch(url, params, request), json_path))
             self.validate(df)
             return df
         except Exception as e:
             raise RuntimeError(f"Erreur d'appel API : {e}")
 
+    def _fetch(self, url: str, params: Optional[dict], request: dict) -> Any:
+        response = self.session.request(url=url, params=params, **request)
+        response.raise_for_status()
+        return response.json()
+
+    def _read_cached(self, url: str, params: Optional[dict], json_path: Optional[str], request: dict) -> pd.DataFrame:
+        """Requête conditionnelle : 304 sert le DataFrame en cache, 200 le remplace."""
+        # En-têtes d'authentification et identifiants dans la clé : pas de réponse partagée entre comptes
+        key = self.cache.key(
+            url, params, json_path, request.get('headers'), (request.get('auth'), request.get('cookies'))
+        )
+        validators = self.cache.validators(key)
+        if validators:
+            conditional = dict(request, headers={**(request.get('headers') or {}), **validators})
+            response = self.session.request(url=url, params=params, **conditional)
+            if response.status_code == 304:
+                cached = self.cache.load(key)
+                if cached is not None:
+                    return cached
+                # Entrée disparue entre-temps : requête complète
+                response = self.session.request(url=url, params=params, **request)
+        else:
+            response = self.session.request(url=url, params=params, **request)
+        response.raise_for_status()
+        df = pd.DataFrame(self._records(response.json(), json_path))
+        self.cache.store(key, df, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return df
+
+    @staticmethod
+    def _lookup(data: Any, path: Optional[str]) -> Any:
+        """Valeur au chemin pointé (None si absente)."""
+        if not path:
+            return None
+        for key in path.split('.'):
+            if not isinstance(data, dict) or key not in data:
+                return None
+            data = data[key]
+        return data
+
+    @staticmethod
+    def _records(data: Any, json_path: Optional[str]) -> List:
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict) and json_path:
+            for key in json_path.split('.'):
+                data = data[key]
+            return data
+        raise ValueError("Format de réponse API non supporté.")
+
+    def _read_pages(self, url: str, params: dict, json_path: Optional[str], pagination: dict,
+                    concurrency: int, request: dict) -> List[List]:
+        """Télécharge toutes les pages et les retourne dans l'ordre."""
+        config = {**PAGINATION_DEFAULTS, **pagination}
+        strategy = config.get('type', 'page')
+        if strategy not in PAGINATION_STRATEGIES:
+            raise ValueError(f"Pagination non supportée : {strategy}")
+        if strategy == 'cursor':
+            return self._read_cursor_pages(url, params, json_path, config, request)
+
+        page_size = config['page_size']
+        first_page = config.get('start', 1 if strategy == 'page' else 0)
+
+        def page_params(index: int) -> dict:
+            if strategy == 'page':
+                return {**params, config['page_param']: first_page + index, config['size_param']: page_size}
+            return {**params, config['offset_param']: first_page + index * page_size, config['limit_param']: page_size}
+
+        def fetch(index: int) -> List:
+            return self._records(self._fetch(url, page_params(index), request), json_path)
+
+        # La première page renseigne éventuellement le volume total
+        data = self._fetch(url, page_params(0), request)
+        pages = [self._records(data, json_path)]
+        total_pages = self._lookup(data, config['pages_path'])
+        total_items = self._lookup(data, config['total_path'])
+        if total_pages is None and total_items is not None:
+            total_pages = -(-int(total_items) // page_size)
+        max_pages = min(int(total_pages), config['max_pages']) if total_pages is not None else config['max_pages']
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            if total_pages is not None:
+                # Volume connu : toutes les pages restantes en parallèle, map() conserve l'ordre
+                pages.extend(executor.map(fetch, range(1, max_pages)))
+                return pages
+            # Volume inconnu : lots de `concurrency` pages jusqu'à une page incomplète
+            index = 1
+            while len(pages[-1]) >= page_size and index < max_pages:
+                batch = range(index, min(index + concurrency, max_pages))
+                for page in executor.map(fetch, batch):
+                    pages.append(page)
+                    if len(page) < page_size:
+                        break
+                index = batch.stop
+        return pages
+
+    def _read_cursor_pages(self, url: str, params: dict, json_path: Optional[str], config: dict,
+                           request: dict) -> List[List]:
+        """Pagination par curseur : séquentielle, chaque page donne le jeton suivant."""
+        if not config['next_path']:
+            raise ValueError("La pagination par curseur nécessite 'next_path'.")
+        pages, cursor = [], config.get('start')
+        while len(pages) < config['max_pages']:
+            page_params = dict(params, **{config['cursor_param']: cursor}) if cursor is not None else params
+            data = self._fetch(url, page_params, request)
+            pages.append(self._records(data, json_path))
+            cursor = self._lookup(data, config['next_path'])
+            if not cursor or not pages[-1]:
+                break
+        return pages
+
     def write(self, data: pd.DataFrame, destination: Any, **kwargs):
         raise NotImplementedError("L'écriture via API n'est pas implémentée.")
\ No newline at end of file
@@ -1,10 +1,31 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # dépendance optionnelle
+    pa = pc = None
+
 class BaseConnector(ABC):
     """Interface commune pour tous les connecteurs de données."""
 
+    # Vrai si read() sait filtrer la période (date_column, start_date, end_date) à la lecture
+    supports_period_filter = False
+    # Vrai si read() sait exécuter une agrégation déclarée par un secteur (aggregation=...)
+    supports_aggregation = False
+    # Vrai si read() accepte un lot de fichiers (dossier ou glob) et un transform par fichier
+    supports_multi_file = False
+
+    @classmethod
+    def from_config(cls, **config) -> "BaseConnector":
+        """
+        Construit le connecteur à partir de la configuration de la source
+        (connector_config) ; par défaut, les options de lecture sont ignorées ici.
+        """
+        return cls()
+
     @abstractmethod
     def read(self, source: Any, **kwargs) -> pd.DataFrame:
         """
@@ -19,6 +40,66 @@ class BaseConnector(ABC):
         """
         pass
 
+    @staticmethod
+    def resolve_source(source: Any) -> Tuple[Any, Optional[Any], Optional[Any]]:
+        """
+        Décompose une source en (emplacement, start_date, end_date).
+        Accepte un chemin/URL simple ou un dictionnaire {'path', 'start_date', 'end_date'}.
+        """
+        if isinstance(source, dict):
+            location = source.get('path', source.get('file_path', source.get('url')))
+            return location, source.get('start_date'), source.get('end_date')
+        return source, None, None
+
+    @staticmethod
+    def period_mask(dates: pd.Series, start_date=None, end_date=None) -> pd.Series:
+        """Masque booléen des dates comprises dans [start_date, end_date]."""
+        mask = dates.notna()
+        if start_date is not None:
+            mask &= dates >= pd.Timestamp(start_date)
+        if end_date is not None:
+            mask &= dates <= pd.Timestamp(end_date)
+        return mask
+
+    @staticmethod
+    def period_bound(value, tz, date_only: bool) -> pd.Timestamp:
+        """
+        Borne de période comparable à une colonne Arrow. Colonne de dates : jour
+        de la borne (une heure de début ne retire pas le premier jour). Colonne
+        avec fuseau : une borne naïve est une heure locale de ce fuseau ; colonne
+        sans fuseau : une borne avec fuseau garde son heure locale.
+        """
+        bound = pd.Timestamp(value)
+        if date_only:
+            return bound.tz_localize(None).normalize()
+        if tz is not None:
+            return bound.tz_localize(tz) if bound.tzinfo is None else bound.tz_convert(tz)
+        return bound.tz_localize(None) if bound.tzinfo is not None else bound
+
+    @classmethod
+    def filter_arrow_table(cls, table, date_column: str, start_date=None, end_date=None, dayfirst: bool = False):
+        """
+        Filtre de période sur une table Arrow : comparaison directe pour une
+        colonne temporelle, sinon seule la colonne de date est convertie en pandas.
+        """
+        column = table[date_column]
+        if pa.types.is_timestamp(column.type) or pa.types.is_date(column.type):
+            tz = getattr(column.type, 'tz', None)
+            date_only = pa.types.is_date(column.type)
+
+            def scalar(value):
+                bound = cls.period_bound(value, tz, date_only)
+                return pa.scalar(bound.date() if date_only else bound, type=column.type)
+
+            mask = pc.is_valid(column)
+            if start_date is not None:
+                mask = pc.and_(mask, pc.greater_equal(column, scalar(start_date)))
+            if end_date is not None:
+                mask = pc.and_(mask, pc.less_equal(column, scalar(end_date)))
+            return table.filter(mask)
+        dates = pd.to_datetime(column.to_pandas(), errors='coerce', dayfirst=dayfirst)
+        return table.filter(pa.array(cls.period_mask(dates, start_date, end_date).to_numpy()))
+
     def validate(self, data: pd.DataFrame) -> bool:
         if data.empty:
             raise ValueError("Les données sont vides.")
@@ -0,0 +1,208 @@
+"""
+Cache de conversion colonne pour les fichiers importés (CSV, Excel).
+"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from .base import BaseConnector
+from .compression import detect_compression
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # dépendance optionnelle
+    pa = feather = None
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+# Au-delà, la source n'est pas convertie : le connecteur la lit par blocs, période filtrée
+DEFAULT_MAX_SOURCE_BYTES = 256 * 1024 * 1024
+# Facteur appliqué à la taille d'un fichier compressé pour estimer son contenu
+_COMPRESSION_RATIO = 5
+_HASH_BLOCK = 1024 * 1024
+# Options de période : appliquées après lecture du cache, hors de la clé
+_PERIOD_OPTIONS = ('start_date', 'end_date', 'date_column', 'dayfirst')
+
+# Empreintes déjà calculées, par (chemin, taille, mtime)
+_digests: Dict[Tuple[str, int, int], str] = {}
+_digests_lock = threading.Lock()
+
+
+def file_digest(path) -> str:
+    """SHA-256 du contenu d'un fichier, mémorisé tant que taille et mtime sont inchangés."""
+    stat = os.stat(path)
+    key = (str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns)
+    digest = _digests.get(key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK), b''):
+                sha.update(block)
+        digest = sha.hexdigest()
+        with _digests_lock:
+            _digests[key] = digest
+    return digest
+
+
+def estimated_size(path) -> int:
+    """Taille décompressée estimée d'un fichier local (compressé : taille × ratio moyen)."""
+    size = os.path.getsize(path)
+    if detect_compression(path) is not None:
+        size *= _COMPRESSION_RATIO
+    return size
+
+
+class CachedConnector(BaseConnector):
+    """
+    Enveloppe un connecteur fichier : la première lecture convertit le résultat
+    en fichier Arrow IPC non compressé, les suivantes le projettent en mémoire
+    (memory_map) au lieu de réanalyser le texte.
+
+    La clé combine l'empreinte du contenu, le type de connecteur et les options
+    de lecture. La conversion porte sur le fichier entier : ce coût unique
+    (lecture complète, sans filtre de période) est voulu, une seule conversion
+    sert ensuite toutes les périodes. La période est filtrée dans Arrow, sur la
+    table projetée en mémoire, avant conversion en DataFrame.
+
+    Les sources de plus de max_source_bytes (taille estimée du contenu pour un
+    fichier compressé) ne sont pas converties : le connecteur les lit par blocs
+    avec le filtre de période, en mémoire bornée. Au-delà de max_bytes, les
+    conversions les moins récemment utilisées (mtime rafraîchi à chaque accès)
+    sont supprimées.
+    """
+
+    supports_period_filter = True
+
+    def __init__(
+        self,
+        connector: BaseConnector,
+        cache_dir,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_source_bytes: int = DEFAULT_MAX_SOURCE_BYTES
+    ):
+        self.connector = connector
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_source_bytes = max_source_bytes
+        self._lock = threading.Lock()
+
+    @property
+    def supports_multi_file(self) -> bool:
+        return self.connector.supports_multi_file
+
+    def cache_key(self, path, options: Dict[str, Any]) -> Optional[str]:
+        """Clé de cache, ou None si les options ne sont pas sérialisables (ex. fonctions)."""
+        if any(callable(value) for value in options.values()):
+            return None
+        try:
+            payload = json.dumps(
+                [file_digest(path), type(self.connector).__name__, sorted(options.items())],
+                default=repr
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _cacheable(self, path) -> bool:
+        """Vrai si la source est un fichier local assez petit pour être converti en entier."""
+        if feather is None or not isinstance(path, (str, os.PathLike)) or not os.path.isfile(path):
+            return False
+        try:
+            return estimated_size(path) <= self.max_source_bytes
+        except RuntimeError:
+            return False
+
+    def read(self, source: Any, **kwargs) -> pd.DataFrame:
+        path, source_start, source_end = self.resolve_source(source)
+        start_date = kwargs.get('start_date', source_start)
+        end_date = kwargs.get('end_date', source_end)
+        date_column = kwargs.get('date_column')
+        filter_period = date_column is not None and (start_date is not None or end_date is not None)
+        options = {k: v for k, v in kwargs.items() if k not in _PERIOD_OPTIONS}
+        usecols = options.get('usecols')
+        if filter_period and usecols is not None and date_column not in usecols:
+            # La colonne de date est lue pour filtrer, puis retirée
+            options['usecols'] = list(usecols) + [date_column]
+
+        key = self.cache_key(path, options) if self._cacheable(path) else None
+        if key is None:
+            # Source volumineuse ou options non sérialisables : lecture par blocs, période filtrée
+            return self.connector.read(source, **kwargs)
+
+        target = self.cache_dir / f"{key}.arrow"
+        table = self._load(target)
+        if table is None:
+            # Conversion unique du fichier entier (voir docstring de la classe)
+            df = self.connector.read(path, **options)
+            if not isinstance(df, pd.DataFrame):
+                # Plusieurs feuilles Excel : pas de mise en cache
+                return self.connector.read(source, **kwargs)
+            self._store(target, df)
+            table = self._load(target)
+            if table is None:
+                # Conversion Arrow impossible (types mixtes) : filtre appliqué au DataFrame lu
+                if filter_period and date_column in df.columns:
+                    dates = pd.to_datetime(df[date_column], errors='coerce', dayfirst=kwargs.get('dayfirst', False))
+                    df = df[BaseConnector.period_mask(dates, start_date, end_date)].reset_index(drop=True)
+                    if usecols is not None and date_column not in usecols:
+                        df = df[list(usecols)]
+                return self._finish(df)
+
+        if filter_period and date_column in table.column_names:
+            table = self.filter_arrow_table(table, date_column, start_date, end_date, kwargs.get('dayfirst', False))
+            if usecols is not None and date_column not in usecols:
+                table = table.select(list(usecols))
+        return self._finish(table.to_pandas())
+
+    @staticmethod
+    def _finish(df: pd.DataFrame) -> pd.DataFrame:
+        if df.empty:
+            raise RuntimeError("Erreur de lecture : Les données sont vides.")
+        return df
+
+    def _load(self, target: Path):
+        """Table Arrow projetée en mémoire (rien n'est copié avant le filtre), ou None."""
+        try:
+            table = feather.read_table(target, memory_map=True)
+        except (FileNotFoundError, pa.ArrowInvalid, OSError):
+            return None
+        os.utime(target)
+        return table
+
+    def _store(self, target: Path, df: pd.DataFrame) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            # Non compressé : lecture directe depuis la projection mémoire
+            feather.write_feather(df.reset_index(drop=True), tmp, compression='uncompressed')
+            os.replace(tmp, target)
+        except (TypeError, ValueError, pa.ArrowException):
+            # Colonnes non convertibles (types mixtes) : lecture non mise en cache
+            tmp.unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        """Supprime les conversions les moins récemment utilisées au-delà de max_bytes."""
+        with self._lock:
+            files = []
+            for path in self.cache_dir.glob('*.arrow'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+    def write(self, data: pd.DataFrame, destination: Any, **kwargs):
+        return self.connector.write(data, destination, **kwargs)
@@ -0,0 +1,35 @@
+"""
+Détection de la compression d'un fichier par ses premiers octets.
+"""
+import importlib.util
+import os
+from typing import Optional
+
+# Signatures (magic bytes) -> nom de compression compris par pandas
+MAGIC_NUMBERS = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+)
+# Extensions de fichiers compressés acceptées à l'import
+COMPRESSED_EXTENSIONS = ('gz', 'bz2', 'xz', 'zst')
+
+
+def detect_compression(path) -> Optional[str]:
+    """
+    Compression d'un fichier ('gzip', 'bz2', 'xz', 'zstd') ou None s'il n'est pas compressé.
+
+    Le contenu fait foi, pas l'extension : un fichier importé est stocké sous
+    le nom de son empreinte.
+    """
+    if not isinstance(path, (str, os.PathLike)) or not os.path.isfile(path):
+        return None
+    with open(path, 'rb') as f:
+        head = f.read(6)
+    for magic, name in MAGIC_NUMBERS:
+        if head.startswith(magic):
+            if name == 'zstd' and importlib.util.find_spec('zstandard') is None:
+                raise RuntimeError("Fichier compressé en zstd : installez zstandard (pip install zstandard).")
+            return name
+    return None
@@ -1,17 +1,203 @@
+import glob
+import os
+import pickle
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
 import pandas as pd
+from ..data.loader import parse_pool
 from .base import BaseConnector
+from .compression import COMPRESSED_EXTENSIONS, detect_compression
+
+# Nombre de lignes par bloc en lecture streaming
+DEFAULT_CHUNKSIZE = 100_000
+
+# Extensions reconnues dans un dossier de fichiers CSV
+CSV_SUFFIXES = tuple(f"{ext}{comp}" for ext in ('.csv', '.txt') for comp in ('', *(f".{c}" for c in COMPRESSED_EXTENSIONS)))
+
+# Date dans un nom de fichier : 2026-01-31, 2026_01_31 ou 20260131
+_FILENAME_DATE = re.compile(r'(?<!\d)(\d{4})[-_]?(\d{2})[-_]?(\d{2})(?!\d)')
+
+def is_multi_source(path) -> bool:
+    """Vrai si la source désigne plusieurs fichiers (dossier ou motif glob)."""
+    return isinstance(path, (str, os.PathLike)) and (
+        os.path.isdir(path) or glob.has_magic(str(path))
+    )
+
+def filename_date(path) -> Optional[datetime]:
+    """Date présente dans le nom du fichier, ou None."""
+    for match in _FILENAME_DATE.finditer(Path(path).stem):
+        try:
+            return datetime(*(int(part) for part in match.groups()))
+        except ValueError:
+            continue
+    return None
+
+def _parse_file(path, options: dict, transform: Optional[Callable]) -> pd.DataFrame:
+    """Lit un fichier du lot (fonction de module pour le pool de processus)."""
+    df = CSVConnector()._read_file(path, **options)
+    if transform is not None and not df.empty:
+        df = transform(df)
+    return df
+
+def _picklable(*objects) -> bool:
+    """Vrai si les objets peuvent être transmis au pool de processus (pas de lambda)."""
+    try:
+        pickle.dumps(objects)
+        return True
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
 
 class CSVConnector(BaseConnector):
     """Connecteur pour fichiers CSV."""
 
-    def read(self, file_path: str, encoding: str = 'utf-8', sep: str = ',', **kwargs) -> pd.DataFrame:
+    supports_period_filter = True
+    supports_multi_file = True
+
+    def read(
+        self,
+        file_path,
+        encoding: str = 'utf-8',
+        sep: str = ',',
+        chunksize: Optional[int] = None,
+        date_column: Optional[str] = None,
+        start_date=None,
+        end_date=None,
+        dayfirst: bool = False,
+        usecols: Optional[List[str]] = None,
+        aggregate: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+        combine: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+        transform: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> pd.DataFrame:
+        """
+        Lit un fichier CSV, ou un lot de fichiers (dossier ou motif glob).
+
+        file_path peut être un chemin ou un dictionnaire {'path', 'start_date', 'end_date'}.
+        Si chunksize est fourni, ou si une période est demandée sur date_column, le
+        fichier est lu par blocs : filtre de période, projection (usecols) et
+        agrégation partielle (aggregate) sont appliqués à chaque bloc, ce qui borne
+        la mémoire. combine permet de réduire les agrégats partiels concaténés.
+
+        Les fichiers compressés (gzip, bz2, xz, zstd) sont reconnus à leurs premiers
+        octets, décompressés à la volée et toujours lus par blocs : ni le contenu
+        décompressé ni le fichier entier ne sont écrits sur disque ou gardés en mémoire.
+
+        Pour un lot, les fichiers dont le nom porte une date hors période sont
+        ignorés, les autres sont analysés en parallèle dans le pool de processus
+        partagé (parse_pool ; max_workers=1 : séquentiel) puis concaténés par date de fichier ;
+        transform (ex. sector.transform) est alors appliqué dans chaque processus.
+        """
         try:
-            df = pd.read_csv(file_path, encoding=encoding, sep=sep, **kwargs)
+            file_path, source_start, source_end = self.resolve_source(file_path)
+            start_date = start_date if start_date is not None else source_start
+            end_date = end_date if end_date is not None else source_end
+            options = dict(
+                encoding=encoding, sep=sep, chunksize=chunksize, date_column=date_column,
+                start_date=start_date, end_date=end_date, dayfirst=dayfirst, usecols=usecols,
+                aggregate=aggregate, **kwargs
+            )
+
+            if is_multi_source(file_path):
+                df = self._read_many(file_path, options, transform, max_workers)
+            else:
+                df = self._read_file(file_path, **options)
+                if transform is not None:
+                    df = transform(df)
+            if combine is not None:
+                df = combine(df)
             self.validate(df)
             return df
         except Exception as e:
             raise RuntimeError(f"Erreur de lecture CSV : {e}")
 
+    def _read_file(
+        self, file_path, encoding='utf-8', sep=',', chunksize=None, date_column=None, start_date=None,
+        end_date=None, dayfirst=False, usecols=None, aggregate=None, **kwargs
+    ) -> pd.DataFrame:
+        """Lecture d'un fichier, directe ou par blocs selon les options."""
+        filter_period = date_column is not None and (start_date is not None or end_date is not None)
+        if kwargs.get('compression', 'infer') == 'infer':
+            compression = detect_compression(file_path)
+            if compression is not None:
+                kwargs['compression'] = compression
+                chunksize = chunksize or DEFAULT_CHUNKSIZE
+        if chunksize is None and not filter_period and aggregate is None:
+            return pd.read_csv(file_path, encoding=encoding, sep=sep, usecols=usecols, **kwargs)
+        return self._read_chunked(
+            file_path, encoding, sep, chunksize or DEFAULT_CHUNKSIZE,
+            date_column if filter_period else None, start_date, end_date, dayfirst,
+            usecols, aggregate, **kwargs
+        )
+
+    @staticmethod
+    def list_files(pattern, start_date=None, end_date=None) -> List[str]:
+        """
+        Fichiers d'un lot triés par date de nom de fichier (puis par nom), sans
+        ceux dont la date est hors période ; les fichiers non datés sont conservés.
+        """
+        if os.path.isdir(pattern):
+            paths = [str(p) for p in Path(pattern).iterdir() if p.is_file() and p.name.lower().endswith(CSV_SUFFIXES)]
+        else:
+            paths = [p for p in glob.glob(str(pattern), recursive=True) if os.path.isfile(p)]
+        start = pd.Timestamp(start_date).normalize() if start_date is not None else None
+        end = pd.Timestamp(end_date) if end_date is not None else None
+
+        dated = []
+        for path in paths:
+            day = filename_date(path)
+            if day is not None and ((start is not None and day < start) or (end is not None and day > end)):
+                continue
+            dated.append((day or datetime.max, os.path.basename(path), path))
+        return [path for _, _, path in sorted(dated)]
+
+    def _read_many(self, pattern, options: dict, transform, max_workers: Optional[int]) -> pd.DataFrame:
+        """Analyse un lot de fichiers en parallèle et concatène dans l'ordre des dates."""
+        paths = self.list_files(pattern, options['start_date'], options['end_date'])
+        if not paths:
+            return pd.DataFrame()
+        if len(paths) == 1 or max_workers == 1 or not _picklable(options, transform):
+            frames = [_parse_file(path, options, transform) for path in paths]
+        else:
+            # Pool partagé, lancé par spawn : ni création par lecture, ni fork du serveur.
+            # map() conserve l'ordre des fichiers
+            frames = list(parse_pool().map(_parse_file, paths, [options] * len(paths), [transform] * len(paths)))
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=options['aggregate'] is None)
+
+    def _read_chunked(
+        self, file_path, encoding, sep, chunksize, date_column, start_date, end_date,
+        dayfirst, usecols, aggregate, **kwargs
+    ) -> pd.DataFrame:
+        """Lecture par blocs avec filtre de période et agrégation partielle."""
+        read_cols = usecols
+        if usecols is not None and date_column is not None and date_column not in usecols:
+            read_cols = list(usecols) + [date_column]
+
+        parts = []
+        columns = None
+        for chunk in pd.read_csv(file_path, encoding=encoding, sep=sep, usecols=read_cols,
+                                 chunksize=chunksize, **kwargs):
+            if date_column is not None:
+                dates = pd.to_datetime(chunk[date_column], errors='coerce', dayfirst=dayfirst)
+                chunk = chunk[self.period_mask(dates, start_date, end_date)]
+            if usecols is not None and read_cols is not usecols:
+                chunk = chunk[list(usecols)]
+            if aggregate is not None:
+                chunk = aggregate(chunk)
+            if columns is None:
+                columns = chunk.columns
+            if not chunk.empty:
+                parts.append(chunk)
+
+        if not parts:
+            return pd.DataFrame(columns=columns if columns is not None else [])
+        return pd.concat(parts, ignore_index=aggregate is None)
+
     def write(self, data: pd.DataFrame, file_path: str, encoding: str = 'utf-8', sep: str = ',', **kwargs):
         try:
             data.to_csv(file_path, encoding=encoding, sep=sep, index=False, **kwargs)
@@ -1,12 +1,140 @@
+import importlib.util
+from typing import Iterator, List, Optional, Union
 import pandas as pd
+from ..data.loader import parse_pool
 from .base import BaseConnector
 
+def _fast_engine() -> Optional[str]:
+    """Moteur de lecture rapide disponible (calamine, écrit en Rust), sinon None."""
+    if importlib.util.find_spec('python_calamine') is not None:
+        return 'calamine'
+    return None
+
+# Lignes converties en DataFrame à la fois en mode 'stream'
+STREAM_CHUNK_ROWS = 50_000
+
+def _stream_chunks(
+    file_path,
+    sheet_name,
+    usecols: Optional[List[str]] = None,
+    dtype: Optional[dict] = None,
+    chunk_rows: int = STREAM_CHUNK_ROWS
+) -> Iterator[pd.DataFrame]:
+    """
+    Lecture en flux d'une feuille avec openpyxl en mode read_only : les lignes
+    sont itérées sans charger le classeur en mémoire, seules les colonnes
+    demandées sont conservées. Produit des DataFrames de chunk_rows lignes au
+    plus, déjà typés (types natifs d'openpyxl, puis dtype explicite éventuel) :
+    seul un bloc de lignes est gardé en objets Python.
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        if isinstance(sheet_name, int):
+            sheet = workbook.worksheets[sheet_name]
+        else:
+            sheet = workbook[sheet_name]
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        header = [str(h) if h is not None else f"Unnamed: {i}" for i, h in enumerate(header)]
+        keep = [i for i, name in enumerate(header) if usecols is None or name in usecols]
+        names = [header[i] for i in keep]
+        block: List[tuple] = []
+        produced = False
+        for row in rows:
+            if row is None or all(value is None for value in row):
+                continue
+            block.append(tuple(row[i] if i < len(row) else None for i in keep))
+            if len(block) >= chunk_rows:
+                yield _typed_chunk(block, names, dtype)
+                block, produced = [], True
+        if block or not produced:
+            yield _typed_chunk(block, names, dtype)
+    finally:
+        workbook.close()
+
+def _typed_chunk(rows: List[tuple], names: List[str], dtype: Optional[dict]) -> pd.DataFrame:
+    df = pd.DataFrame.from_records(rows, columns=names).infer_objects()
+    if dtype:
+        df = df.astype({name: kind for name, kind in dtype.items() if name in df.columns})
+    return df
+
+def _stream_sheet(
+    file_path,
+    sheet_name,
+    usecols: Optional[List[str]] = None,
+    dtype: Optional[dict] = None,
+    chunk_rows: int = STREAM_CHUNK_ROWS
+) -> pd.DataFrame:
+    """Feuille entière lue en flux (voir _stream_chunks), blocs typés concaténés."""
+    chunks = list(_stream_chunks(file_path, sheet_name, usecols=usecols, dtype=dtype, chunk_rows=chunk_rows))
+    if not chunks:
+        return pd.DataFrame()
+    return pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+def _read_sheet(
+    file_path, sheet_name, mode: str, engine: Optional[str], usecols, dtype, kwargs, chunk_rows: int = STREAM_CHUNK_ROWS
+) -> pd.DataFrame:
+    """Lit une feuille (fonction de module pour le pool de processus)."""
+    if mode == 'stream':
+        return _stream_sheet(file_path, sheet_name, usecols=usecols, dtype=dtype, chunk_rows=chunk_rows)
+    return pd.read_excel(file_path, sheet_name=sheet_name, engine=engine, usecols=usecols, dtype=dtype, **kwargs)
+
 class ExcelConnector(BaseConnector):
     """Connecteur pour fichiers Excel."""
 
-    def read(self, file_path: str, sheet_name: str = 0, **kwargs) -> pd.DataFrame:
+    def read(
+        self,
+        file_path,
+        sheet_name: Union[str, int, List[Union[str, int]]] = 0,
+        mode: str = 'default',
+        engine: Optional[str] = None,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[dict] = None,
+        max_workers: Optional[int] = None,
+        chunk_rows: int = STREAM_CHUNK_ROWS,
+        **kwargs
+    ):
+        """
+        Lit un classeur Excel.
+
+        Args:
+            file_path: Chemin ou dictionnaire {'path', ...}.
+            sheet_name: Feuille, ou liste de feuilles lues en parallèle (retourne un dict).
+            mode: 'default' (pandas, moteur rapide si installé) ou 'stream'
+                  (openpyxl read_only, lignes converties par blocs de chunk_rows).
+            engine: Moteur pandas explicite ; par défaut calamine s'il est installé.
+            max_workers: 1 pour lire les feuilles en séquence ; sinon pool de processus partagé.
+            chunk_rows: Taille des blocs en mode 'stream'.
+        """
         try:
-            df = pd.read_excel(file_path, sheet_name=sheet_name, **kwargs)
+            file_path, _, _ = self.resolve_source(file_path)
+            if mode not in ('default', 'stream'):
+                raise ValueError(f"Mode de lecture Excel inconnu : {mode}")
+            if mode == 'default' and engine is None:
+                engine = _fast_engine()
+
+            if isinstance(sheet_name, (list, tuple)):
+                if len(sheet_name) > 1 and max_workers != 1:
+                    # Pool partagé, lancé par spawn (voir parse_pool)
+                    futures = {
+                        sheet: parse_pool().submit(_read_sheet, file_path, sheet, mode, engine, usecols, dtype, kwargs, chunk_rows)
+                        for sheet in sheet_name
+                    }
+                    sheets = {sheet: future.result() for sheet, future in futures.items()}
+                else:
+                    sheets = {
+                        sheet: _read_sheet(file_path, sheet, mode, engine, usecols, dtype, kwargs, chunk_rows)
+                        for sheet in sheet_name
+                    }
+                for df in sheets.values():
+                    self.validate(df)
+                return sheets
+
+            df = _read_sheet(file_path, sheet_name, mode, engine, usecols, dtype, kwargs, chunk_rows)
             self.validate(df)
             return df
         except Exception as e:
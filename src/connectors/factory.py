@@ -1,16 +1,31 @@
-from .excel import ExcelConnector
-from .csv import CSVConnector
-from .api import APIConnector
+from ..utils.registry import PluginRegistry
+
+# Implémentations internes, importées à la première utilisation
+connectors = PluginRegistry(
+    'opsgain.connectors',
+    {
+        'excel': '.excel:ExcelConnector',
+        'csv': '.csv:CSVConnector',
+        'api': '.api:APIConnector',
+        'parquet': '.parquet:ParquetConnector',
+        'sql': '.sql:SQLConnector',
+    },
+    package=__package__,
+    unknown_message="Type de connecteur inconnu : {}"
+)
 
 class ConnectorFactory:
     @staticmethod
     def get_connector(connector_type: str, **kwargs):
-        connector_type = connector_type.lower()
-        if connector_type == 'excel':
-            return ExcelConnector()
-        elif connector_type == 'csv':
-            return CSVConnector()
-        elif connector_type == 'api':
-            return APIConnector()
-        else:
-            raise ValueError(f"Type de connecteur inconnu : {connector_type}")
\ No newline at end of file
+        """Connecteur partagé pour ce type et cette configuration."""
+        return connectors.get(connector_type, **kwargs)
+
+    @staticmethod
+    def create_connector(connector_type: str, **kwargs):
+        """Nouveau connecteur, propre à l'appelant (hors cache du registre)."""
+        return connectors.create(connector_type, **kwargs)
+
+    @staticmethod
+    def register(connector_type: str, target):
+        """Déclare un connecteur ('module:Classe' ou classe)."""
+        connectors.register(connector_type, target)
\ No newline at end of file
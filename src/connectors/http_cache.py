@@ -0,0 +1,221 @@
+"""
+Cache disque des réponses HTTP (requêtes conditionnelles ETag / Last-Modified).
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (format Arrow IPC / Feather)
+except ImportError:  # dépendance optionnelle
+    pyarrow = None
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Extensions des fichiers de données du cache (comptés pour la limite de taille)
+DATA_SUFFIXES = ('.arrow', '.pkl')
+
+# En-têtes de requête sans effet sur le contenu : exclus de la clé
+_NEUTRAL_HEADERS = {'accept-encoding', 'if-none-match', 'if-modified-since', 'user-agent', 'connection'}
+
+# Un verrou par dossier, partagé par toutes les instances du processus
+_directory_locks: Dict[Path, threading.Lock] = {}
+_directory_locks_guard = threading.Lock()
+
+
+def _directory_lock(directory: Path) -> threading.Lock:
+    with _directory_locks_guard:
+        return _directory_locks.setdefault(directory.resolve(), threading.Lock())
+
+
+def _credentials(auth) -> str:
+    """Représentation stable d'identifiants (tuple, objet requests.auth, cookies)."""
+    if isinstance(auth, (tuple, list)):
+        return repr([_credentials(item) for item in auth])
+    if auth is None or isinstance(auth, (str, dict)):
+        return repr(sorted(auth.items()) if isinstance(auth, dict) else auth)
+    if hasattr(auth, '__dict__'):
+        return repr((type(auth).__name__, sorted((k, repr(v)) for k, v in vars(auth).items())))
+    return repr(auth)
+
+
+class ResponseCache:
+    """
+    Conserve, pour chaque requête, les validateurs HTTP et le DataFrame déjà
+    analysé (Arrow IPC, pickle si pyarrow est absent ou le frame non sérialisable).
+
+    L'index est un petit fichier JSON, relu avant chaque opération et réécrit
+    sous un verrou propre au dossier : plusieurs connecteurs (ou processus)
+    partagent ainsi les mêmes entrées. La limite max_bytes est appliquée aux
+    fichiers présents dans le dossier, y compris ceux absents de l'index ;
+    au-delà, les moins récemment utilisés sont supprimés.
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, directory, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = _directory_lock(self.directory)
+        self._index: Dict[str, Dict] = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.directory / self.INDEX_FILE, encoding='utf-8') as f:
+                index = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        # Entrées dont le fichier a disparu : ignorées
+        return {key: entry for key, entry in index.items() if (self.directory / entry['file']).exists()}
+
+    def _save_index(self) -> None:
+        tmp = self.directory / f"{self.INDEX_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(tmp, self.directory / self.INDEX_FILE)
+
+    @staticmethod
+    def key(
+        url: str,
+        params: Optional[dict] = None,
+        json_path: Optional[str] = None,
+        headers: Optional[dict] = None,
+        auth=None
+    ) -> str:
+        """
+        Clé d'une requête GET : URL, paramètres triés, chemin JSON, en-têtes
+        (Authorization, clé d'API...) et identifiants. Ils ne figurent dans la
+        clé que hachés ; deux utilisateurs ne partagent donc jamais une réponse.
+        """
+        relevant = sorted(
+            (name.lower(), str(value)) for name, value in (headers or {}).items()
+            if name.lower() not in _NEUTRAL_HEADERS
+        )
+        payload = json.dumps([url, sorted((params or {}).items()), json_path, relevant, _credentials(auth)], default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def validators(self, key: str) -> Dict[str, str]:
+        """En-têtes conditionnels (If-None-Match / If-Modified-Since) pour une entrée connue."""
+        with self._lock:
+            self._index = self._load_index()
+            entry = self._index.get(key)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def load(self, key: str) -> Optional[pd.DataFrame]:
+        """DataFrame en cache, ou None si l'entrée est absente ou illisible."""
+        with self._lock:
+            self._index = self._load_index()
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            path = self.directory / entry['file']
+            try:
+                df = pd.read_feather(path) if entry['format'] == 'feather' else pd.read_pickle(path)
+            except (OSError, ValueError):
+                self._remove(key)
+                self._save_index()
+                return None
+            entry['last_access'] = time.time()
+            self._save_index()
+            return df
+
+    def store(self, key: str, df: pd.DataFrame, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Enregistre un DataFrame et ses validateurs puis applique la limite de taille."""
+        if not etag and not last_modified:
+            return
+        with self._lock:
+            self._index = self._load_index()
+            self._remove(key)
+            fmt, path = 'pickle', self.directory / f"{key}.pkl"
+            if pyarrow is not None:
+                try:
+                    path = self.directory / f"{key}.arrow"
+                    df.reset_index(drop=True).to_feather(path)
+                    fmt = 'feather'
+                except (TypeError, ValueError, pyarrow.ArrowException):
+                    path.unlink(missing_ok=True)
+                    path = self.directory / f"{key}.pkl"
+            if fmt == 'pickle':
+                df.to_pickle(path)
+            self._index[key] = {
+                'file': path.name,
+                'format': fmt,
+                'etag': etag,
+                'last_modified': last_modified,
+                'size': path.stat().st_size,
+                'last_access': time.time()
+            }
+            self._evict()
+            self._save_index()
+
+    def _data_files(self) -> Dict[Path, int]:
+        """Fichiers de données présents dans le dossier et leur taille."""
+        files = {}
+        for path in self.directory.iterdir():
+            if path.suffix in DATA_SUFFIXES:
+                try:
+                    files[path] = path.stat().st_size
+                except FileNotFoundError:
+                    continue
+        return files
+
+    @property
+    def total_bytes(self) -> int:
+        """Taille des fichiers de données du dossier (indexés ou non)."""
+        return sum(self._data_files().values())
+
+    def _remove(self, key: str) -> None:
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            (self.directory / entry['file']).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """
+        Supprime les fichiers les moins récemment utilisés au-delà de max_bytes
+        (dernier accès de l'index, date de modification pour les fichiers orphelins).
+        """
+        files = self._data_files()
+        total = sum(files.values())
+        if total <= self.max_bytes:
+            return
+        keys = {entry['file']: key for key, entry in self._index.items()}
+
+        def last_access(path: Path) -> float:
+            key = keys.get(path.name)
+            if key is not None:
+                return self._index[key]['last_access']
+            try:
+                return path.stat().st_mtime
+            except FileNotFoundError:
+                return 0.0
+
+        for path in sorted(files, key=last_access):
+            if total <= self.max_bytes:
+                break
+            total -= files[path]
+            key = keys.get(path.name)
+            if key is not None:
+                self._remove(key)
+            else:
+                path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._index = {}
+            for path in self._data_files():
+                path.unlink(missing_ok=True)
+            self._save_index()
@@ -0,0 +1,116 @@
+from datetime import date, datetime
+from typing import List, Optional
+import pandas as pd
+from .base import BaseConnector
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # dépendance optionnelle
+    pa = pq = None
+
+class ParquetConnector(BaseConnector):
+    """
+    Connecteur pour fichiers Parquet (format colonne).
+
+    Ne lit que les colonnes demandées et saute les row groups hors période
+    grâce aux statistiques min/max du fichier.
+    """
+
+    supports_period_filter = True
+
+    def read(
+        self,
+        file_path,
+        columns: Optional[List[str]] = None,
+        date_column: Optional[str] = None,
+        start_date=None,
+        end_date=None,
+        dtype_backend: str = 'numpy',
+        usecols: Optional[List[str]] = None,
+        **kwargs
+    ) -> pd.DataFrame:
+        """
+        Lit un fichier Parquet.
+
+        Args:
+            file_path: Chemin ou dictionnaire {'path', 'start_date', 'end_date'}.
+            columns: Colonnes à lire (projection) ; usecols est accepté comme alias.
+            date_column: Colonne temporelle utilisée pour le filtre de période.
+            dtype_backend: 'numpy' (défaut) ou 'pyarrow' pour des colonnes Arrow.
+        """
+        if pq is None:
+            raise RuntimeError("Le connecteur Parquet nécessite pyarrow (pip install pyarrow).")
+        try:
+            file_path, source_start, source_end = self.resolve_source(file_path)
+            start_date = start_date if start_date is not None else source_start
+            end_date = end_date if end_date is not None else source_end
+            columns = columns or usecols
+            filter_period = date_column is not None and (start_date is not None or end_date is not None)
+
+            parquet_file = pq.ParquetFile(file_path)
+            read_columns = columns
+            if columns is not None and filter_period and date_column not in columns:
+                read_columns = list(columns) + [date_column]
+
+            row_groups = list(range(parquet_file.num_row_groups))
+            if filter_period:
+                row_groups = self._overlapping_row_groups(parquet_file, date_column, start_date, end_date)
+            table = parquet_file.read_row_groups(row_groups, columns=read_columns) if row_groups else \
+                parquet_file.schema_arrow.empty_table().select(read_columns or parquet_file.schema_arrow.names)
+
+            if filter_period:
+                table = self.filter_arrow_table(table, date_column, start_date, end_date)
+                if columns is not None and read_columns is not columns:
+                    table = table.select(columns)
+
+            if dtype_backend == 'pyarrow':
+                df = table.to_pandas(types_mapper=pd.ArrowDtype)
+            else:
+                df = table.to_pandas()
+            self.validate(df)
+            return df
+        except Exception as e:
+            raise RuntimeError(f"Erreur de lecture Parquet : {e}")
+
+    @classmethod
+    def _overlapping_row_groups(cls, parquet_file, date_column: str, start_date, end_date) -> List[int]:
+        """Index des row groups dont l'intervalle [min, max] recoupe la période."""
+        field = parquet_file.schema_arrow.field(date_column)
+        tz = getattr(field.type, 'tz', None)
+        date_only = pa.types.is_date(field.type)
+        start = cls.period_bound(start_date, tz, date_only) if start_date is not None else None
+        end = cls.period_bound(end_date, tz, date_only) if end_date is not None else None
+        metadata = parquet_file.metadata
+
+        kept = []
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            stats = next(
+                (row_group.column(j).statistics for j in range(row_group.num_columns)
+                 if row_group.column(j).path_in_schema == date_column),
+                None
+            )
+            # Sans statistiques temporelles exploitables, le row group est conservé
+            if stats is None or not stats.has_min_max or not isinstance(stats.min, (datetime, date, str)):
+                kept.append(i)
+                continue
+            try:
+                # Statistiques d'une colonne avec fuseau : instants UTC, convertis dans ce fuseau
+                group_min, group_max = (cls.period_bound(value, tz, date_only) for value in (stats.min, stats.max))
+            except (TypeError, ValueError):
+                kept.append(i)
+                continue
+            if (end is not None and group_min > end) or (start is not None and group_max < start):
+                continue
+            kept.append(i)
+        return kept
+
+    def write(self, data: pd.DataFrame, file_path: str, row_group_size: int = 100_000, **kwargs):
+        if pq is None:
+            raise RuntimeError("Le connecteur Parquet nécessite pyarrow (pip install pyarrow).")
+        try:
+            table = pa.Table.from_pandas(data, preserve_index=False)
+            pq.write_table(table, file_path, row_group_size=row_group_size, **kwargs)
+        except Exception as e:
+            raise RuntimeError(f"Erreur d'écriture Parquet : {e}")
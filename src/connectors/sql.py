@@ -0,0 +1,238 @@
+import queue
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import pandas as pd
+from .base import BaseConnector
+
+DEFAULT_POOL_SIZE = 5
+
+# Identifiant SQL simple (table, colonne, éventuellement préfixé par un schéma)
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$')
+# Fonctions d'agrégation et de regroupement autorisées dans les déclarations des secteurs
+AGGREGATE_FUNCTIONS = {'count': 'COUNT', 'sum': 'SUM', 'avg': 'AVG', 'min': 'MIN', 'max': 'MAX'}
+GROUP_FUNCTIONS = {None: '{}', 'date': 'DATE({})'}
+
+
+def quote_identifier(name: str) -> str:
+    """Valide puis cite un identifiant (les identifiants ne peuvent pas être paramétrés)."""
+    if not isinstance(name, str) or not _IDENTIFIER.match(name):
+        raise ValueError(f"Identifiant SQL invalide : {name!r}")
+    return '.'.join(f'"{part}"' for part in name.split('.'))
+
+
+class ConnectionPool:
+    """Pool de connexions borné, thread-safe (file d'attente de connexions ouvertes)."""
+
+    def __init__(self, connect: Callable[[], Any], size: int = DEFAULT_POOL_SIZE, timeout: float = 30):
+        self._connect = connect
+        self._pool: "queue.LifoQueue" = queue.LifoQueue(maxsize=size)
+        self._slots = threading.BoundedSemaphore(size)
+        self.timeout = timeout
+
+    @contextmanager
+    def connection(self):
+        """Emprunte une connexion (ouverte à la demande) et la rend au pool."""
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError("Aucune connexion SQL disponible dans le pool.")
+        try:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                yield conn
+            except Exception:
+                # Connexion potentiellement dans un état incohérent : fermée
+                conn.close()
+                raise
+            self._pool.put_nowait(conn)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class SQLConnector(BaseConnector):
+    """
+    Connecteur pour bases relationnelles (SQLite par défaut, tout module DB-API 2.0).
+
+    Le filtre de période et les agrégations déclarées par les secteurs sont
+    exécutés dans la base : seules les lignes utiles (ou les agrégats) sont lues.
+    """
+
+    supports_period_filter = True
+    supports_aggregation = True
+
+    def __init__(
+        self,
+        database: Optional[str] = None,
+        connect: Optional[Callable[[], Any]] = None,
+        paramstyle: str = 'qmark',
+        pool_size: int = DEFAULT_POOL_SIZE
+    ):
+        """
+        Args:
+            database: Fichier SQLite (ignoré si connect est fourni).
+            connect: Fabrique de connexions DB-API (ex. lambda: psycopg2.connect(dsn)).
+            paramstyle: 'qmark' (?) ou 'format' (%s), selon le pilote.
+            pool_size: Nombre maximal de connexions simultanées.
+        """
+        if connect is None:
+            if database is None:
+                raise ValueError("SQLConnector nécessite 'database' ou 'connect'.")
+            connect = lambda: sqlite3.connect(database, check_same_thread=False)
+        if paramstyle not in ('qmark', 'format'):
+            raise ValueError(f"Style de paramètres non supporté : {paramstyle}")
+        self.placeholder = '?' if paramstyle == 'qmark' else '%s'
+        self.pool = ConnectionPool(connect, pool_size)
+
+    @classmethod
+    def from_config(cls, **config) -> "SQLConnector":
+        """Retient les options de connexion, les autres étant des options de lecture."""
+        options = ('database', 'connect', 'paramstyle', 'pool_size')
+        return cls(**{key: config[key] for key in options if key in config})
+
+    def read(
+        self,
+        table,
+        columns: Optional[List[str]] = None,
+        date_column: Optional[str] = None,
+        start_date=None,
+        end_date=None,
+        aggregation: Optional[Dict] = None,
+        usecols: Optional[List[str]] = None,
+        **kwargs
+    ) -> pd.DataFrame:
+        """
+        Lit une table, filtrée sur la période et éventuellement agrégée dans la base.
+
+        Args:
+            table: Nom de table ou dictionnaire {'path', 'start_date', 'end_date'}.
+            columns: Colonnes lues (usecols est accepté comme alias).
+            date_column: Colonne temporelle du filtre de période.
+            aggregation: Déclaration d'agrégation d'un secteur
+                ({'group_by': {alias: colonne | (fonction, colonne)}, 'metrics': {alias: (fonction, colonne)}}).
+        """
+        try:
+            table, source_start, source_end = self.resolve_source(table)
+            start_date = start_date if start_date is not None else source_start
+            end_date = end_date if end_date is not None else source_end
+            query, params = self.build_query(
+                table, columns or usecols, date_column, start_date, end_date, aggregation
+            )
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(query, params)
+                    names = [d[0] for d in cursor.description]
+                    df = pd.DataFrame.from_records(cursor.fetchall(), columns=names)
+                finally:
+                    cursor.close()
+            self.validate(df)
+            return df
+        except Exception as e:
+            raise RuntimeError(f"Erreur de lecture SQL : {e}")
+
+    def build_query(
+        self,
+        table: str,
+        columns: Optional[List[str]] = None,
+        date_column: Optional[str] = None,
+        start_date=None,
+        end_date=None,
+        aggregation: Optional[Dict] = None
+    ) -> Tuple[str, List]:
+        """Construit la requête : identifiants validés, valeurs passées en paramètres."""
+        where, params = [], []
+        if date_column is not None:
+            # Dates passées sous forme ISO : comparables aux colonnes texte comme temporelles
+            if start_date is not None:
+                where.append(f"{quote_identifier(date_column)} >= {self.placeholder}")
+                params.append(self._lower_bound(start_date))
+            if end_date is not None:
+                operator, bound = self._upper_bound(end_date)
+                where.append(f"{quote_identifier(date_column)} {operator} {self.placeholder}")
+                params.append(bound)
+
+        group_exprs = []
+        if aggregation:
+            select = []
+            for alias, spec in aggregation.get('group_by', {}).items():
+                func, column = spec if isinstance(spec, tuple) else (None, spec)
+                if func not in GROUP_FUNCTIONS:
+                    raise ValueError(f"Regroupement non supporté : {func}")
+                expr = GROUP_FUNCTIONS[func].format(quote_identifier(column))
+                group_exprs.append(expr)
+                select.append(f"{expr} AS {quote_identifier(alias)}")
+            for alias, (func, column) in aggregation.get('metrics', {}).items():
+                if func not in AGGREGATE_FUNCTIONS:
+                    raise ValueError(f"Agrégation non supportée : {func}")
+                target = '*' if column == '*' and func == 'count' else quote_identifier(column)
+                select.append(f"{AGGREGATE_FUNCTIONS[func]}({target}) AS {quote_identifier(alias)}")
+        else:
+            select = [quote_identifier(c) for c in columns] if columns else ['*']
+
+        query = f"SELECT {', '.join(select)} FROM {quote_identifier(table)}"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        if group_exprs:
+            query += " GROUP BY " + ", ".join(group_exprs) + " ORDER BY " + ", ".join(group_exprs)
+        return query, params
+
+    @staticmethod
+    def _lower_bound(start_date) -> str:
+        """
+        Borne basse ISO. À minuit, seule la date est envoyée : une colonne texte
+        sans heure ('2026-01-10') est inférieure à '2026-01-10 00:00:00' et le
+        premier jour serait perdu, alors que '2026-01-10' précède toutes les
+        valeurs du jour, avec ou sans heure.
+        """
+        start = pd.Timestamp(start_date)
+        if start == start.normalize():
+            return start.strftime('%Y-%m-%d')
+        return start.strftime('%Y-%m-%d %H:%M:%S')
+
+    @staticmethod
+    def _upper_bound(end_date) -> Tuple[str, str]:
+        """
+        Opérateur et borne haute ISO. Une fin de journée (23:59 ou plus) devient
+        une borne exclusive sur le lendemain : '< 2026-01-11' garde tout le
+        10 janvier, que les valeurs texte soient séparées par un espace ou par
+        'T' ('2026-01-10T08:00:00' > '2026-01-10 23:59:59' en texte).
+        """
+        end = pd.Timestamp(end_date)
+        day = end.normalize()
+        if end >= day + pd.Timedelta(hours=23, minutes=59):
+            return '<', (day + pd.Timedelta(days=1)).strftime('%Y-%m-%d')
+        return '<=', end.strftime('%Y-%m-%d %H:%M:%S')
+
+    def write(self, data: pd.DataFrame, table: str, if_exists: str = 'append', **kwargs):
+        """Insère un DataFrame dans une table existante (requête paramétrée, par lots)."""
+        if if_exists not in ('append', 'replace'):
+            raise ValueError(f"Mode d'écriture non supporté : {if_exists}")
+        try:
+            columns = ', '.join(quote_identifier(c) for c in data.columns)
+            values = ', '.join([self.placeholder] * len(data.columns))
+            data = data.copy()
+            for column in data.select_dtypes(include=['datetime', 'datetimetz']).columns:
+                data[column] = data[column].dt.strftime('%Y-%m-%d %H:%M:%S')
+            rows = data.astype(object).where(data.notna(), None).itertuples(index=False, name=None)
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    if if_exists == 'replace':
+                        cursor.execute(f"DELETE FROM {quote_identifier(table)}")
+                    cursor.executemany(f"INSERT INTO {quote_identifier(table)} ({columns}) VALUES ({values})", list(rows))
+                    conn.commit()
+                finally:
+                    cursor.close()
+        except Exception as e:
+            raise RuntimeError(f"Erreur d'écriture SQL : {e}")
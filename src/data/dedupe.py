@@ -0,0 +1,153 @@
+"""
+Déduplication des enregistrements importés sur leur clé naturelle.
+"""
+import threading
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _canonical(column: pd.Series) -> pd.Series:
+    """
+    Type canonique d'une colonne de clé, pour que l'empreinte ne dépende pas
+    du type lu (5 en int64 ou 5.0 en float64, dates en s ou en ns) :
+    dates en nanosecondes et nombres entiers en Int64, le reste en texte.
+    """
+    if isinstance(column.dtype, pd.DatetimeTZDtype):
+        column = column.dt.tz_convert('UTC').dt.tz_localize(None)
+    if pd.api.types.is_datetime64_dtype(column.dtype):
+        nanoseconds = column.dt.as_unit('ns').astype('int64')
+        return nanoseconds.astype('Int64').mask(column.isna())
+    if pd.api.types.is_bool_dtype(column.dtype) or pd.api.types.is_integer_dtype(column.dtype):
+        return column.astype('Int64')
+    if pd.api.types.is_float_dtype(column.dtype):
+        values = column.to_numpy(dtype='float64', na_value=np.nan)
+        finite = np.isfinite(values)
+        if np.array_equal(finite, ~np.isnan(values)) and np.all(values[finite] == np.floor(values[finite])):
+            return column.astype('Int64')
+    return column.astype('string')
+
+
+def key_hashes(df: pd.DataFrame, keys: Sequence[str]) -> np.ndarray:
+    """Empreinte 64 bits de la clé naturelle de chaque ligne (calcul vectorisé)."""
+    missing = [key for key in keys if key not in df.columns]
+    if missing:
+        raise ValueError(f"Colonnes de clé manquantes : {', '.join(missing)}")
+    canonical = pd.DataFrame({key: _canonical(df[key]) for key in keys})
+    return pd.util.hash_pandas_object(canonical, index=False).to_numpy()
+
+
+def drop_duplicate_keys(df: pd.DataFrame, keys: Sequence[str]) -> Tuple[pd.DataFrame, int]:
+    """
+    Retire les lignes dont la clé naturelle apparaît déjà plus haut dans le lot.
+
+    Returns:
+        (données dédupliquées, nombre de doublons retirés)
+    """
+    duplicated = pd.Series(key_hashes(df, keys)).duplicated(keep='first').to_numpy()
+    count = int(duplicated.sum())
+    return (df[~duplicated] if count else df), count
+
+
+class DedupeIndex:
+    """
+    Ensemble persistant des clés déjà intégrées, réparti en fragments (shards)
+    selon les bits de poids fort de l'empreinte.
+
+    Chaque fragment est une suite de tableaux .npy triés, ouverts en mémoire
+    projetée : un test d'appartenance est une recherche dichotomique par
+    tableau, et un ajout écrit un nouveau tableau contenant les seules clés
+    nouvelles. Au-delà de max_runs tableaux, un fragment est fusionné. Le coût
+    d'un import est donc proportionnel au fichier, pas à l'historique.
+    """
+
+    def __init__(self, directory, shard_bits: int = 6, max_runs: int = 8):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.shard_bits = shard_bits
+        self.max_runs = max_runs
+        self._runs: Dict[int, List[np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def _shard_of(self, hashes: np.ndarray) -> np.ndarray:
+        return (hashes >> np.uint64(64 - self.shard_bits)).astype(np.int64)
+
+    def _shard_runs(self, shard: int) -> List[np.ndarray]:
+        runs = self._runs.get(shard)
+        if runs is None:
+            runs = [np.load(path, mmap_mode='r') for path in sorted(self.directory.glob(f"shard_{shard:03d}_*.npy"))]
+            self._runs[shard] = runs
+        return runs
+
+    def _contains(self, shard: int, hashes: np.ndarray) -> np.ndarray:
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self._shard_runs(shard):
+            if len(run) == 0:
+                continue
+            positions = np.searchsorted(run, hashes)
+            positions[positions == len(run)] = len(run) - 1
+            found |= run[positions] == hashes
+        return found
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """Masque des empreintes déjà présentes dans l'index."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        found = np.zeros(len(hashes), dtype=bool)
+        shards = self._shard_of(hashes)
+        with self._lock:
+            for shard in np.unique(shards):
+                selected = shards == shard
+                found[selected] = self._contains(int(shard), hashes[selected])
+        return found
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Ajoute des empreintes (supposées absentes de l'index)."""
+        hashes = np.unique(np.asarray(hashes, dtype=np.uint64))
+        shards = self._shard_of(hashes)
+        with self._lock:
+            for shard in np.unique(shards):
+                self._write_run(int(shard), hashes[shards == shard])
+
+    def _write_run(self, shard: int, hashes: np.ndarray) -> None:
+        runs = self._shard_runs(shard)
+        existing = sorted(self.directory.glob(f"shard_{shard:03d}_*.npy"))
+        sequence = int(existing[-1].stem.rsplit('_', 1)[1]) + 1 if existing else 0
+        if len(runs) + 1 > self.max_runs:
+            # Fusion du fragment en un seul tableau trié
+            hashes = np.unique(np.concatenate([np.asarray(run) for run in runs] + [hashes]))
+            self._runs[shard] = []
+            for path in existing:
+                path.unlink()
+        path = self.directory / f"shard_{shard:03d}_{sequence:06d}.npy"
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            np.save(f, hashes)
+        tmp.replace(path)
+        self._runs[shard].append(np.load(path, mmap_mode='r'))
+
+    def filter_new(self, df: pd.DataFrame, keys: Sequence[str], commit: bool = True) -> Tuple[pd.DataFrame, int]:
+        """
+        Ne garde que les lignes dont la clé n'a jamais été intégrée (ni plus haut dans le lot).
+
+        Args:
+            commit: Si vrai, les clés retenues sont ajoutées à l'index. Sinon,
+                appeler commit() une fois les lignes intégrées.
+
+        Returns:
+            (lignes nouvelles, nombre de lignes écartées)
+        """
+        if df.empty:
+            return df, 0
+        hashes = key_hashes(df, keys)
+        keep = ~pd.Series(hashes).duplicated(keep='first').to_numpy()
+        keep &= ~self.contains(hashes)
+        if commit and keep.any():
+            self.add(hashes[keep])
+        return df[keep], int((~keep).sum())
+
+    def commit(self, df: pd.DataFrame, keys: Sequence[str]) -> None:
+        """Enregistre les clés de lignes intégrées (retenues par filter_new(commit=False))."""
+        if not df.empty:
+            self.add(key_hashes(df, keys))
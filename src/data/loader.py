@@ -0,0 +1,62 @@
+"""
+Chargement concurrent de plusieurs tables.
+
+Les lectures (fichiers, réseau) sont lancées ensemble dans un pool de
+threads : un chargement à froid dure autant que la table la plus lente, et
+non la somme des tables. L'analyse des fichiers texte, liée au CPU, peut être
+confiée à un pool de processus partagé.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+# Pool de processus d'analyse, créé à la première utilisation et partagé
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def load_concurrently(loaders: Dict[str, Callable[[], Any]], max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Exécute les fonctions de chargement en parallèle (threads).
+
+    Args:
+        loaders: {nom de table: fonction sans argument retournant la table}.
+        max_workers: Nombre de threads (une par table par défaut ; 1 = séquentiel).
+
+    Returns:
+        {nom de table: résultat}, dans l'ordre de loaders. La première erreur
+        rencontrée dans cet ordre est propagée.
+    """
+    if len(loaders) <= 1 or max_workers == 1:
+        return {name: load() for name, load in loaders.items()}
+    with ThreadPoolExecutor(max_workers=min(len(loaders), max_workers or len(loaders))) as pool:
+        futures = {name: pool.submit(load) for name, load in loaders.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def parse_pool() -> ProcessPoolExecutor:
+    """
+    Pool de processus partagé pour l'analyse des fichiers (tous les cœurs).
+
+    Les processus sont lancés par 'spawn' : un fork du serveur, qui a déjà
+    des threads (Streamlit, chargements concurrents), pourrait hériter d'un
+    verrou tenu et se bloquer.
+    """
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1, mp_context=multiprocessing.get_context('spawn')
+            )
+        return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """Arrête le pool d'analyse (il sera recréé au besoin)."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown()
+            _parse_pool = None
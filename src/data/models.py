@@ -1,9 +1,10 @@
 """
 Modèles de données et structures.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, List, Optional
 import pandas as pd
 
 
@@ -19,6 +20,9 @@ class FinancialMetrics:
     transaction_hash: str
     period_summary: Dict[str, any]
     metrics: Dict[str, any]
+    merkle_root: str = ''
+    daily_series: Optional[pd.DataFrame] = None  # Gains par jour (date, time_gain, error_gain, ...)
+
     def to_dict(self) -> Dict:
         """Convertit en dictionnaire pour sérialisation."""
         return {
@@ -30,7 +34,12 @@ class FinancialMetrics:
             'breakdown': self.breakdown,
             'transaction_hash': self.transaction_hash,
             'period_summary': self.period_summary,
-            'metrics': self.metrics  # ← AJOUTEZ CETTE LIGNE
+            'metrics': self.metrics,  # ← AJOUTEZ CETTE LIGNE
+            'merkle_root': self.merkle_root,
+            'daily_series': (
+                self.daily_series.assign(date=self.daily_series['date'].astype(str)).to_dict(orient='records')
+                if self.daily_series is not None else []
+            )
         }
 
 
@@ -51,4 +60,66 @@ class PeriodData:
             self.daily_data.empty or 
             self.engins_data.empty or 
             self.hourly_data.empty
-        )
\ No newline at end of file
+        )
+
+
+@dataclass
+class SiteConfig:
+    """Configuration d'un site (port sec) d'un portefeuille."""
+    name: str
+    data_hash: str
+    data_dir: Optional[Path] = None  # Si renseigné, chargement depuis les fichiers du site
+    map_config: Optional[Dict] = None
+
+
+@dataclass
+class PortfolioMetrics:
+    """Métriques financières par site et consolidées."""
+    sites: Dict[str, FinancialMetrics]
+    consolidated: FinancialMetrics
+    failed_sites: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        """Convertit en dictionnaire pour sérialisation."""
+        return {
+            'sites': {name: metrics.to_dict() for name, metrics in self.sites.items()},
+            'consolidated': self.consolidated.to_dict(),
+            'failed_sites': self.failed_sites
+        }
+
+
+
+@dataclass
+class PeriodComparison:
+    """Comparaison d'une période avec la période précédente de même durée."""
+    previous_period_name: str
+    current: Dict[str, float]
+    previous: Dict[str, float]
+    deltas: Dict[str, float]
+    delta_pct: Dict[str, Optional[float]]
+
+    def has_previous(self) -> bool:
+        """Vrai si la période précédente contient des opérations."""
+        return self.previous.get('total_operations', 0) > 0
+
+
+@dataclass
+class ValidationReport:
+    """Bilan de la validation d'un import : lignes retenues et motifs de rejet."""
+    rows_read: int
+    rows_valid: int
+    reasons: Dict[str, int] = field(default_factory=dict)
+    coerced_columns: List[str] = field(default_factory=list)
+
+    @property
+    def rows_rejected(self) -> int:
+        return self.rows_read - self.rows_valid
+
+    def to_dict(self) -> Dict:
+        return {
+            'rows_read': self.rows_read,
+            'rows_valid': self.rows_valid,
+            'rows_rejected': self.rows_rejected,
+            'reasons': dict(self.reasons),
+            'coerced_columns': list(self.coerced_columns)
+        }
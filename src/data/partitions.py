@@ -0,0 +1,182 @@
+"""
+Jeu de données partitionné par date sur disque.
+
+Chaque table est découpée en fichiers Parquet par mois
+(<racine>/<table>/<année>/<mois>/part.parquet) ; un manifeste JSON garde,
+pour chaque partition, les dates min et max et le nombre de lignes. Une
+requête de période n'ouvre que les partitions qui la recoupent : l'historique
+des années passées ne coûte rien quand on consulte les derniers jours.
+Une table sans colonne temporelle est stockée en une seule partition.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .timeindex import slice_period, sort_by_time
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # dépendance optionnelle
+    pa = pq = None
+
+PART_FILE = 'part.parquet'
+UNPARTITIONED = 'all'
+
+
+class PartitionedDataset:
+    """Tables Parquet partitionnées par année/mois, décrites par un manifeste."""
+
+    MANIFEST_FILE = 'manifest.json'
+
+    def __init__(self, root):
+        if pq is None:
+            raise RuntimeError("Le stockage partitionné nécessite pyarrow (pip install pyarrow).")
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._manifest_mtime: Optional[int] = None
+        self._manifest: Dict[str, Dict] = self._load_manifest()
+
+    @classmethod
+    def is_partitioned(cls, root) -> bool:
+        """Vrai si le dossier contient un jeu partitionné (présence du manifeste)."""
+        return (Path(root) / cls.MANIFEST_FILE).is_file()
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        try:
+            self._manifest_mtime = os.stat(self.root / self.MANIFEST_FILE).st_mtime_ns
+            with open(self.root / self.MANIFEST_FILE, encoding='utf-8') as f:
+                return json.load(f).get('tables', {})
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_manifest(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / (self.MANIFEST_FILE + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'tables': self._manifest}, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.root / self.MANIFEST_FILE)
+        self._manifest_mtime = os.stat(self.root / self.MANIFEST_FILE).st_mtime_ns
+
+    def _refresh(self) -> None:
+        """Relit le manifeste s'il a été réécrit (par un autre processus, par exemple)."""
+        try:
+            mtime = os.stat(self.root / self.MANIFEST_FILE).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime != self._manifest_mtime:
+            self._manifest = self._load_manifest()
+
+    def tables(self) -> List[str]:
+        self._refresh()
+        return sorted(self._manifest)
+
+    def time_column(self, table: str) -> Optional[str]:
+        return self._table(table)['time_column']
+
+    def _table(self, table: str) -> Dict:
+        self._refresh()
+        entry = self._manifest.get(table)
+        if entry is None:
+            raise KeyError(f"Table absente du jeu partitionné : {table}")
+        return entry
+
+    def write(self, table: str, data: pd.DataFrame, time_column: Optional[str] = None, append: bool = False) -> None:
+        """
+        Écrit une table. Seuls les mois présents dans data sont réécrits :
+        leur contenu est remplacé, ou complété si append est vrai.
+        """
+        with self._lock:
+            entry = self._manifest.get(table)
+            if entry is None or entry['time_column'] != time_column:
+                entry = {'time_column': time_column, 'partitions': {}}
+            if time_column is None:
+                groups = [(UNPARTITIONED, data)]
+            else:
+                data = sort_by_time(data, time_column)
+                months = data[time_column].dt.strftime('%Y/%m')
+                groups = list(data.groupby(months, sort=True))
+
+            for key, part in groups:
+                relative = f"{table}/{key}.parquet" if key == UNPARTITIONED else f"{table}/{key}/{PART_FILE}"
+                path = self.root / relative
+                if append and key in entry['partitions'] and path.exists():
+                    part = pd.concat([pq.read_table(path).to_pandas(), part], ignore_index=True)
+                    if time_column is not None:
+                        part = sort_by_time(part, time_column)
+                entry['partitions'][key] = self._write_part(path, part, time_column)
+                entry['partitions'][key]['path'] = relative
+
+            self._manifest[table] = entry
+            self._save_manifest()
+
+    @staticmethod
+    def _write_part(path: Path, part: pd.DataFrame, time_column: Optional[str]) -> Dict:
+        """Écrit une partition (atomiquement) et retourne son entrée de manifeste."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + '.tmp')
+        pq.write_table(pa.Table.from_pandas(part, preserve_index=False), tmp)
+        os.replace(tmp, path)
+        if time_column is None or part.empty:
+            return {'min': None, 'max': None, 'rows': len(part)}
+        return {
+            'min': part[time_column].iloc[0].isoformat(),
+            'max': part[time_column].iloc[-1].isoformat(),
+            'rows': len(part)
+        }
+
+    def partitions(self, table: str, start_date=None, end_date=None) -> List[Path]:
+        """Fichiers des partitions qui recoupent [start_date, end_date], dans l'ordre chronologique."""
+        start = pd.Timestamp(start_date) if start_date is not None else None
+        end = pd.Timestamp(end_date) if end_date is not None else None
+        paths = []
+        for key, part in sorted(self._table(table)['partitions'].items()):
+            if part['min'] is not None:
+                if (end is not None and pd.Timestamp(part['min']) > end) or \
+                        (start is not None and pd.Timestamp(part['max']) < start):
+                    continue
+            paths.append(self.root / part['path'])
+        return paths
+
+    def signature(self, table: str, start_date=None, end_date=None) -> tuple:
+        """Identité (chemin, mtime, taille) des partitions de la période : change si l'une est réécrite."""
+        signature = []
+        for path in self.partitions(table, start_date, end_date):
+            stat = os.stat(path)
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def read(self, table: str, start_date=None, end_date=None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Lignes de la période (bornes incluses), lues dans les seules partitions concernées."""
+        time_column = self.time_column(table)
+        read_columns = columns
+        if columns is not None and time_column is not None and time_column not in columns:
+            read_columns = list(columns) + [time_column]
+
+        paths = self.partitions(table, start_date, end_date)
+        if paths:
+            tables = [pq.read_table(path, columns=read_columns) for path in paths]
+            df = pa.concat_tables(tables, promote_options='default').to_pandas()
+        else:
+            df = self._empty(table, read_columns)
+        if time_column is not None:
+            # Partitions triées et lues dans l'ordre : la période est une tranche
+            df = slice_period(df, time_column, start_date, end_date)
+        if read_columns is not columns:
+            df = df[list(columns)]
+        return df
+
+    def _empty(self, table: str, columns: Optional[List[str]]) -> pd.DataFrame:
+        """Table vide avec le schéma des partitions existantes."""
+        partitions = self._table(table)['partitions']
+        if not partitions:
+            return pd.DataFrame(columns=columns or [])
+        some = self.root / next(iter(partitions.values()))['path']
+        schema = pq.read_schema(some)
+        if columns is not None:
+            schema = pa.schema([schema.field(name) for name in columns])
+        return schema.empty_table().to_pandas()
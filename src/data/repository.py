@@ -1,14 +1,172 @@
+import os
+import threading
+from collections import OrderedDict
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
 from ..utils.logger import setup_logger
+from .dedupe import drop_duplicate_keys
+from .loader import load_concurrently
 from .models import PeriodData
+from .partitions import PartitionedDataset
+from .tail import TailReader
+from .timeindex import slice_period
 
 logger = setup_logger(__name__)
 
+# Lecteurs incrémentaux des journaux d'opérations, partagés entre les instances
+_tail_readers: Dict[Path, TailReader] = {}
+_tail_readers_lock = threading.Lock()
+
+# Fichiers déjà analysés : {chemin: ((mtime, taille), DataFrame trié)}
+_parsed_files: Dict[Path, Tuple[Tuple[int, int], pd.DataFrame]] = {}
+_parsed_files_lock = threading.Lock()
+
+def _parse_csv(path: Path, time_column: Optional[str] = None, time_format: Optional[str] = None) -> pd.DataFrame:
+    """Analyse d'un CSV : dates converties, lignes invalides retirées, tri par time_column."""
+    df = pd.read_csv(path)
+    if time_column is not None:
+        df[time_column] = pd.to_datetime(df[time_column], format=time_format, errors='coerce')
+        df = df.dropna(subset=[time_column]).sort_values(time_column, kind='stable').reset_index(drop=True)
+    return df
+
+def _load_csv(
+    path: Path,
+    time_column: Optional[str] = None,
+    time_format: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Lit un CSV une seule fois par processus : la version analysée (voir
+    _parse_csv) est réutilisée tant que la date de modification et la taille
+    du fichier sont inchangées.
+    """
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = path.resolve()
+    cached = _parsed_files.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    df = _parse_csv(path, time_column, time_format)
+    with _parsed_files_lock:
+        _parsed_files[key] = (signature, df)
+    return df
+
+# Tables du dépôt : (fichier CSV, colonne temporelle, format) ; même nom en partitionné
+TABLES = {
+    'daily': ('daily_operations.csv', 'date', '%Y-%m-%d'),
+    'equipment': ('equipment_performance.csv', None, None),
+    'operations': ('recent_operations.csv', 'timestamp', '%Y-%m-%d %H:%M:%S'),
+}
+
+# Clés naturelles : une journée, une opération d'un engin à un instant donné.
+# Un extrait renvoyé deux fois ne doit pas compter double.
+NATURAL_KEYS = {
+    'daily': ['date'],
+    'operations': ['timestamp', 'engin', 'type_operation', 'zone'],
+}
+
+def _without_duplicates(df: pd.DataFrame, table: str) -> pd.DataFrame:
+    """Retire les lignes dont la clé naturelle (colonnes présentes) apparaît déjà plus haut."""
+    keys = [key for key in NATURAL_KEYS[table] if key in df.columns]
+    if df.empty or NATURAL_KEYS[table][0] not in keys:
+        return df
+    df, count = drop_duplicate_keys(df, keys)
+    if count:
+        logger.info(f"{count} doublon(s) de clé {keys} écarté(s) dans {table}")
+    return df
+
+def partition_repository(csv_dir: Path, target_dir: Path, append: bool = False) -> PartitionedDataset:
+    """
+    Convertit les trois CSV d'un dépôt en jeu partitionné par année/mois
+    (voir PartitionedDataset), lisible ensuite par FileDataRepository(target_dir).
+    """
+    dataset = PartitionedDataset(target_dir)
+    for table, (filename, time_column, time_format) in TABLES.items():
+        dataset.write(table, _load_csv(Path(csv_dir) / filename, time_column, time_format), time_column, append=append)
+    return dataset
+
+# Performance des engins calculée par période : {(dossier, début, fin, version des opérations): DataFrame}
+_DERIVED_ENGINS_SIZE = 32
+_derived_engins: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+_derived_engins_lock = threading.Lock()
+
+def equipment_performance(operations: pd.DataFrame) -> pd.DataFrame:
+    """
+    Performance par engin (total_operations, erreurs, duree_moyenne) calculée
+    sur des opérations unitaires, en une seule agrégation groupée.
+    """
+    columns = ['engin', 'total_operations', 'erreurs', 'duree_moyenne']
+    if operations.empty:
+        return pd.DataFrame(columns=columns)
+    errors = operations['erreur'] if 'erreur' in operations.columns else 0
+    durations = operations['duree_minutes'] if 'duree_minutes' in operations.columns else float('nan')
+    grouped = operations[['engin']].assign(erreur=errors, duree_minutes=durations).groupby('engin', sort=True)
+    return grouped.agg(
+        total_operations=('erreur', 'size'),
+        erreurs=('erreur', 'sum'),
+        duree_moyenne=('duree_minutes', 'mean')
+    ).reset_index()[columns]
+
+def _derived_equipment(key: tuple, operations: pd.DataFrame) -> pd.DataFrame:
+    """equipment_performance mis en cache avec la tranche de période dont il est issu."""
+    with _derived_engins_lock:
+        cached = _derived_engins.get(key)
+        if cached is not None:
+            _derived_engins.move_to_end(key)
+            return cached
+    engins = equipment_performance(operations)
+    with _derived_engins_lock:
+        _derived_engins[key] = engins
+        while len(_derived_engins) > _DERIVED_ENGINS_SIZE:
+            _derived_engins.popitem(last=False)
+    return engins
+
+def _tail_reader(path: Path) -> TailReader:
+    key = path.resolve()
+    with _tail_readers_lock:
+        reader = _tail_readers.get(key)
+        if reader is None:
+            reader = TailReader(path, 'timestamp', timestamp_format='%Y-%m-%d %H:%M:%S')
+            _tail_readers[key] = reader
+        return reader
+
 class FileDataRepository:
-    def __init__(self, data_dir: Path):
+    """
+    Données réelles d'un port : trois CSV dans data_dir, ou un jeu partitionné
+    par date (manifeste présent dans data_dir, voir partition_repository).
+
+    Si engins_from_operations est vrai, engins_data n'est pas le cumul lu sur
+    disque mais la performance des engins sur la période, tirée des opérations.
+
+    Les tables sont lues en parallèle (max_workers threads, 1 = séquentiel),
+    analyse comprise : un aller-retour vers un pool de processus ne coûte pas
+    moins que l'analyse d'un fichier dans le thread.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path,
+        engins_from_operations: bool = False,
+        max_workers: Optional[int] = None
+    ):
         self.data_dir = data_dir
+        self.engins_from_operations = engins_from_operations
+        self.max_workers = max_workers
+        self.dataset = PartitionedDataset(data_dir) if PartitionedDataset.is_partitioned(data_dir) else None
+
+    def signature(self) -> tuple:
+        """Identité (mtime, taille) des fichiers du dépôt : change dès que l'un est réécrit."""
+        names = [PartitionedDataset.MANIFEST_FILE] + [filename for filename, _, _ in TABLES.values()]
+        signature = []
+        for name in names:
+            try:
+                stat = os.stat(self.data_dir / name)
+            except FileNotFoundError:
+                continue
+            signature.append((name, stat.st_mtime_ns, stat.st_size))
+        return (str(Path(self.data_dir).resolve()), tuple(signature))
 
     def get_period_data(self, start_date: datetime, end_date: datetime) -> PeriodData:
         # Nettoyer les dates (enlever fuseau horaire)
@@ -16,36 +174,20 @@ class FileDataRepository:
         end_date = end_date.replace(tzinfo=None)
 
         try:
-            # Chemins des fichiers
-            daily_path = self.data_dir / 'daily_operations.csv'
-            engins_path = self.data_dir / 'equipment_performance.csv'
-            recent_path = self.data_dir / 'recent_operations.csv'
-
-            # Vérifier existence
-            for path in [daily_path, engins_path, recent_path]:
-                if not path.exists():
-                    raise FileNotFoundError(f"Fichier manquant : {path}")
-
-            # Chargement avec conversion explicite des dates
-            daily = pd.read_csv(daily_path)
-            engins = pd.read_csv(engins_path)
-            recent = pd.read_csv(recent_path)
-
-            # Convertir les colonnes de dates
-            daily['date'] = pd.to_datetime(daily['date'], format='%Y-%m-%d', errors='coerce')
-            recent['timestamp'] = pd.to_datetime(recent['timestamp'], format='%Y-%m-%d %H:%M:%S', errors='coerce')
-
-            # Supprimer les lignes avec dates invalides
-            daily = daily.dropna(subset=['date'])
-            recent = recent.dropna(subset=['timestamp'])
-
-            # Filtrer sur la période
-            daily = daily[(daily['date'] >= start_date) & (daily['date'] <= end_date)]
-            recent = recent[(recent['timestamp'] >= start_date) & (recent['timestamp'] <= end_date)]
+            # Tables lues en parallèle : la durée est celle de la plus lente
+            tables = load_concurrently(self._loaders(start_date, end_date), self.max_workers)
+            daily = _without_duplicates(tables['daily'], 'daily')
+            recent, version = tables['operations']
+            recent = _without_duplicates(recent, 'operations')
+            if self.engins_from_operations:
+                key = (self.data_dir.resolve(), start_date, end_date, version)
+                engins = _derived_equipment(key, recent).copy()
+            else:
+                engins = tables['equipment']
 
             # Créer hourly_data à partir de recent (si possible)
             if not recent.empty:
-                recent['heure'] = recent['timestamp'].dt.hour
+                recent = recent.assign(heure=recent['timestamp'].dt.hour)
                 hourly = recent.groupby('heure').size().reset_index(name='nb_operations')
             else:
                 hourly = pd.DataFrame({'heure': range(24), 'nb_operations': 0})
@@ -64,4 +206,50 @@ class FileDataRepository:
 
         except Exception as e:
             logger.error(f"Erreur lors du chargement des données réelles: {e}")
-            raise  # Propage l'erreur pour qu'elle apparaisse dans les logs
\ No newline at end of file
+            raise  # Propage l'erreur pour qu'elle apparaisse dans les logs
+
+    def _require(self, filename: str) -> Path:
+        path = self.data_dir / filename
+        if not path.exists():
+            raise FileNotFoundError(f"Fichier manquant : {path}")
+        return path
+
+    def _loaders(self, start_date: datetime, end_date: datetime) -> Dict[str, Callable]:
+        """
+        Fonctions de lecture des tables de la période : 'daily', 'operations'
+        (avec la version du journal) et 'equipment' si elle est lue sur disque.
+        """
+        dataset = self.dataset
+        if dataset is not None:
+            # Seules les partitions qui recoupent la période sont ouvertes
+            loaders = {
+                'daily': lambda: dataset.read('daily', start_date, end_date),
+                'operations': lambda: (
+                    dataset.read('operations', start_date, end_date),
+                    dataset.signature('operations', start_date, end_date)
+                ),
+            }
+            if not self.engins_from_operations:
+                loaders['equipment'] = lambda: dataset.read('equipment')
+            return loaders
+
+        daily_path = self._require(TABLES['daily'][0])
+        recent_path = self._require(TABLES['operations'][0])
+        engins_path = None if self.engins_from_operations else self._require(TABLES['equipment'][0])
+
+        def read_daily() -> pd.DataFrame:
+            # Fichier analysé une fois (dates converties, trié), relu seulement s'il change
+            daily = _load_csv(daily_path, *TABLES['daily'][1:])
+            # Table triée : bornes de la période trouvées par dichotomie
+            return slice_period(daily, 'date', start_date, end_date)
+
+        def read_operations() -> Tuple[pd.DataFrame, tuple]:
+            # Journal en ajout seul : seules les lignes nouvelles sont analysées
+            reader = _tail_reader(recent_path)
+            recent = reader.refresh()
+            return slice_period(recent, 'timestamp', start_date, end_date), reader.version
+
+        loaders = {'daily': read_daily, 'operations': read_operations}
+        if engins_path is not None:
+            loaders['equipment'] = lambda: _load_csv(engins_path).copy()
+        return loaders
@@ -2,21 +2,85 @@
 Gestion de la synchronisation des données et partage.
 """
 import json
+import os
+import threading
 import urllib.parse
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple, Union
 from pathlib import Path
 
 import pandas as pd
 import streamlit as st
 
+from src.connectors.base import BaseConnector
+from src.connectors.cache import estimated_size
+from src.connectors.csv import CSVConnector, is_multi_source
 from src.connectors.factory import ConnectorFactory
 from src.sectors import SectorFactory
-from ..config import PUBLIC_DATA_HASH, DEFAULT_BASE_URL
-from ..utils.logger import log_access
+from ..config import (
+    PUBLIC_DATA_HASH, DEFAULT_BASE_URL, ENGINS_FROM_OPERATIONS,
+    CACHED_CONNECTORS, CONVERSION_CACHE_DIR, CONVERSION_CACHE_MAX_MB, CONVERSION_CACHE_MAX_SOURCE_MB, DEDUPE_DIR,
+    SECTOR_FRAMES_MAX_MB
+)
+from ..utils.logger import log_access, setup_logger
 from .generator import DataGenerator
-from .models import PeriodData
+from .loader import load_concurrently
+from .models import PeriodData, ValidationReport
+from .validation import validate_frame
+from .dedupe import DedupeIndex, drop_duplicate_keys
+from .timeindex import slice_period, sort_by_time
+
+logger = setup_logger(__name__)
+
+# Index de déduplication par secteur (tableaux projetés en mémoire, gardés ouverts)
+_dedupe_indexes: Dict[str, DedupeIndex] = {}
+_dedupe_indexes_lock = threading.Lock()
+
+
+def _dedupe_index(sector_name: str) -> DedupeIndex:
+    # Un seul index par secteur : deux instances écriraient des tableaux concurrents
+    with _dedupe_indexes_lock:
+        index = _dedupe_indexes.get(sector_name)
+        if index is None:
+            index = _dedupe_indexes[sector_name] = DedupeIndex(DEDUPE_DIR / sector_name)
+        return index
+
+
+# Cache des périodes chargées (partagé entre reruns Streamlit), taille bornée
+_PERIOD_CACHE_SIZE = 16
+_period_cache: "OrderedDict[tuple, PeriodData]" = OrderedDict()
+_period_cache_lock = threading.Lock()
+
+# Données complètes des sources locales, triées sur la colonne de date du secteur :
+# changer de période revient à un découpage par dichotomie, sans relire la source.
+# {clé: (données ou None si non indexables, bilans de lecture, octets)}, borné en
+# octets (SECTOR_FRAMES_MAX_MB) et en nombre d'entrées
+_SECTOR_FRAME_CACHE_SIZE = 32
+_sector_frames: "OrderedDict[tuple, Tuple[Optional[pd.DataFrame], tuple, int]]" = OrderedDict()
+_sector_frames_bytes = 0
+_sector_frames_lock = threading.Lock()
+
+
+def _source_signature(location) -> Optional[tuple]:
+    """
+    Signature (chemin, mtime, taille) des fichiers d'une source locale, ou None
+    si la source n'est pas un fichier ou un lot de fichiers (URL, table SQL...).
+    """
+    if not isinstance(location, (str, os.PathLike)):
+        return None
+    if is_multi_source(location):
+        paths = CSVConnector.list_files(location)
+    elif os.path.isfile(location):
+        paths = [location]
+    else:
+        return None
+    signature = []
+    for path in paths:
+        stat = os.stat(path)
+        signature.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
 
 
 class DataSynchronizer:
@@ -34,7 +98,9 @@ class DataSynchronizer:
         use_real_data: bool = False,
         sector_name: Optional[str] = None,
         connector_type: Optional[str] = None,
-        connector_config: Optional[dict] = None
+        connector_config: Optional[dict] = None,
+        data_source: Optional[str] = None,
+        shared_connector: bool = True
     ):
         """
         Initialise le synchroniseur.
@@ -45,11 +111,21 @@ class DataSynchronizer:
             sector_name: Nom du secteur (ex: "hotel", "restaurant"). Requis si mode "sector".
             connector_type: Type de connecteur (ex: "csv", "api"). Requis si mode "sector".
             connector_config: Configuration spécifique au connecteur.
+            data_source: Chemin du fichier ou URL lu en mode "sector".
+            shared_connector: Si False, le connecteur est propre à ce synchroniseur
+                              (au lieu de l'instance partagée du registre).
         """
         self.generator = DataGenerator()
         self.sector_name = sector_name
         self.connector_type = connector_type
         self.connector_config = connector_config or {}
+        self.data_source = data_source
+        # Bilan de la dernière validation des données importées (mode "sector")
+        self.last_validation: Optional[ValidationReport] = None
+        self.last_quarantine: Optional[pd.DataFrame] = None
+        self.last_duplicates = 0
+        # Bilans par table du dernier load_sources : {table: (validation, quarantaine, doublons)}
+        self.last_source_reports: Dict[str, Tuple[Optional[ValidationReport], Optional[pd.DataFrame], int]] = {}
 
         # Détermination du mode de données
         if not use_real_data:
@@ -58,11 +134,21 @@ class DataSynchronizer:
             self.data_mode = "sector"
             # Pré-instanciation du secteur et du connecteur pour un usage ultérieur
             self.sector = SectorFactory.get_sector(sector_name)
-            self.connector = ConnectorFactory.get_connector(connector_type, **self.connector_config)
+            get_connector = ConnectorFactory.get_connector if shared_connector else ConnectorFactory.create_connector
+            self.connector = get_connector(connector_type, **self.connector_config)
+            # Connecteur sans conversion Arrow, pour les lectures complètes indexées en mémoire
+            self.source_connector = self.connector
+            if connector_type.lower() in CACHED_CONNECTORS:
+                # Sources lues par période : texte analysé une fois, puis relu en Arrow
+                from src.connectors.cache import CachedConnector
+                self.connector = CachedConnector(
+                    self.connector, CONVERSION_CACHE_DIR, CONVERSION_CACHE_MAX_MB * 1024 * 1024,
+                    max_source_bytes=CONVERSION_CACHE_MAX_SOURCE_MB * 1024 * 1024
+                )
         else:
             self.data_mode = "file"
             from .repository import FileDataRepository
-            self.data_repo = FileDataRepository(Path('data/real'))
+            self.data_repo = FileDataRepository(Path('data/real'), engins_from_operations=ENGINS_FROM_OPERATIONS)
 
     def load_period_data(self) -> PeriodData:
         """
@@ -117,14 +203,7 @@ class DataSynchronizer:
             )
 
             # Chargement des données selon le mode
-            if self.data_mode == "sector":
-                return self._load_from_sector(start_date, end_date)
-            elif self.data_mode == "file":
-                return self.data_repo.get_period_data(start_date, end_date)
-            else:  # mock
-                return self.generator.create_period_data(
-                    start_date, end_date, use_current_time=False
-                )
+            return self._load_period(start_date, end_date, use_current_time=False)
 
         except Exception as e:
             # En production, on ignore silencieusement l'erreur
@@ -165,14 +244,85 @@ class DataSynchronizer:
             start_date = end_date - timedelta(days=30)
 
         # Chargement selon le mode
+        return self._load_period(start_date, end_date, use_current_time=True)
+
+    def _load_period(self, start_date: datetime, end_date: datetime, use_current_time: bool = True) -> PeriodData:
+        """Charge une période selon le mode de données (secteur, fichier ou mock)."""
         if self.data_mode == "sector":
             return self._load_from_sector(start_date, end_date)
         elif self.data_mode == "file":
             return self.data_repo.get_period_data(start_date, end_date)
         else:  # mock
             return self.generator.create_period_data(
-                start_date, end_date, use_current_time=True
+                start_date, end_date, use_current_time=use_current_time
+            )
+
+    @staticmethod
+    def previous_period_bounds(start_date: datetime, end_date: datetime) -> Tuple[datetime, datetime]:
+        """
+        Bornes de la période précédente de même nombre de jours, juste avant start_date.
+
+        La durée est comptée en jours entiers (bornes incluses) : une fin à
+        minuit, comme dans les liens partagés, compte pour un jour complet.
+
+        Returns:
+            Tuple (début, fin) de la période précédente.
+        """
+        days = (end_date.date() - start_date.date()).days + 1
+        return start_date - timedelta(days=days), start_date - timedelta(microseconds=1)
+
+    def _cache_key(self, start_date: datetime, end_date: datetime) -> tuple:
+        """
+        Clé de cache d'une période pour la source courante : source, configuration
+        du connecteur et signature (mtime, taille) des fichiers lus, pour qu'un
+        nouveau fichier importé ou modifié ne soit pas servi depuis le cache.
+        """
+        if self.data_mode == "sector":
+            source = (
+                self.sector_name, self.connector_type, str(self.data_source),
+                repr(sorted(self.connector_config.items())), _source_signature(self.data_source)
             )
+        elif self.data_mode == "file":
+            source = (self.generator.data_hash, self.data_repo.signature())
+        else:
+            source = self.generator.data_hash
+        return (self.data_mode, source, start_date, end_date)
+
+    def load_previous_period_data(self, period_data: PeriodData) -> PeriodData:
+        """
+        Charge la période précédant immédiatement period_data, de même durée.
+
+        Passe par le même chemin de chargement que la période courante ; le
+        résultat est mis en cache pour ne pas recharger à chaque rerun.
+        """
+        prev_start, prev_end = self.previous_period_bounds(period_data.start_date, period_data.end_date)
+        return self._load_cached(prev_start, prev_end)
+
+    def load_reference_data(self, period_start: datetime, window_days: int) -> PeriodData:
+        """
+        Charge la fenêtre de référence (window_days jours avant period_start)
+        servant à estimer les baselines historiques.
+        """
+        window_end = datetime.combine(period_start.date(), datetime.min.time()) - timedelta(microseconds=1)
+        window_start = window_end - timedelta(days=window_days) + timedelta(microseconds=1)
+        return self._load_cached(window_start, window_end)
+
+    def _load_cached(self, start_date: datetime, end_date: datetime) -> PeriodData:
+        """Charge une période passée en passant par le cache LRU."""
+        key = self._cache_key(start_date, end_date)
+        with _period_cache_lock:
+            cached = _period_cache.get(key)
+            if cached is not None:
+                _period_cache.move_to_end(key)
+                return cached
+
+        # Une période passée ne dépend pas de l'heure courante
+        period_data = self._load_period(start_date, end_date, use_current_time=False)
+        with _period_cache_lock:
+            _period_cache[key] = period_data
+            while len(_period_cache) > _PERIOD_CACHE_SIZE:
+                _period_cache.popitem(last=False)
+        return period_data
 
     def _load_from_sector(self, start_date: datetime, end_date: datetime) -> PeriodData:
         """
@@ -185,36 +335,285 @@ class DataSynchronizer:
         Returns:
             PeriodData: Données transformées pour la période.
         """
-        # Construction de la source : le connecteur doit savoir interpréter ce dictionnaire
-        source = {
-            'start_date': start_date,
-            'end_date': end_date
-        }
-        # Lecture brute via le connecteur
-        raw_data = self.connector.read(source, **self.connector_config)
-        # Transformation selon le secteur
-        normalized_data = self.sector.transform(raw_data)
+        normalized_data = self._read_period(self.data_source, start_date, end_date)
         # Conversion en objet PeriodData
         return self._df_to_period_data(normalized_data, start_date, end_date)
 
-    def load_data(self, source: str):
+    def _read_period(self, source, start_date: Optional[datetime], end_date: Optional[datetime]) -> pd.DataFrame:
+        """
+        Données transformées de la période : tranche des données complètes
+        indexées si la source est locale, sinon lecture filtrée par le connecteur.
+        """
+        indexed = self._indexed_sector_data(source)
+        if indexed is None:
+            return self._read_sector_data(source, start_date, end_date)
+        date_column = self.sector.date_column
+        if date_column not in indexed.columns:
+            return indexed
+        if not pd.api.types.is_datetime64_any_dtype(indexed[date_column]):
+            # Lue en entier une seule fois avant d'être reconnue non indexable
+            dates = pd.to_datetime(indexed[date_column], errors='coerce', dayfirst=self.sector.dayfirst)
+            return indexed[BaseConnector.period_mask(dates, start_date, end_date)]
+        return slice_period(indexed, date_column, start_date, end_date)
+
+    def _indexed_sector_data(self, source) -> Optional[pd.DataFrame]:
+        """
+        Données complètes d'une source locale, transformées et triées sur la
+        colonne de date du secteur, conservées tant que les fichiers sont inchangés
+        (avec les bilans de validation et de déduplication, restaurés à chaque appel).
+
+        Un seul cache par source : la lecture complète contourne la conversion
+        Arrow (CachedConnector), réservée aux sources lues par période.
+
+        None si la source ne s'y prête pas : source distante, pas de colonne de
+        date, source plus grande que CONVERSION_CACHE_MAX_SOURCE_MB (lue alors
+        par période), ou déjà reconnue non indexable ou trop grande en mémoire. Une source lue pour la
+        première fois et dont la colonne de date n'est pas une date est
+        retournée telle quelle, non triée.
+        """
+        global _sector_frames_bytes
+        date_column = self.sector.date_column
+        signature = _source_signature(source) if date_column else None
+        if signature is None:
+            return None
+        try:
+            size = sum(estimated_size(path) for path, _, _ in signature)
+        except RuntimeError:
+            size = None
+        if size is None or size > CONVERSION_CACHE_MAX_SOURCE_MB * 1024 * 1024:
+            return None
+        key = (self.sector_name, self.connector_type, repr(sorted(self.connector_config.items())), signature)
+        with _sector_frames_lock:
+            cached = _sector_frames.get(key)
+            if cached is not None:
+                _sector_frames.move_to_end(key)
+        if cached is not None:
+            frame, reports, _ = cached
+            if frame is not None:
+                self.last_validation, self.last_quarantine, self.last_duplicates = reports
+            return frame
+
+        data = self._read_sector_data(source, connector=self.source_connector)
+        reports = (self.last_validation, self.last_quarantine, self.last_duplicates)
+        indexable = date_column in data.columns and pd.api.types.is_datetime64_any_dtype(data[date_column])
+        frame = sort_by_time(data, date_column) if indexable else None
+        nbytes = int(frame.memory_usage(deep=True).sum()) if indexable else 0
+        max_bytes = SECTOR_FRAMES_MAX_MB * 1024 * 1024
+        # Marqueur None (non indexable ou trop volumineux) : les appels suivants lisent la période
+        entry = (frame, reports, nbytes) if nbytes <= max_bytes else (None, reports, 0)
+        with _sector_frames_lock:
+            previous = _sector_frames.pop(key, None)
+            if previous is not None:
+                _sector_frames_bytes -= previous[2]
+            _sector_frames[key] = entry
+            _sector_frames_bytes += entry[2]
+            while _sector_frames_bytes > max_bytes or len(_sector_frames) > _SECTOR_FRAME_CACHE_SIZE:
+                _, (_, _, evicted) = _sector_frames.popitem(last=False)
+                _sector_frames_bytes -= evicted
+        return frame if indexable else data
+
+    def _read_sector_data(
+        self,
+        source,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        dedupe_index: Optional[DedupeIndex] = None,
+        connector: Optional[BaseConnector] = None
+    ) -> pd.DataFrame:
+        """
+        Lit la source via le connecteur puis la transforme selon le secteur.
+
+        La période est transmise au connecteur (dans la source) ; si celui-ci sait
+        filtrer à la lecture, il reçoit aussi la colonne de date du secteur.
+        Les doublons de clé naturelle sont retirés avant la transformation
+        (au sein du lot, ou par rapport à dedupe_index s'il est fourni ; les
+        clés nouvelles n'y sont enregistrées qu'une fois la transformation réussie).
+        connector remplace self.connector pour cette lecture.
+        """
+        connector = connector or self.connector
+        options = dict(self.connector_config)
+        period_requested = start_date is not None or end_date is not None
+        pushdown = connector.supports_period_filter
+        if period_requested and pushdown:
+            # Le connecteur interprète la source {'path', 'start_date', 'end_date'}
+            source = {'path': source, 'start_date': start_date, 'end_date': end_date}
+            if self.sector.date_column:
+                options.setdefault('date_column', self.sector.date_column)
+                options.setdefault('dayfirst', self.sector.dayfirst)
+
+        # Lot de fichiers : sans schéma à valider, la transformation est faite fichier par fichier
+        location = source['path'] if isinstance(source, dict) else source
+        per_file = connector.supports_multi_file and is_multi_source(location) and not self.sector.schema
+        if per_file:
+            options.setdefault('transform', self.sector.transform)
+
+        # Lecture brute via le connecteur, validation puis transformation selon le secteur
+        raw_data = connector.read(source, **options)
+        if per_file:
+            data = new_rows = self._deduplicate(raw_data, dedupe_index)
+        else:
+            new_rows = self._deduplicate(self._validate(raw_data), dedupe_index)
+            data = self.sector.transform(new_rows)
+        keys = self.sector.natural_key
+        if dedupe_index is not None and keys and set(keys) <= set(new_rows.columns):
+            dedupe_index.commit(new_rows, keys)
+
+        # Filtre final pour les connecteurs qui ne filtrent pas à la lecture
+        date_column = self.sector.date_column
+        if period_requested and not pushdown and date_column in data.columns:
+            data = data[BaseConnector.period_mask(data[date_column], start_date, end_date)]
+        return data
+
+    def _validate(self, raw_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Valide les données brutes contre le schéma du secteur.
+
+        Les lignes rejetées sont conservées dans last_quarantine (avec leur motif)
+        et le bilan dans last_validation. Les doublons de la clé naturelle ne sont
+        pas mis en quarantaine : _deduplicate les retire et les compte.
+        """
+        schema = self.sector.schema
+        keys = self.sector.natural_key
+        if keys and len(keys) == 1 and schema.get(keys[0], {}).get('unique'):
+            schema = {**schema, keys[0]: {rule: value for rule, value in schema[keys[0]].items() if rule != 'unique'}}
+        clean, self.last_quarantine, self.last_validation = validate_frame(
+            raw_data, schema, self.sector.relations, dayfirst=self.sector.dayfirst
+        )
+        if self.last_validation.rows_rejected:
+            logger.warning(
+                f"{self.last_validation.rows_rejected} ligne(s) rejetée(s) sur {self.last_validation.rows_read} : "
+                f"{self.last_validation.reasons}"
+            )
+        return clean
+
+    def _deduplicate(self, data: pd.DataFrame, dedupe_index: Optional[DedupeIndex] = None) -> pd.DataFrame:
+        """Retire les lignes dont la clé naturelle du secteur est déjà connue."""
+        keys = self.sector.natural_key
+        if not keys or not set(keys) <= set(data.columns):
+            return data
+        if dedupe_index is not None:
+            data, self.last_duplicates = dedupe_index.filter_new(data, keys, commit=False)
+        else:
+            data, self.last_duplicates = drop_duplicate_keys(data, keys)
+        if self.last_duplicates:
+            logger.info(f"{self.last_duplicates} doublon(s) de clé {keys} écarté(s)")
+        return data
+
+    def ingest(self, source: Optional[str] = None) -> pd.DataFrame:
+        """
+        Intègre une source en ne retenant que les enregistrements jamais vus.
+
+        Les clés naturelles déjà intégrées sont conservées dans un index
+        persistant par secteur : réimporter un extrait qui recoupe un précédent
+        ne transforme que les lignes nouvelles. Le fichier est lu sans
+        conversion Arrow (lecture unique, hors période).
+
+        Returns:
+            DataFrame transformé des seules lignes nouvelles.
+        """
+        if self.data_mode != "sector":
+            raise ValueError("ingest ne peut être appelé qu'en mode 'sector'")
+        if not self.sector.natural_key:
+            raise ValueError(f"Le secteur {self.sector_name} ne déclare pas de clé naturelle.")
+        return self._read_sector_data(
+            source or self.data_source, dedupe_index=_dedupe_index(self.sector_name), connector=self.source_connector
+        )
+
+    def load_data(
+        self,
+        source: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ):
         """
         Charge les données brutes depuis une source (fichier, URL) via le connecteur,
-        puis les transforme selon le secteur.
+        puis les transforme selon le secteur. Pour une source locale, les données
+        complètes sont gardées triées par date et la période en est une tranche.
 
         Args:
             source: Chemin du fichier ou URL.
+            start_date: Début de période (optionnel, filtre appliqué dès la lecture si possible).
+            end_date: Fin de période (optionnel).
 
         Returns:
             DataFrame transformé, prêt à être utilisé par le secteur.
         """
         if self.data_mode != "sector":
             raise ValueError("load_data ne peut être appelé qu'en mode 'sector'")
-        
-        # Lecture via le connecteur
-        raw_data = self.connector.read(source, **self.connector_config)
-        # Transformation sectorielle
-        return self.sector.transform(raw_data)
+
+        return self._read_period(source, start_date, end_date)
+
+    def load_sources(
+        self,
+        sources: Dict[str, Union[str, dict]],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Charge plusieurs sources du secteur en parallèle (threads) : appels API
+        ou lectures de fichiers sont lancés ensemble, un chargement à froid
+        dure autant que la source la plus lente.
+
+        Args:
+            sources: {nom de table: source (chemin, URL ou {'path', ...})}.
+            start_date: Début de période (optionnel).
+            end_date: Fin de période (optionnel).
+            max_workers: Nombre de threads (une par source par défaut).
+
+        Returns:
+            {nom de table: DataFrame transformé}. Les bilans de validation et de
+            déduplication de chaque table sont dans last_source_reports.
+        """
+        if self.data_mode != "sector":
+            raise ValueError("load_sources ne peut être appelé qu'en mode 'sector'")
+
+        def read(source) -> tuple:
+            # Un synchroniseur et un connecteur par source : aucun état partagé entre threads
+            worker = DataSynchronizer(
+                use_real_data=True, sector_name=self.sector_name, connector_type=self.connector_type,
+                connector_config=self.connector_config, data_source=self.data_source, shared_connector=False
+            )
+            data = worker._read_period(source, start_date, end_date)
+            return data, (worker.last_validation, worker.last_quarantine, worker.last_duplicates)
+
+        results = load_concurrently(
+            {name: (lambda source=source: read(source)) for name, source in sources.items()},
+            max_workers
+        )
+        self.last_source_reports = {name: reports for name, (_, reports) in results.items()}
+        return {name: data for name, (data, _) in results.items()}
+
+    def load_aggregate(
+        self,
+        name: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """
+        Exécute une agrégation déclarée par le secteur directement dans la source.
+
+        Args:
+            name: Nom de l'agrégation (clé de sector.aggregations, ex. 'daily').
+            start_date: Début de période (optionnel).
+            end_date: Fin de période (optionnel).
+
+        Returns:
+            DataFrame agrégé (une ligne par groupe), sans transformation du secteur.
+        """
+        if self.data_mode != "sector":
+            raise ValueError("load_aggregate ne peut être appelé qu'en mode 'sector'")
+        if not self.connector.supports_aggregation:
+            raise ValueError("Le connecteur ne sait pas agréger à la source.")
+        if name not in self.sector.aggregations:
+            raise ValueError(f"Agrégation inconnue pour ce secteur : {name}")
+
+        options = dict(self.connector_config)
+        options['aggregation'] = self.sector.aggregations[name]
+        if self.sector.date_column:
+            options.setdefault('date_column', self.sector.date_column)
+        source = {'path': self.data_source, 'start_date': start_date, 'end_date': end_date}
+        return self.connector.read(source, **options)
 
     def _df_to_period_data(self, df: pd.DataFrame, start_date: datetime, end_date: datetime) -> PeriodData:
         """
@@ -0,0 +1,160 @@
+"""
+Lecture incrémentale d'un fichier CSV en ajout seul (journal d'opérations).
+"""
+import io
+import os
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Octets de début de fichier comparés pour détecter un fichier réécrit
+_HEAD_BYTES = 4096
+
+
+class TailReader:
+    """
+    Suit un fichier CSV qui ne fait que grandir : chaque refresh() ne lit et
+    n'analyse que les octets ajoutés depuis la lecture précédente.
+
+    L'état conservé est l'offset lu, l'identité du fichier (inode), le début
+    du fichier, la ligne incomplète éventuelle et le dernier horodatage vu.
+    Si le fichier est remplacé (rotation) ou tronqué, il est relu depuis le
+    début et seules les lignes absentes du frame (comparées sur tout leur
+    contenu, à multiplicité près) sont ajoutées : une ligne nouvelle de même
+    horodatage que la dernière, ou arrivée en retard, n'est pas perdue.
+    Le frame est maintenu trié par horodatage (retri seulement si des lignes
+    arrivent dans le désordre).
+    """
+
+    def __init__(self, path, timestamp_column: str, timestamp_format: Optional[str] = None, **read_csv_kwargs):
+        self.path = Path(path)
+        self.timestamp_column = timestamp_column
+        self.timestamp_format = timestamp_format
+        self.read_csv_kwargs = read_csv_kwargs
+        self.last_timestamp: Optional[pd.Timestamp] = None
+        self._lock = threading.Lock()
+        self._after_rotation = False
+        self._reset_position()
+        self._parts: List[pd.DataFrame] = []
+        self._needs_sort = False
+
+    def _reset_position(self) -> None:
+        self.offset = 0
+        self._inode = None
+        self._head = b''
+        self._header = b''
+        self._partial = b''
+
+    @property
+    def version(self) -> tuple:
+        """État lu du fichier (identité, offset) : change dès que des octets sont ajoutés."""
+        return (self._inode, self.offset)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Toutes les lignes lues jusqu'ici (fusionnées à la demande)."""
+        if len(self._parts) > 1 or self._needs_sort:
+            frame = pd.concat(self._parts, ignore_index=True)
+            if self._needs_sort:
+                frame = frame.sort_values(self.timestamp_column, kind='stable', ignore_index=True)
+                self._needs_sort = False
+            self._parts = [frame]
+        if self._parts:
+            return self._parts[0]
+        return self._parse(b'') if self._header else pd.DataFrame()
+
+    def refresh(self) -> pd.DataFrame:
+        """
+        Lit les lignes ajoutées depuis le dernier appel.
+
+        Returns:
+            DataFrame complet (lignes précédentes et nouvelles).
+        """
+        with self._lock:
+            stat = os.stat(self.path)
+            with open(self.path, 'rb') as f:
+                if self._inode is not None and (
+                    stat.st_ino != self._inode
+                    or stat.st_size < self.offset
+                    or f.read(len(self._head)) != self._head
+                ):
+                    logger.info(f"{self.path.name} remplacé ou tronqué : relecture depuis le début")
+                    self._reset_position()
+                    self._after_rotation = True
+                self._inode = stat.st_ino
+                f.seek(self.offset)
+                appended = f.read()
+                self.offset += len(appended)
+                if len(self._head) < _HEAD_BYTES:
+                    f.seek(0)
+                    self._head = f.read(min(_HEAD_BYTES, self.offset))
+
+            data = self._partial + appended
+            # Seules les lignes complètes sont analysées ; la fin incomplète est gardée pour la suite
+            cut = data.rfind(b'\n') + 1
+            complete, self._partial = data[:cut], data[cut:]
+            if not self._header and complete:
+                end = complete.index(b'\n') + 1
+                self._header, complete = complete[:end], complete[end:]
+            if complete.strip():
+                self._append(complete)
+            sep = self.read_csv_kwargs.get('sep', ',').encode()
+            if self._header and self._partial.strip() and self._partial.count(sep) == self._header.count(sep):
+                # Dernière ligne complète mais sans fin de ligne : renvoyée, et relue au prochain appel
+                last = self._parse(self._partial)
+                if not last.empty:
+                    frame = pd.concat([self.frame, last], ignore_index=True)
+                    if not frame[self.timestamp_column].is_monotonic_increasing:
+                        frame = frame.sort_values(self.timestamp_column, kind='stable', ignore_index=True)
+                    return frame
+            return self.frame
+
+    def _parse(self, lines: bytes) -> pd.DataFrame:
+        df = pd.read_csv(io.BytesIO(self._header + lines), **self.read_csv_kwargs)
+        df[self.timestamp_column] = pd.to_datetime(
+            df[self.timestamp_column], format=self.timestamp_format, errors='coerce'
+        )
+        return df.dropna(subset=[self.timestamp_column])
+
+    def _append(self, lines: bytes) -> None:
+        df = self._parse(lines)
+        if self._after_rotation and self._parts:
+            # Fichier relu depuis le début : lignes déjà connues ignorées
+            df = self._unseen(df)
+        self._after_rotation = False
+        if df.empty:
+            return
+        if not df[self.timestamp_column].is_monotonic_increasing:
+            df = df.sort_values(self.timestamp_column, kind='stable')
+        if self.last_timestamp is not None and df[self.timestamp_column].iloc[0] < self.last_timestamp:
+            self._needs_sort = True
+        newest = df[self.timestamp_column].iloc[-1]
+        self.last_timestamp = newest if self.last_timestamp is None else max(newest, self.last_timestamp)
+        self._parts.append(df)
+
+    def _unseen(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Lignes de df absentes du frame. Une ligne présente n fois dans le frame
+        n'est ignorée que pour ses n premières occurrences dans df.
+        """
+        if df.empty:
+            return df
+        ts = self.timestamp_column
+        frame = self.frame
+        # Seules les lignes connues de la plage relue peuvent être des doublons
+        known = frame[frame[ts] >= df[ts].min()]
+        if known.empty:
+            return df
+        # Concaténation : types communs, donc empreintes comparables
+        hashes = pd.util.hash_pandas_object(pd.concat([known, df], ignore_index=True), index=False)
+        known_counts = hashes.iloc[:len(known)].value_counts()
+        new = hashes.iloc[len(known):].reset_index(drop=True)
+        occurrence = new.groupby(new).cumcount()
+        seen = new.map(known_counts).fillna(0).astype('int64')
+        return df[(occurrence >= seen).to_numpy()]
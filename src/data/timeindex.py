@@ -0,0 +1,61 @@
+"""
+Découpage par période de tables triées sur une colonne temporelle.
+
+Une table triée (sans date manquante) se découpe par recherche dichotomique :
+les bornes sont trouvées en O(log n) et le résultat est une tranche contiguë
+(iloc) qui partage les données de la table, au lieu d'un masque booléen
+évalué sur toutes les lignes puis copié.
+"""
+from typing import Tuple
+
+import pandas as pd
+
+
+def is_time_sorted(df: pd.DataFrame, column: str) -> bool:
+    """Vrai si la colonne est temporelle, sans valeur manquante et triée croissante."""
+    times = df[column]
+    return (
+        pd.api.types.is_datetime64_any_dtype(times)
+        and not times.hasnans
+        and times.is_monotonic_increasing
+    )
+
+
+def sort_by_time(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """
+    Table prête au découpage : lignes sans date retirées, tri stable sur column.
+    Une table déjà triée est retournée telle quelle.
+    """
+    if is_time_sorted(df, column):
+        return df
+    if not pd.api.types.is_datetime64_any_dtype(df[column]):
+        raise TypeError(f"La colonne {column} n'est pas temporelle.")
+    return df.dropna(subset=[column]).sort_values(column, kind='stable').reset_index(drop=True)
+
+
+def period_bounds(times: pd.Series, start_date=None, end_date=None) -> Tuple[int, int]:
+    """Positions [début, fin[ des dates comprises dans [start_date, end_date] (bornes incluses)."""
+    lower = 0 if start_date is None else int(times.searchsorted(_bound(times, start_date), side='left'))
+    upper = len(times) if end_date is None else int(times.searchsorted(_bound(times, end_date), side='right'))
+    return lower, max(lower, upper)
+
+
+def slice_period(df: pd.DataFrame, column: str, start_date=None, end_date=None) -> pd.DataFrame:
+    """
+    Lignes de la période [start_date, end_date] d'une table triée sur column
+    (voir sort_by_time). La tranche retournée n'est pas une copie : la copier
+    avant d'y ajouter des colonnes.
+    """
+    lower, upper = period_bounds(df[column], start_date, end_date)
+    return df.iloc[lower:upper]
+
+
+def _bound(times: pd.Series, value) -> pd.Timestamp:
+    """Borne comparable à la colonne (même fuseau, ou aucun)."""
+    bound = pd.Timestamp(value)
+    tz = getattr(times.dtype, 'tz', None)
+    if tz is not None and bound.tzinfo is None:
+        return bound.tz_localize(tz)
+    if tz is None and bound.tzinfo is not None:
+        return bound.tz_localize(None)
+    return bound
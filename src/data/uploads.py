@@ -0,0 +1,122 @@
+"""
+Stockage des fichiers importés, adressé par contenu.
+"""
+import hashlib
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadStore:
+    """
+    Écrit les fichiers importés sur disque par blocs, sous le nom de leur
+    empreinte SHA-256 : un même fichier importé plusieurs fois n'est stocké
+    qu'une fois (et son analyse, mise en cache par contenu, est partagée).
+
+    Les fichiers plus anciens que max_age_seconds (dernier import ou dernière
+    utilisation, voir touch) sont supprimés, puis les moins récents tant que
+    la taille dépasse max_bytes. Un fichier utilisé depuis moins de
+    in_use_seconds n'est jamais supprimé : une autre session peut le lire.
+    """
+
+    def __init__(
+        self,
+        directory,
+        max_bytes: int,
+        max_age_seconds: float,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        in_use_seconds: float = 0
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.chunk_size = chunk_size
+        self.in_use_seconds = in_use_seconds
+        self._lock = threading.Lock()
+
+    def save(self, upload: BinaryIO, suffix: str = '') -> Path:
+        """
+        Enregistre un fichier importé (objet fichier : UploadedFile, BytesIO, ...).
+
+        Returns:
+            Chemin du fichier stocké, identique pour un contenu identique.
+        """
+        if hasattr(upload, 'seek'):
+            upload.seek(0)
+        sha = hashlib.sha256()
+        tmp = self.directory / f".{uuid.uuid4().hex}.part"
+        try:
+            with open(tmp, 'wb') as f:
+                for block in iter(lambda: upload.read(self.chunk_size), b''):
+                    sha.update(block)
+                    f.write(block)
+            target = self.directory / f"{sha.hexdigest()}{suffix.lower()}"
+            with self._lock:
+                if target.exists():
+                    tmp.unlink()
+                    # Rafraîchit la date : le fichier redevient le plus récent
+                    os.utime(target)
+                else:
+                    os.replace(tmp, target)
+        finally:
+            tmp.unlink(missing_ok=True)
+        self.evict(keep=target)
+        return target
+
+    def touch(self, path) -> bool:
+        """
+        Signale l'utilisation d'un fichier stocké : sa date devient la plus
+        récente, il est protégé de l'éviction pendant in_use_seconds.
+
+        Returns:
+            Faux si le fichier n'existe plus (déjà supprimé).
+        """
+        with self._lock:
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                return False
+        return True
+
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """
+        Applique les limites d'âge et de taille.
+
+        Returns:
+            Nombre de fichiers supprimés.
+        """
+        now = time.time()
+        removed = 0
+        with self._lock:
+            files = []
+            for path in self.directory.iterdir():
+                if path.name.startswith('.') or not path.is_file():
+                    continue
+                stat = path.stat()
+                files.append((stat.st_mtime, stat.st_size, path))
+            files.sort()
+
+            total = sum(size for _, size, _ in files)
+            for mtime, size, path in files:
+                if path == keep or now - mtime < self.in_use_seconds:
+                    continue
+                if now - mtime <= self.max_age_seconds and total <= self.max_bytes:
+                    continue
+                try:
+                    path.unlink()
+                except OSError as e:
+                    logger.warning(f"Suppression impossible de {path.name} : {e}")
+                    continue
+                total -= size
+                removed += 1
+        return removed
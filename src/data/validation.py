@@ -0,0 +1,117 @@
+"""
+Validation vectorisée des données importées, avec mise en quarantaine des lignes rejetées.
+"""
+import operator
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .models import ValidationReport
+
+COLUMN_TYPES = ('numeric', 'datetime', 'string')
+RELATION_OPERATORS = {
+    '>=': operator.ge,
+    '>': operator.gt,
+    '<=': operator.le,
+    '<': operator.lt,
+    '==': operator.eq
+}
+REASON_COLUMN = 'motif_rejet'
+
+
+def validate_frame(
+    df: pd.DataFrame,
+    schema: Dict[str, Dict],
+    relations: Iterable[Tuple[str, str, str]] = (),
+    dayfirst: bool = False
+) -> Tuple[pd.DataFrame, pd.DataFrame, ValidationReport]:
+    """
+    Valide un DataFrame brut contre le schéma déclaré par un secteur.
+
+    Règles par colonne : type ('numeric', 'datetime', 'string'), required
+    (colonne obligatoire), nullable (défaut True), min, max, allowed, unique.
+    relations : contraintes entre colonnes, ex. ('date_arrivee', '>=', 'date_depart').
+
+    Chaque règle est un masque booléen calculé en une passe sur la colonne ;
+    les colonnes converties remplacent les colonnes brutes dans les données
+    retenues, que le transformateur n'a donc pas à reconvertir.
+
+    Returns:
+        (lignes valides, lignes rejetées avec motif_rejet, rapport)
+
+    Raises:
+        ValueError: Si une colonne obligatoire est absente.
+    """
+    missing = [column for column, rules in schema.items() if rules.get('required') and column not in df.columns]
+    if missing:
+        raise ValueError(f"Colonnes obligatoires manquantes : {', '.join(missing)}")
+
+    typed = {}
+    masks: Dict[str, np.ndarray] = {}
+    for column, rules in schema.items():
+        if column not in df.columns:
+            continue
+        raw = df[column]
+        values = _coerce(raw, rules.get('type'), dayfirst)
+        if values is not raw:
+            typed[column] = values
+            masks[f"{column} : type invalide"] = (values.isna() & raw.notna()).to_numpy()
+        if not rules.get('nullable', True):
+            masks[f"{column} : valeur manquante"] = raw.isna().to_numpy()
+        if 'min' in rules:
+            masks[f"{column} : inférieur à {rules['min']}"] = (values < rules['min']).to_numpy()
+        if 'max' in rules:
+            masks[f"{column} : supérieur à {rules['max']}"] = (values > rules['max']).to_numpy()
+        if 'allowed' in rules:
+            masks[f"{column} : valeur non autorisée"] = (values.notna() & ~values.isin(rules['allowed'])).to_numpy()
+        if rules.get('unique'):
+            masks[f"{column} : doublon"] = (values.notna() & values.duplicated(keep='first')).to_numpy()
+
+    for left, op, right in relations:
+        if left not in df.columns or right not in df.columns:
+            continue
+        a = typed.get(left, df[left])
+        b = typed.get(right, df[right])
+        masks[f"{left} {op} {right} non respecté"] = (
+            a.notna() & b.notna() & ~RELATION_OPERATORS[op](a, b)
+        ).to_numpy()
+
+    rejected = np.zeros(len(df), dtype=bool)
+    for mask in masks.values():
+        rejected |= mask
+
+    clean = df.assign(**typed) if typed else df
+    report = ValidationReport(
+        rows_read=len(df),
+        rows_valid=int(len(df) - rejected.sum()),
+        reasons={reason: int(mask.sum()) for reason, mask in masks.items() if mask.any()},
+        coerced_columns=list(typed)
+    )
+    if not rejected.any():
+        # Cas courant : aucune copie supplémentaire
+        return clean, df.iloc[0:0].assign(**{REASON_COLUMN: pd.Series(dtype=object)}), report
+
+    # Motifs assemblés uniquement pour les lignes rejetées
+    motifs = pd.Series('', index=np.flatnonzero(rejected), dtype=object)
+    for reason, mask in masks.items():
+        hit = mask[rejected]
+        if hit.any():
+            motifs[hit] = motifs[hit] + np.where(motifs[hit] == '', '', '; ') + reason
+    quarantine = df[rejected].assign(**{REASON_COLUMN: motifs.to_numpy()})
+    return clean[~rejected], quarantine, report
+
+
+def _coerce(values: pd.Series, column_type: Optional[str], dayfirst: bool) -> pd.Series:
+    """Convertit une colonne dans le type attendu (valeurs invalides -> NaN/NaT)."""
+    if column_type is None or column_type == 'string':
+        return values
+    if column_type not in COLUMN_TYPES:
+        raise ValueError(f"Type de colonne inconnu : {column_type}")
+    if column_type == 'numeric':
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            return values
+        return pd.to_numeric(values, errors='coerce')
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values, errors='coerce', dayfirst=dayfirst)
@@ -0,0 +1,190 @@
+"""
+Estimation des valeurs de référence (baselines) à partir de l'historique.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+BASELINE_METHODS = ('median', 'trimmed_mean', 'seasonal')
+
+
+def _trimmed_mean(values: np.ndarray, trim: float) -> float:
+    """Moyenne tronquée : retire la fraction `trim` de chaque extrémité."""
+    values = np.sort(values)
+    cut = int(len(values) * trim)
+    kept = values[cut:len(values) - cut] if len(values) > 2 * cut else values
+    return float(kept.mean())
+
+
+class BaselineEstimator:
+    """
+    Dérive baseline_duration et baseline_error_rate d'une fenêtre de référence
+    précédant la période analysée.
+
+    L'historique est conservé sous forme d'un agrégat par jour, trié par date.
+    update() n'intègre que les jours nouveaux ou corrigés et n'invalide que les
+    estimations dont la fenêtre contient ces jours ; estimate() découpe la
+    fenêtre par recherche dichotomique sans reparcourir l'historique.
+    """
+
+    def __init__(self, window_days: int = 90, method: str = 'median', trim: float = 0.1, min_days: int = 7):
+        if method not in BASELINE_METHODS:
+            raise ValueError(f"Méthode de baseline inconnue : {method}")
+        self.window_days = window_days
+        self.method = method
+        self.trim = trim
+        self.min_days = min_days
+        self._history = pd.DataFrame(
+            columns=['nb_operations', 'duree_moyenne', 'erreurs'],
+            index=pd.DatetimeIndex([], name='date'),
+            dtype=float
+        )
+        self._cache: Dict[tuple, Optional[Dict]] = {}
+
+    @property
+    def history_days(self) -> int:
+        """Nombre de jours d'historique connus."""
+        return len(self._history)
+
+    @staticmethod
+    def _per_day(daily_data: pd.DataFrame) -> pd.DataFrame:
+        """Agrège daily_data à un enregistrement par jour (durée pondérée par les opérations)."""
+        df = pd.DataFrame({
+            'date': pd.to_datetime(daily_data['date']).dt.normalize(),
+            'nb_operations': daily_data['nb_operations'].astype(float),
+            'weighted': daily_data['duree_moyenne'].astype(float) * daily_data['nb_operations'].astype(float),
+            'erreurs': daily_data['erreurs'].astype(float)
+        })
+        per_day = df.groupby('date', sort=True).sum()
+        per_day['duree_moyenne'] = np.where(
+            per_day['nb_operations'] > 0,
+            per_day['weighted'] / per_day['nb_operations'].where(per_day['nb_operations'] > 0, 1),
+            np.nan
+        )
+        return per_day[['nb_operations', 'duree_moyenne', 'erreurs']]
+
+    def update(self, daily_data: pd.DataFrame) -> int:
+        """
+        Intègre des données journalières dans l'historique.
+
+        Returns:
+            Nombre de jours ajoutés ou modifiés.
+        """
+        if daily_data is None or daily_data.empty:
+            return 0
+        incoming = self._per_day(daily_data)
+
+        if self._history.empty or incoming.index[0] > self._history.index[-1]:
+            # Cas courant : jours postérieurs à l'historique, simple ajout en fin
+            changed_dates = incoming.index
+            self._history = pd.concat([self._history, incoming]) if not self._history.empty else incoming
+        else:
+            known = incoming.index.isin(self._history.index)
+            existing = self._history.reindex(incoming.index[known])
+            modified = ~np.isclose(
+                existing.to_numpy(dtype=float), incoming[known].to_numpy(dtype=float), equal_nan=True
+            ).all(axis=1)
+            changed_dates = incoming.index[~known].append(incoming.index[known][modified])
+            if len(changed_dates) == 0:
+                return 0
+            self._history.loc[incoming.index[known][modified]] = incoming[known][modified]
+            new_rows = incoming[~known]
+            if not new_rows.empty:
+                self._history = pd.concat([self._history, new_rows]).sort_index()
+
+        self._invalidate(changed_dates)
+        return len(changed_dates)
+
+    def _invalidate(self, dates: pd.DatetimeIndex) -> None:
+        """Supprime du cache les estimations dont la fenêtre contient une date modifiée."""
+        if len(dates) == 0:
+            return
+        first, last = dates.min(), dates.max()
+        for key in list(self._cache):
+            window_start, window_end = key[1], key[2]
+            if window_start <= last and first <= window_end:
+                del self._cache[key]
+
+    def window_bounds(self, period_start: datetime, window_days: Optional[int] = None) -> Tuple[pd.Timestamp, pd.Timestamp]:
+        """Fenêtre de référence : les window_days jours précédant period_start."""
+        window_days = window_days or self.window_days
+        window_end = pd.Timestamp(period_start).normalize() - pd.Timedelta(days=1)
+        window_start = window_end - pd.Timedelta(days=window_days - 1)
+        return window_start, window_end
+
+    def estimate(
+        self,
+        period_start: datetime,
+        period_end: Optional[datetime] = None,
+        method: Optional[str] = None,
+        window_days: Optional[int] = None
+    ) -> Optional[Dict]:
+        """
+        Estime les baselines pour une période.
+
+        Args:
+            period_start: Début de la période analysée (la fenêtre s'arrête la veille).
+            period_end: Fin de la période (utilisée par la méthode saisonnière).
+            method: 'median', 'trimmed_mean' ou 'seasonal' (défaut : méthode de l'instance).
+            window_days: Longueur de la fenêtre de référence (défaut : celle de l'instance).
+
+        Returns:
+            Dictionnaire des baselines, ou None si l'historique est insuffisant.
+        """
+        method = method or self.method
+        if method not in BASELINE_METHODS:
+            raise ValueError(f"Méthode de baseline inconnue : {method}")
+        window_start, window_end = self.window_bounds(period_start, window_days)
+
+        weekdays = ()
+        if method == 'seasonal':
+            end = period_end or period_start + timedelta(days=6)
+            days = pd.date_range(pd.Timestamp(period_start).normalize(), pd.Timestamp(end).normalize(), freq='D')
+            weekdays = tuple(days.dayofweek)
+
+        key = (method, window_start, window_end, weekdays)
+        if key in self._cache:
+            return self._cache[key]
+
+        index = self._history.index
+        lo = index.searchsorted(window_start, side='left')
+        hi = index.searchsorted(window_end, side='right')
+        window = self._history.iloc[lo:hi]
+        window = window[window['nb_operations'] > 0]
+
+        result = None
+        if len(window) >= self.min_days:
+            durations = window['duree_moyenne'].to_numpy(dtype=float)
+            error_rates = (window['erreurs'] / window['nb_operations']).to_numpy(dtype=float)
+            if method == 'median':
+                duration, error_rate = float(np.median(durations)), float(np.median(error_rates))
+            elif method == 'trimmed_mean':
+                duration, error_rate = _trimmed_mean(durations, self.trim), _trimmed_mean(error_rates, self.trim)
+            else:
+                # Médiane par jour de semaine, pondérée par la composition de la période
+                by_weekday = pd.DataFrame({
+                    'weekday': window.index.dayofweek,
+                    'duration': durations,
+                    'error_rate': error_rates
+                }).groupby('weekday').median()
+                overall = (float(np.median(durations)), float(np.median(error_rates)))
+                per_day = [
+                    (by_weekday.at[d, 'duration'], by_weekday.at[d, 'error_rate']) if d in by_weekday.index else overall
+                    for d in weekdays
+                ]
+                duration = float(np.mean([p[0] for p in per_day]))
+                error_rate = float(np.mean([p[1] for p in per_day]))
+
+            result = {
+                'baseline_duration': round(duration, 2),
+                'baseline_error_rate': round(error_rate, 5),
+                'method': method,
+                'days': len(window),
+                'window_start': window_start.strftime('%d/%m/%Y'),
+                'window_end': window_end.strftime('%d/%m/%Y')
+            }
+
+        self._cache[key] = result
+        return result
@@ -3,18 +3,31 @@ Calculateur financier.
 """
 import hashlib
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 
 from ..config import FINANCIAL_PARAMS, PUBLIC_DATA_HASH
 from ..data.models import PeriodData, FinancialMetrics
+from .baseline import BaselineEstimator
+from .merkle import PeriodMerkleIndex
 
 
 class FinancialCalculator:
     """Calcule les métriques financières."""
     
-    def __init__(self, session_state):
+    def __init__(
+        self,
+        session_state,
+        data_hash: str = PUBLIC_DATA_HASH,
+        merkle_index: Optional[PeriodMerkleIndex] = None,
+        baseline_estimator: Optional[BaselineEstimator] = None
+    ):
         self.session_state = session_state
+        self.data_hash = data_hash
+        # Index conservé entre deux calculs pour ne rehasher que les jours modifiés
+        self.merkle_index = merkle_index or PeriodMerkleIndex()
+        self.baseline_estimator = baseline_estimator
    
     def _get_param(self, key: str, default=None):
         """Récupère un paramètre financier."""
@@ -44,6 +57,26 @@ class FinancialCalculator:
             period_summary=empty_summary,
             metrics={}
         )
+    def _resolve_baselines(self, period_data: PeriodData):
+        """
+        Valeurs de référence : historiques si le mode 'historical' est actif et
+        que l'historique couvre la fenêtre, sinon valeurs contractuelles.
+
+        Returns:
+            Tuple (baseline_duration, baseline_error_rate, source).
+        """
+        if self._get_param('baseline_mode') == 'historical' and self.baseline_estimator is not None:
+            estimate = self.baseline_estimator.estimate(
+                period_data.start_date,
+                period_data.end_date,
+                method=self._get_param('baseline_method'),
+                window_days=int(self._get_param('baseline_window_days'))
+            )
+            if estimate is not None:
+                source = f"historique ({estimate['method']}, {estimate['window_start']} - {estimate['window_end']})"
+                return estimate['baseline_duration'], estimate['baseline_error_rate'], source
+        return self._get_param('baseline_duration'), self._get_param('baseline_error_rate'), 'contrat'
+
     def calculate(self, period_data: PeriodData) -> FinancialMetrics:
         """Calcule toutes les métriques financières."""
         if period_data.is_empty():
@@ -67,9 +100,8 @@ class FinancialCalculator:
         error_rate = total_errors / total_ops if total_ops > 0 else 0
         
         # 2. Calcul des gains
-        baseline_duration = self._get_param('baseline_duration')
+        baseline_duration, baseline_error, baseline_source = self._resolve_baselines(period_data)
         hourly_cost = self._get_param('hourly_cost')
-        baseline_error = self._get_param('baseline_error_rate')
         error_cost = self._get_param('error_cost')
         
         # Gain temps
@@ -93,11 +125,21 @@ class FinancialCalculator:
         
         maintenance_gain_total = maintenance_alerts * self._get_param('maintenance_alert_cost')
         maintenance_gain_daily = maintenance_gain_total / total_days if total_days > 0 else 0
-        
+
         # Gain carburant
         trucks_per_day = min(500, avg_daily_ops * 0.3)
         fuel_gain_daily = trucks_per_day * self._get_param('fuel_saving_per_truck')
         fuel_gain_total = fuel_gain_daily * total_days
+
+        daily_series = self._daily_gains_series(
+            daily_data, baseline_duration, hourly_cost, baseline_error, error_cost,
+            {
+                'time_gain': time_gain_total,
+                'error_gain': error_gain_total,
+                'maintenance_gain': maintenance_gain_total,
+                'fuel_gain': fuel_gain_total
+            }
+        )
         
         # 3. Totaux
         total_daily_gains = (time_gain_daily + error_gain_daily + 
@@ -116,8 +158,10 @@ class FinancialCalculator:
         monthly_projection = total_daily_gains * working_days
         monthly_commission = monthly_fixed + (monthly_projection * commission_rate)
         
-                # 5. Hash de vérification
-        hash_string = f"{period_data.period_name}:{total_ops}:{total_period_gains}:{daily_commission}:{PUBLIC_DATA_HASH}"
+        # 5. Hash de vérification (inclut la racine de Merkle des données journalières)
+        self.merkle_index.sync(period_data)
+        merkle_root = self.merkle_index.root.hex()
+        hash_string = f"{period_data.period_name}:{total_ops}:{total_period_gains}:{daily_commission}:{self.data_hash}:{merkle_root}"
         transaction_hash = hashlib.sha256(hash_string.encode()).hexdigest()[:16]
         
         # 6. Création des métriques détaillées pour l'affichage
@@ -132,6 +176,7 @@ class FinancialCalculator:
             'baseline_duration': baseline_duration,
             'hourly_cost': hourly_cost,
             'baseline_error_rate': round(baseline_error * 100, 2),
+            'baseline_source': baseline_source,
             'error_cost': error_cost,
             'monthly_fixed': monthly_fixed,
             'commission_rate': round(commission_rate * 100, 2),
@@ -174,5 +219,55 @@ class FinancialCalculator:
             breakdown=breakdown,
             transaction_hash=f"0x{transaction_hash}",
             period_summary=period_summary,
-            metrics=metrics  
-        )
\ No newline at end of file
+            metrics=metrics,
+            merkle_root=f"0x{merkle_root}",
+            daily_series=daily_series
+        )
+
+    def _daily_gains_series(
+        self,
+        daily_data: pd.DataFrame,
+        baseline_duration: float,
+        hourly_cost: float,
+        baseline_error: float,
+        error_cost: float,
+        period_totals: Dict[str, float]
+    ) -> pd.DataFrame:
+        """
+        Gains jour par jour, calculés de façon vectorisée (une passe sur les colonnes).
+
+        Chaque jour reçoit sa part de la formule de la période : écart de durée
+        et d'erreurs pondéré par ses opérations, camions plafonnés à 500 sur ses
+        propres opérations, maintenance répartie uniformément. Chaque gain est
+        ensuite mis à l'échelle de son total de période (period_totals) : la
+        série se somme exactement aux gains de la période, planchers et
+        plafond sur la moyenne compris (un gain planché à zéro l'est chaque jour).
+        """
+        ops = daily_data['nb_operations'].to_numpy(dtype=float)
+        duration = daily_data['duree_moyenne'].to_numpy(dtype=float)
+        errors = daily_data['erreurs'].to_numpy(dtype=float)
+
+        shares = {
+            'time_gain': (baseline_duration - duration) * ops * (hourly_cost / 60),
+            'error_gain': (baseline_error * ops - errors) * error_cost,
+            'maintenance_gain': np.ones(len(ops)),
+            'fuel_gain': np.minimum(500, ops * 0.3) * self._get_param('fuel_saving_per_truck'),
+        }
+        series = pd.DataFrame({'date': daily_data['date'].to_numpy()})
+        total = np.zeros(len(ops))
+        for name, share in shares.items():
+            gain = self._prorate(share, period_totals[name])
+            series[name] = gain.round(2)
+            total += gain
+        series['total_gain'] = total.round(2)
+        return series
+
+    @staticmethod
+    def _prorate(shares: np.ndarray, period_total: float) -> np.ndarray:
+        """Répartit period_total entre les jours au prorata de shares (uniformément si leur somme est nulle)."""
+        if len(shares) == 0:
+            return shares
+        weight = shares.sum()
+        if weight == 0:
+            return np.full(len(shares), period_total / len(shares))
+        return shares * (period_total / weight)
\ No newline at end of file
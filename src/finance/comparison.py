@@ -0,0 +1,104 @@
+"""
+Comparaison d'une période avec la période précédente.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from ..config import FINANCIAL_PARAMS
+from ..data.models import FinancialMetrics, PeriodComparison, PeriodData
+from .calculator import FinancialCalculator
+
+# Indicateurs comparés (clés de FinancialMetrics.period_summary)
+COMPARED_FIELDS = (
+    'total_operations',
+    'avg_daily_operations',
+    'avg_duration',
+    'error_rate',
+    'period_gains'
+)
+
+# Cache des résultats financiers des périodes précédentes, taille bornée
+_METRICS_CACHE_SIZE = 16
+_metrics_cache: "OrderedDict[tuple, FinancialMetrics]" = OrderedDict()
+_metrics_cache_lock = threading.Lock()
+
+
+class PeriodComparator:
+    """Calcule les écarts réels entre une période et la précédente."""
+
+    def __init__(self, data_sync, finance_calc: FinancialCalculator):
+        self.data_sync = data_sync
+        self.finance_calc = finance_calc
+
+    def _params_key(self) -> tuple:
+        """Paramètres financiers courants (un changement invalide le cache)."""
+        return tuple(self.finance_calc._get_param(key) for key in sorted(FINANCIAL_PARAMS))
+
+    def _previous_metrics(self, previous: PeriodData) -> FinancialMetrics:
+        # Clé de la période chargée (mode, source et signature des fichiers) : un
+        # fichier réécrit ou une autre source ne réutilise pas les anciens résultats
+        key = (
+            self.data_sync._cache_key(previous.start_date, previous.end_date),
+            self.finance_calc.data_hash,
+            self._params_key()
+        )
+        with _metrics_cache_lock:
+            cached = _metrics_cache.get(key)
+            if cached is not None:
+                _metrics_cache.move_to_end(key)
+                return cached
+
+        # Calculateur dédié : l'index de Merkle partagé reste celui de la période courante
+        calc = FinancialCalculator(
+            self.finance_calc.session_state,
+            data_hash=self.finance_calc.data_hash,
+            baseline_estimator=self.finance_calc.baseline_estimator
+        )
+        metrics = calc.calculate(previous)
+        with _metrics_cache_lock:
+            _metrics_cache[key] = metrics
+            while len(_metrics_cache) > _METRICS_CACHE_SIZE:
+                _metrics_cache.popitem(last=False)
+        return metrics
+
+    def compare(
+        self,
+        period_data: PeriodData,
+        current_metrics: Optional[FinancialMetrics] = None
+    ) -> PeriodComparison:
+        """
+        Compare la période avec la période précédente de même durée.
+
+        Args:
+            period_data: Période courante.
+            current_metrics: Métriques déjà calculées pour la période courante (optionnel).
+
+        Returns:
+            PeriodComparison: Valeurs courantes, précédentes et écarts.
+        """
+        if current_metrics is None:
+            current_metrics = self.finance_calc.calculate(period_data)
+        previous_data = self.data_sync.load_previous_period_data(period_data)
+        previous_metrics = self._previous_metrics(previous_data)
+
+        current = _summary_values(current_metrics)
+        previous = _summary_values(previous_metrics)
+        deltas = {key: round(current[key] - previous[key], 2) for key in COMPARED_FIELDS}
+        delta_pct = {
+            key: round((current[key] - previous[key]) / previous[key] * 100, 1) if previous[key] else None
+            for key in COMPARED_FIELDS
+        }
+
+        return PeriodComparison(
+            previous_period_name=previous_data.period_name,
+            current=current,
+            previous=previous,
+            deltas=deltas,
+            delta_pct=delta_pct
+        )
+
+
+def _summary_values(metrics: FinancialMetrics) -> Dict[str, float]:
+    summary = metrics.period_summary
+    return {key: float(summary.get(key, 0) or 0) for key in COMPARED_FIELDS}
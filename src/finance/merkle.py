@@ -0,0 +1,406 @@
+"""
+Arbre de Merkle incrémental pour la vérification des données journalières.
+"""
+import hashlib
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..data.models import PeriodData
+
+EMPTY_ROOT = hashlib.sha256(b'').digest()
+
+
+def _leaf_hash(data: bytes) -> bytes:
+    """Hash d'une feuille (préfixe 0x00 pour éviter les collisions feuille/nœud)."""
+    return hashlib.sha256(b'\x00' + data).digest()
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    """Hash d'un nœud interne (préfixe 0x01)."""
+    return hashlib.sha256(b'\x01' + left + right).digest()
+
+
+class MerkleTree:
+    """
+    Arbre de Merkle binaire conservant tous ses niveaux.
+
+    Un nœud sans frère est promu tel quel au niveau supérieur, ce qui permet
+    d'ajouter ou de modifier une feuille en O(log n).
+    """
+
+    def __init__(self, leaves: Iterable[bytes] = ()):
+        self._levels: List[List[bytes]] = [[_leaf_hash(leaf) for leaf in leaves]]
+        # Construction initiale en O(n)
+        while len(self._levels[-1]) > 1:
+            nodes = self._levels[-1]
+            self._levels.append([
+                _node_hash(nodes[i], nodes[i + 1]) if i + 1 < len(nodes) else nodes[i]
+                for i in range(0, len(nodes), 2)
+            ])
+
+    def __len__(self) -> int:
+        return len(self._levels[0])
+
+    @property
+    def root(self) -> bytes:
+        """Racine de l'arbre (hash de la chaîne vide si aucune feuille)."""
+        return self._levels[-1][0] if self._levels[0] else EMPTY_ROOT
+
+    def append(self, data: bytes) -> int:
+        """Ajoute une feuille et retourne son index."""
+        self._levels[0].append(_leaf_hash(data))
+        index = len(self._levels[0]) - 1
+        self._update_path(index)
+        return index
+
+    def update(self, index: int, data: bytes) -> None:
+        """Remplace la feuille à l'index donné."""
+        self._levels[0][index] = _leaf_hash(data)
+        self._update_path(index)
+
+    def _update_path(self, index: int) -> None:
+        """Recalcule les ancêtres d'une feuille, de bas en haut."""
+        level = 0
+        while len(self._levels[level]) > 1:
+            nodes = self._levels[level]
+            parent = index // 2
+            left = 2 * parent
+            value = _node_hash(nodes[left], nodes[left + 1]) if left + 1 < len(nodes) else nodes[left]
+            if level + 1 == len(self._levels):
+                self._levels.append([])
+            upper = self._levels[level + 1]
+            if parent < len(upper):
+                upper[parent] = value
+            else:
+                upper.append(value)
+            index = parent
+            level += 1
+
+    def proof(self, index: int) -> List[Tuple[bytes, bool]]:
+        """
+        Preuve d'inclusion d'une feuille.
+
+        Returns:
+            Liste de couples (hash du frère, frère_a_gauche), de la feuille vers la racine.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(f"Feuille inexistante : {index}")
+        path = []
+        for nodes in self._levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(nodes):
+                path.append((nodes[sibling], sibling < index))
+            index //= 2
+        return path
+
+    @staticmethod
+    def verify(data: bytes, proof: List[Tuple[bytes, bool]], root: bytes) -> bool:
+        """Vérifie qu'une donnée appartient à l'arbre de racine donnée."""
+        current = _leaf_hash(data)
+        for sibling, sibling_is_left in proof:
+            current = _node_hash(sibling, current) if sibling_is_left else _node_hash(current, sibling)
+        return current == root
+
+
+class DayMerkleTree:
+    """
+    Arbre de Merkle creux indexé par jour calendaire (position = jours depuis 1970).
+
+    Chaque feuille est à une position fixe : décaler une fenêtre « N derniers
+    jours » ne déplace aucune feuille, seuls les jours modifiés sont recalculés
+    (O(log n) chacun). La racine d'une plage de jours combine, de gauche à
+    droite, les sous-arbres alignés qui la couvrent exactement ; elle ne dépend
+    que des jours de la plage, pas de l'historique déjà indexé.
+    """
+
+    DEPTH = 17  # 131 072 jours : de 1970 à 2328
+    EPOCH = date(1970, 1, 1)
+
+    def __init__(self):
+        self._nodes: Dict[Tuple[int, int], bytes] = {}
+        # Hash des sous-arbres entièrement vides, par niveau
+        self._empty = [_leaf_hash(b'\x02')]
+        for _ in range(self.DEPTH):
+            self._empty.append(_node_hash(self._empty[-1], self._empty[-1]))
+
+    @classmethod
+    def position(cls, day) -> int:
+        """Position d'un jour ('YYYY-MM-DD', date ou datetime) dans l'arbre."""
+        position = (pd.Timestamp(day).date() - cls.EPOCH).days
+        if not 0 <= position < 1 << cls.DEPTH:
+            raise ValueError(f"Jour hors de la plage indexable : {day}")
+        return position
+
+    def _node(self, level: int, index: int) -> bytes:
+        return self._nodes.get((level, index), self._empty[level])
+
+    def set(self, position: int, data: Optional[bytes]) -> None:
+        """Place (ou retire si data est None) la feuille d'un jour et recalcule ses ancêtres."""
+        if data is None:
+            self._nodes.pop((0, position), None)
+        else:
+            self._nodes[(0, position)] = _leaf_hash(data)
+        index = position
+        for level in range(1, self.DEPTH + 1):
+            index //= 2
+            value = _node_hash(self._node(level - 1, 2 * index), self._node(level - 1, 2 * index + 1))
+            if value == self._empty[level]:
+                self._nodes.pop((level, index), None)
+            else:
+                self._nodes[(level, index)] = value
+
+    def _cover(self, lo: int, hi: int) -> List[Tuple[int, int]]:
+        """Sous-arbres alignés (niveau, index) couvrant [lo, hi[, de gauche à droite."""
+        parts = []
+        while lo < hi:
+            level = 0
+            while level < self.DEPTH and lo % (2 << level) == 0 and lo + (2 << level) <= hi:
+                level += 1
+            parts.append((level, lo >> level))
+            lo += 1 << level
+        return parts
+
+    @staticmethod
+    def _fold(parts: List[bytes]) -> bytes:
+        if not parts:
+            return EMPTY_ROOT
+        root = parts[0]
+        for part in parts[1:]:
+            root = _node_hash(root, part)
+        return root
+
+    def range_root(self, lo: int, hi: int) -> bytes:
+        """Racine de la plage de positions [lo, hi[."""
+        return self._fold([self._node(level, index) for level, index in self._cover(lo, hi)])
+
+    def proof(self, position: int, lo: int, hi: int) -> Dict:
+        """Preuve d'inclusion d'un jour dans la racine de la plage [lo, hi[."""
+        parts = self._cover(lo, hi)
+        for i, (level, index) in enumerate(parts):
+            if index == position >> level:
+                path, current = [], position
+                for depth in range(level):
+                    sibling = current ^ 1
+                    path.append((self._node(depth, sibling), sibling < current))
+                    current //= 2
+                return {'path': path, 'part': i, 'parts': [self._node(lv, ix) for lv, ix in parts]}
+        raise IndexError(f"Position hors plage : {position}")
+
+    @classmethod
+    def verify(cls, data: bytes, proof: Dict, root: bytes) -> bool:
+        """Vérifie qu'une feuille appartient à la plage de racine donnée."""
+        current = _leaf_hash(data)
+        for sibling, sibling_is_left in proof['path']:
+            current = _node_hash(sibling, current) if sibling_is_left else _node_hash(current, sibling)
+        parts = list(proof['parts'])
+        if parts[proof['part']] != current:
+            return False
+        return cls._fold(parts) == root
+
+
+# Colonnes hashées par table, dans cet ordre, avec le format des dates.
+# Les autres colonnes (ajoutées pour l'affichage, par exemple) sont ignorées ;
+# une colonne absente est hashée comme un champ vide.
+CANONICAL_COLUMNS: Dict[str, Dict[str, Optional[str]]] = {
+    'daily': {'date': '%Y-%m-%d', 'nb_operations': None, 'duree_moyenne': None, 'urgences': None, 'erreurs': None},
+    'engins': {'engin': None, 'total_operations': None, 'erreurs': None, 'duree_moyenne': None},
+    'recent': {
+        'timestamp': '%Y-%m-%d %H:%M:%S', 'type_operation': None, 'zone': None, 'engin': None,
+        'duree_minutes': None, 'urgence': None, 'erreur': None
+    },
+}
+FIELD_SEPARATOR = '\x1f'
+ROW_SEPARATOR = '\x1e'
+
+
+def _canonical_text(column: pd.Series, date_format: Optional[str]) -> pd.Series:
+    """
+    Texte canonique d'une colonne, indépendant du type lu (CSV, Parquet,
+    simulé) : dates au format déclaré, nombres entiers sans décimale
+    (5, 5.0 et int32 donnent '5'), autres nombres arrondis à 6 décimales,
+    valeurs manquantes vides.
+    """
+    if date_format is not None:
+        return pd.to_datetime(column, errors='coerce').dt.strftime(date_format).fillna('')
+    if pd.api.types.is_bool_dtype(column.dtype) or pd.api.types.is_numeric_dtype(column.dtype):
+        values = column.astype('float64').round(6)
+        text = values.astype(str)
+        integral = values.notna() & (values == np.floor(values))
+        text[integral] = values[integral].astype('int64').astype(str)
+        return text.mask(values.isna(), '')
+    return column.astype(str).mask(column.isna(), '')
+
+
+def canonical_rows(table: str, rows: pd.DataFrame) -> pd.Series:
+    """Lignes d'une table sous forme canonique (champs déclarés séparés par FIELD_SEPARATOR)."""
+    fields = [
+        _canonical_text(rows[name], date_format) if name in rows.columns else pd.Series('', index=rows.index)
+        for name, date_format in CANONICAL_COLUMNS[table].items()
+    ]
+    return fields[0].str.cat(fields[1:], sep=FIELD_SEPARATOR)
+
+
+def _grouped_digests(table: str, keys: pd.Series, rows: pd.DataFrame, sort_rows: bool) -> Dict[str, bytes]:
+    """
+    Empreinte SHA-256 de chaque groupe de lignes : lignes canoniques (voir
+    canonical_rows) jointes par ROW_SEPARATOR, dans leur ordre ou triées si
+    sort_rows. Un vérificateur externe la recalcule à partir des seules valeurs.
+    """
+    if rows.empty:
+        return {}
+    text = canonical_rows(table, rows).to_numpy()
+    codes, uniques = pd.factorize(keys, sort=True)
+    order = np.lexsort((text, codes)) if sort_rows else np.argsort(codes, kind='stable')
+    text, codes = text[order], codes[order]
+    bounds = np.flatnonzero(np.diff(codes)) + 1
+    return {
+        str(uniques[group[0]]): hashlib.sha256(ROW_SEPARATOR.join(chunk).encode('utf-8')).digest()
+        for group, chunk in zip(np.split(codes, bounds), np.split(text, bounds))
+    }
+
+
+def day_digests(period_data: PeriodData) -> Dict[str, Dict[str, bytes]]:
+    """
+    Calcule les empreintes des trois tables d'une période.
+
+    Returns:
+        {'daily': {jour: bytes}, 'engins': {engin: bytes}, 'recent': {jour: bytes}}
+    """
+    daily = period_data.daily_data
+    recent = period_data.recent_ops
+    engins = period_data.engins_data
+    return {
+        # Plusieurs lignes pour un même jour : conservées dans leur ordre
+        'daily': _grouped_digests(
+            'daily', pd.to_datetime(daily['date']).dt.strftime('%Y-%m-%d'), daily, sort_rows=False
+        ) if not daily.empty else {},
+        'engins': _grouped_digests(
+            'engins', engins['engin'].astype(str), engins, sort_rows=False
+        ) if not engins.empty else {},
+        # Opérations d'un jour : empreinte indépendante de leur ordre
+        'recent': _grouped_digests(
+            'recent', pd.to_datetime(recent['timestamp']).dt.strftime('%Y-%m-%d'), recent, sort_rows=True
+        ) if not recent.empty else {},
+    }
+
+
+class PeriodMerkleIndex:
+    """
+    Index de Merkle d'une période.
+
+    Les tables journalières (daily, recent) sont des DayMerkleTree : les
+    feuilles, indexées par jour, restent en place quand la période glisse et
+    seules les feuilles modifiées sont recalculées (O(log n) chacune). La table
+    des engins est un MerkleTree trié par engin, reconstruit si la liste change.
+
+    La racine globale est H(racine_daily || racine_engins || racine_recent),
+    les racines journalières portant sur les jours de la période.
+    """
+
+    TABLES = ('daily', 'engins', 'recent')
+    DAY_TABLES = ('daily', 'recent')
+
+    def __init__(self):
+        self._day_trees: Dict[str, DayMerkleTree] = {table: DayMerkleTree() for table in self.DAY_TABLES}
+        self._engins = MerkleTree()
+        self._engin_keys: List[str] = []
+        self._leaves: Dict[str, Dict[str, bytes]] = {table: {} for table in self.TABLES}
+        self._range: Tuple[int, int] = (0, 0)
+
+    def sync(self, period_data: PeriodData) -> int:
+        """
+        Met l'index en cohérence avec une période.
+
+        Returns:
+            Nombre de feuilles recalculées.
+        """
+        digests = day_digests(period_data)
+        days = [day for table in self.DAY_TABLES for day in digests[table]]
+        bounds = [DayMerkleTree.position(period_data.start_date), DayMerkleTree.position(period_data.end_date)]
+        bounds += [DayMerkleTree.position(day) for day in (min(days), max(days))] if days else []
+        lo, hi = min(bounds), max(bounds) + 1
+        self._range = (lo, hi)
+
+        changed = 0
+        for table in self.DAY_TABLES:
+            changed += self._sync_days(table, digests[table], lo, hi)
+        return changed + self._sync_engins(digests['engins'])
+
+    def _sync_days(self, table: str, leaves: Dict[str, bytes], lo: int, hi: int) -> int:
+        """Met à jour les jours de la plage ; les jours hors plage restent en cache."""
+        tree = self._day_trees[table]
+        known = self._leaves[table]
+        changed = 0
+        for day, data in leaves.items():
+            if known.get(day) != data:
+                tree.set(DayMerkleTree.position(day), data)
+                known[day] = data
+                changed += 1
+        # Jours de la plage disparus des données
+        for day in [d for d in known if d not in leaves and lo <= DayMerkleTree.position(d) < hi]:
+            tree.set(DayMerkleTree.position(day), None)
+            del known[day]
+            changed += 1
+        return changed
+
+    def _sync_engins(self, leaves: Dict[str, bytes]) -> int:
+        keys = sorted(leaves)
+        previous = self._leaves['engins']
+        if keys != self._engin_keys:
+            self._engins = MerkleTree(leaves[key] for key in keys)
+            self._engin_keys = keys
+            self._leaves['engins'] = dict(leaves)
+            return len(keys)
+        changed = 0
+        for position, key in enumerate(keys):
+            if leaves[key] != previous[key]:
+                self._engins.update(position, leaves[key])
+                changed += 1
+        self._leaves['engins'] = dict(leaves)
+        return changed
+
+    @property
+    def root(self) -> bytes:
+        """Racine globale de la période."""
+        return hashlib.sha256(b''.join(self.table_roots()[table] for table in self.TABLES)).digest()
+
+    def table_roots(self) -> Dict[str, bytes]:
+        """Racines de chaque table."""
+        roots = {table: self._day_trees[table].range_root(*self._range) for table in self.DAY_TABLES}
+        roots['engins'] = self._engins.root
+        return roots
+
+    def proof(self, table: str, key: str) -> Optional[Dict]:
+        """
+        Preuve d'inclusion d'un jour (ou d'un engin) dans la période.
+
+        Returns:
+            Dictionnaire {'leaf', 'path', 'table_roots'} (plus 'part' et 'parts'
+            pour les tables journalières) ou None si la clé est inconnue.
+        """
+        leaf = self._leaves[table].get(key)
+        if leaf is None:
+            return None
+        if table == 'engins':
+            proof = {'path': self._engins.proof(self._engin_keys.index(key))}
+        else:
+            position = DayMerkleTree.position(key)
+            if not self._range[0] <= position < self._range[1]:
+                return None
+            proof = self._day_trees[table].proof(position, *self._range)
+        return {'leaf': leaf, **proof, 'table_roots': self.table_roots()}
+
+    @classmethod
+    def verify(cls, table: str, proof: Dict, root: bytes) -> bool:
+        """Vérifie une preuve produite par proof() contre une racine globale."""
+        table_roots = proof['table_roots']
+        if table == 'engins':
+            valid = MerkleTree.verify(proof['leaf'], proof['path'], table_roots[table])
+        else:
+            valid = DayMerkleTree.verify(proof['leaf'], proof, table_roots[table])
+        if not valid:
+            return False
+        return hashlib.sha256(b''.join(table_roots[t] for t in cls.TABLES)).digest() == root
@@ -0,0 +1,187 @@
+"""
+Calcul de portefeuille multi-sites (plusieurs ports secs).
+"""
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from ..config import ENGINS_FROM_OPERATIONS, FINANCIAL_PARAMS
+from ..data.generator import DataGenerator
+from ..data.loader import parse_pool
+from ..data.models import FinancialMetrics, PeriodData, PortfolioMetrics, SiteConfig
+from ..utils.logger import setup_logger
+from .calculator import FinancialCalculator
+
+logger = setup_logger(__name__)
+
+
+def _load_site(site: SiteConfig, start_date: datetime, end_date: datetime) -> PeriodData:
+    """Charge les données d'un site (fichiers si data_dir, sinon générateur)."""
+    if site.data_dir is not None:
+        from ..data.repository import FileDataRepository
+        return FileDataRepository(
+            site.data_dir, engins_from_operations=ENGINS_FROM_OPERATIONS
+        ).get_period_data(start_date, end_date)
+    return DataGenerator(site.data_hash).create_period_data(
+        start_date, end_date, use_current_time=False
+    )
+
+
+def _calculate_site(params: SimpleNamespace, site: SiteConfig, period_data: PeriodData) -> FinancialMetrics:
+    """Calcule les métriques d'un site (fonction de module pour être picklable)."""
+    return FinancialCalculator(params, data_hash=site.data_hash).calculate(period_data)
+
+
+class PortfolioCalculator:
+    """
+    Charge et calcule plusieurs sites en parallèle.
+
+    Le chargement (I/O) passe par un pool de threads ; le calcul par un pool
+    de processus partagé (parse_pool, lancé par spawn) pour exploiter tous les
+    cœurs, ou par un pool de threads si use_processes=False.
+    """
+
+    def __init__(
+        self,
+        session_state,
+        sites: List[SiteConfig],
+        max_workers: Optional[int] = None,
+        use_processes: bool = True
+    ):
+        names = [site.name for site in sites]
+        if len(set(names)) != len(names):
+            raise ValueError("Les noms de sites du portefeuille doivent être uniques.")
+        self.sites = sites
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_processes = use_processes
+        # Instantané picklable des paramètres financiers (session_state ne l'est pas)
+        calc = FinancialCalculator(session_state)
+        self.params = SimpleNamespace(**{key: calc._get_param(key) for key in FINANCIAL_PARAMS})
+
+    def load(self, start_date: datetime, end_date: datetime) -> Dict[str, PeriodData]:
+        """Charge les PeriodData de tous les sites en parallèle."""
+        results, _ = self._load_all(start_date, end_date)
+        return results
+
+    def _load_all(self, start_date: datetime, end_date: datetime):
+        results, failed = {}, {}
+        workers = min(self.max_workers * 2, max(1, len(self.sites)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                site.name: pool.submit(_load_site, site, start_date, end_date)
+                for site in self.sites
+            }
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.error(f"Chargement impossible pour le site {name}: {e}")
+                    failed[name] = str(e)
+        return results, failed
+
+    def calculate(self, start_date: datetime, end_date: datetime) -> PortfolioMetrics:
+        """Calcule les métriques par site puis consolidées."""
+        period_data, failed = self._load_all(start_date, end_date)
+        sites_by_name = {site.name: site for site in self.sites}
+
+        if self.use_processes and len(period_data) > 1:
+            site_metrics = self._calculate_all(parse_pool(), period_data, sites_by_name, failed)
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, max(1, len(period_data)))) as pool:
+                site_metrics = self._calculate_all(pool, period_data, sites_by_name, failed)
+
+        # Ordre des sites conservé tel que configuré
+        ordered = {site.name: site_metrics[site.name] for site in self.sites if site.name in site_metrics}
+        period_name = f"{start_date.strftime('%d/%m/%Y')} au {end_date.strftime('%d/%m/%Y')}"
+        return PortfolioMetrics(
+            sites=ordered,
+            consolidated=consolidate_metrics(ordered, period_name, self.params),
+            failed_sites=failed
+        )
+
+
+    def _calculate_all(self, pool, period_data, sites_by_name, failed) -> Dict[str, FinancialMetrics]:
+        futures = {
+            name: pool.submit(_calculate_site, self.params, sites_by_name[name], data)
+            for name, data in period_data.items()
+        }
+        site_metrics = {}
+        for name, future in futures.items():
+            try:
+                site_metrics[name] = future.result()
+            except Exception as e:
+                logger.error(f"Calcul impossible pour le site {name}: {e}")
+                failed[name] = str(e)
+        return site_metrics
+
+
+def consolidate_metrics(
+    site_metrics: Dict[str, FinancialMetrics],
+    period_name: str,
+    params: SimpleNamespace
+) -> FinancialMetrics:
+    """
+    Agrège les métriques de plusieurs sites.
+
+    Les gains sont additionnés site par site (les planchers à zéro de chaque
+    site sont conservés) ; le fixe mensuel est compté une seule fois.
+    """
+    metrics_list = list(site_metrics.values())
+    summaries = [m.period_summary for m in metrics_list]
+
+    daily_gains = sum(m.daily_gains for m in metrics_list)
+    period_gains = sum(m.period_gains for m in metrics_list)
+    monthly_projection = sum(m.monthly_projection for m in metrics_list)
+
+    breakdown = {}
+    for m in metrics_list:
+        for key, value in m.breakdown.items():
+            breakdown[key] = round(breakdown.get(key, 0) + value, 2)
+
+    total_ops = sum(s['total_operations'] for s in summaries)
+    total_errors = sum(s['total_errors'] for s in summaries)
+    total_days = max((s['total_days'] for s in summaries), default=0)
+    avg_duration = (
+        sum(s['avg_duration'] * s['total_operations'] for s in summaries) / total_ops
+        if total_ops > 0 else 0
+    )
+
+    working_days = params.working_days
+    daily_fixed = params.monthly_fixed / working_days if working_days > 0 else 0
+    daily_commission = daily_fixed + daily_gains * params.commission_rate
+    monthly_commission = params.monthly_fixed + monthly_projection * params.commission_rate
+
+    # Hash de vérification : chaîne des hashes de chaque site
+    hash_string = ":".join(f"{name}={m.transaction_hash}" for name, m in site_metrics.items())
+    transaction_hash = hashlib.sha256(hash_string.encode()).hexdigest()[:16]
+
+    period_summary = {
+        'selected_period': period_name,
+        'start_date': summaries[0]['start_date'] if summaries else '',
+        'end_date': summaries[0]['end_date'] if summaries else '',
+        'total_days': total_days,
+        'total_operations': int(total_ops),
+        'avg_daily_operations': round(total_ops / total_days, 1) if total_days > 0 else 0,
+        'avg_duration': round(avg_duration, 1),
+        'total_errors': int(total_errors),
+        'error_rate': round(total_errors / total_ops * 100, 1) if total_ops > 0 else 0,
+        'period_gains': round(period_gains, 2)
+    }
+
+    return FinancialMetrics(
+        daily_gains=round(daily_gains, 2),
+        monthly_projection=round(monthly_projection, 2),
+        period_gains=round(period_gains, 2),
+        your_commission_today=round(daily_commission, 2),
+        your_commission_monthly=round(monthly_commission, 2),
+        breakdown=breakdown,
+        transaction_hash=f"0x{transaction_hash}",
+        period_summary=period_summary,
+        metrics={
+            'sites': len(metrics_list),
+            'site_gains': {name: m.period_gains for name, m in site_metrics.items()}
+        }
+    )
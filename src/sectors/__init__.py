@@ -1,19 +1,30 @@
-from .telecom import TelecomSector
-from .logistics import LogisticsSector
-from .retail import RetailSector
-from .education import EducationSector
+from ..utils.registry import PluginRegistry
+
+# Secteurs internes : chaque module (et ses graphiques) n'est importé qu'à la demande
+sectors = PluginRegistry(
+    'opsgain.sectors',
+    {
+        'telecom': '.telecom:TelecomSector',
+        'logistics': '.logistics:LogisticsSector',
+        'retail': '.retail:RetailSector',
+        'education': '.education:EducationSector',
+    },
+    package=__package__,
+    unknown_message="Secteur inconnu : {}"
+)
 
 class SectorFactory:
     @staticmethod
     def get_sector(sector_name: str):
-        sector_name = sector_name.lower()
-        if sector_name == 'telecom':
-            return TelecomSector()
-        elif sector_name == 'logistics':
-            return LogisticsSector()
-        elif sector_name == 'retail':
-            return RetailSector()
-        elif sector_name == 'education':
-            return EducationSector()
-        else:
-            raise ValueError(f"Secteur inconnu : {sector_name}")
\ No newline at end of file
+        """Instance partagée du secteur (les secteurs sont sans état)."""
+        return sectors.get(sector_name)
+
+    @staticmethod
+    def available():
+        """Noms des secteurs disponibles, plugins inclus."""
+        return sectors.names()
+
+    @staticmethod
+    def register(sector_name: str, target):
+        """Déclare un secteur ('module:Classe' ou classe)."""
+        sectors.register(sector_name, target)
\ No newline at end of file
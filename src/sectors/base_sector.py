@@ -1,10 +1,25 @@
 from abc import ABC, abstractmethod
 import pandas as pd
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 class BaseSector(ABC):
     """Classe de base pour un secteur d'activité."""
 
+    # Colonne temporelle des données brutes (filtre de période à la lecture)
+    date_column: Optional[str] = None
+    # Vrai si les dates brutes sont au format jour/mois/année
+    dayfirst: bool = False
+    # Agrégations exécutables à la source (connecteurs SQL) :
+    # {nom: {'group_by': {alias: colonne | (fonction, colonne)}, 'metrics': {alias: (fonction, colonne)}}}
+    aggregations: Dict[str, Dict[str, Any]] = {}
+    # Schéma des données brutes, vérifié avant transform() (voir src/data/validation.py) :
+    # {colonne: {'type', 'required', 'nullable', 'min', 'max', 'allowed', 'unique'}}
+    schema: Dict[str, Dict[str, Any]] = {}
+    # Contraintes entre colonnes, ex. ('date_arrivee', '>=', 'date_depart')
+    relations: List[Tuple[str, str, str]] = []
+    # Colonnes identifiant un enregistrement (déduplication des extraits qui se recoupent)
+    natural_key: List[str] = []
+
     @abstractmethod
     def transform(self, raw_data: pd.DataFrame) -> pd.DataFrame:
         """
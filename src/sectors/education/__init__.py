@@ -6,6 +6,35 @@ from .data_simulator import generate_sample_data
 from ..base_sector import BaseSector
 
 class EducationSector(BaseSector):
+    date_column = 'date_cours'
+    natural_key = ['date_cours', 'classe', 'matiere']
+    schema = {
+        'date_cours': {'type': 'datetime', 'required': True, 'nullable': False},
+        'duree_minutes': {'type': 'numeric', 'required': True, 'min': 0},
+        'nb_eleves_presents': {'type': 'numeric', 'required': True, 'min': 0},
+        'nb_eleves_inscrits': {'type': 'numeric', 'required': True, 'min': 0},
+        'note_moyenne': {'type': 'numeric', 'min': 0, 'max': 20}
+    }
+    relations = [('nb_eleves_presents', '<=', 'nb_eleves_inscrits')]
+    aggregations = {
+        'daily': {
+            'group_by': {'date': ('date', 'date_cours')},
+            'metrics': {
+                'nb_cours': ('count', '*'),
+                'duree_totale': ('sum', 'duree_minutes'),
+                'eleves_presents': ('sum', 'nb_eleves_presents')
+            }
+        },
+        'per_equipment': {
+            'group_by': {'classe': 'classe'},
+            'metrics': {
+                'nb_cours': ('count', '*'),
+                'duree_totale': ('sum', 'duree_minutes'),
+                'eleves_presents': ('sum', 'nb_eleves_presents')
+            }
+        }
+    }
+
     def transform(self, raw_data):
         return transform(raw_data)
 
@@ -6,6 +6,36 @@ from .data_simulator import generate_sample_data
 from ..base_sector import BaseSector
 
 class LogisticsSector(BaseSector):
+    date_column = 'date_depart'
+    natural_key = ['livraison_id']
+    schema = {
+        'livraison_id': {'unique': True},
+        'date_depart': {'type': 'datetime', 'required': True, 'nullable': False},
+        'date_arrivee': {'type': 'datetime', 'required': True},
+        'distance_km': {'type': 'numeric', 'required': True, 'min': 0},
+        'carburant_litres': {'type': 'numeric', 'required': True, 'min': 0},
+        'statut': {'required': True}
+    }
+    relations = [('date_arrivee', '>=', 'date_depart')]
+    aggregations = {
+        'daily': {
+            'group_by': {'date': ('date', 'date_depart')},
+            'metrics': {
+                'nb_livraisons': ('count', '*'),
+                'distance_totale': ('sum', 'distance_km'),
+                'carburant_total': ('sum', 'carburant_litres')
+            }
+        },
+        'per_equipment': {
+            'group_by': {'vehicule': 'vehicule'},
+            'metrics': {
+                'nb_livraisons': ('count', '*'),
+                'distance_totale': ('sum', 'distance_km'),
+                'carburant_total': ('sum', 'carburant_litres')
+            }
+        }
+    }
+
     def transform(self, raw_data):
         return transform(raw_data)
 
@@ -6,6 +6,32 @@ from .data_simulator import generate_sample_data
 from ..base_sector import BaseSector
 
 class RetailSector(BaseSector):
+    date_column = 'date_transaction'
+    dayfirst = True
+    schema = {
+        'date_transaction': {'type': 'datetime', 'required': True, 'nullable': False},
+        'quantite': {'type': 'numeric', 'required': True, 'min': 0},
+        'prix_unitaire': {'type': 'numeric', 'required': True, 'min': 0},
+        'nb_employes_presents': {'type': 'numeric', 'min': 0},
+        'duree_ouverture_heures': {'type': 'numeric', 'min': 0, 'max': 24}
+    }
+    aggregations = {
+        'daily': {
+            'group_by': {'date': ('date', 'date_transaction')},
+            'metrics': {
+                'nb_transactions': ('count', '*'),
+                'quantite_totale': ('sum', 'quantite')
+            }
+        },
+        'per_equipment': {
+            'group_by': {'magasin': 'magasin'},
+            'metrics': {
+                'nb_transactions': ('count', '*'),
+                'quantite_totale': ('sum', 'quantite')
+            }
+        }
+    }
+
     def transform(self, raw_data):
         return transform(raw_data)
 
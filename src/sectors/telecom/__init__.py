@@ -6,6 +6,36 @@ from .data_simulator import generate_sample_data
 from ..base_sector import BaseSector
 
 class TelecomSector(BaseSector):
+    date_column = 'date_ouverture'
+    natural_key = ['ticket_id']
+    schema = {
+        'ticket_id': {'unique': True},
+        'date_ouverture': {'type': 'datetime', 'required': True, 'nullable': False},
+        'date_resolution': {'type': 'datetime'},
+        'duree_minutes': {'type': 'numeric', 'min': 0},
+        'urgence': {'type': 'numeric', 'allowed': [0, 1, 2]},
+        'satisfaction_client': {'type': 'numeric', 'min': 1, 'max': 5}
+    }
+    relations = [('date_resolution', '>=', 'date_ouverture')]
+    aggregations = {
+        'daily': {
+            'group_by': {'date': ('date', 'date_ouverture')},
+            'metrics': {
+                'nb_tickets': ('count', '*'),
+                'duree_totale': ('sum', 'duree_minutes'),
+                'duree_moyenne': ('avg', 'duree_minutes')
+            }
+        },
+        'per_equipment': {
+            'group_by': {'equipement': 'equipement'},
+            'metrics': {
+                'nb_tickets': ('count', '*'),
+                'duree_totale': ('sum', 'duree_minutes'),
+                'duree_moyenne': ('avg', 'duree_minutes')
+            }
+        }
+    }
+
     def transform(self, raw_data):
         return transform(raw_data)
 
@@ -90,8 +90,25 @@ def generate_excel_report(period_data, financial_metrics):
         for cell in sheet5[1]:
             cell.font = Font(bold=True)
 
+        # --- Feuille 6 : Gains journaliers ---
+        money_sheets = [sheet2, sheet3, sheet4, sheet5]
+        daily_series = getattr(financial_metrics, 'daily_series', None)
+        if daily_series is not None and not daily_series.empty:
+            daily_series.rename(columns={
+                'date': 'Date',
+                'time_gain': 'Temps ($)',
+                'error_gain': 'Erreurs ($)',
+                'maintenance_gain': 'Maintenance ($)',
+                'fuel_gain': 'Carburant ($)',
+                'total_gain': 'Total ($)'
+            }).to_excel(writer, sheet_name='Gains journaliers', index=False)
+            sheet6 = writer.sheets['Gains journaliers']
+            for cell in sheet6[1]:
+                cell.font = Font(bold=True)
+            money_sheets.append(sheet6)
+
         # Format monétaire pour les colonnes de gains
-        for sheet in [sheet2, sheet3, sheet4, sheet5]:
+        for sheet in money_sheets:
             for row in sheet.iter_rows(min_row=2, max_row=sheet.max_row):
                 for cell in row:
                     if isinstance(cell.value, (int, float)):
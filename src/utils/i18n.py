@@ -46,7 +46,8 @@ class I18n:
                 "total_operations": "📦 Opérations Total",
                 "avg_duration": "⏱️ Durée Moyenne",
                 "error_rate": "❌ Taux d'Erreur",
-                "total_gains": "💰 Gains Totaux Période"
+                "total_gains": "💰 Gains Totaux Période",
+                "vs_previous": "{delta} vs période précédente"
             },
             "periods": {
                 "last_7_days": "7 derniers jours",
@@ -0,0 +1,98 @@
+"""
+Registre de plugins à résolution paresseuse (connecteurs, secteurs).
+"""
+import importlib
+import threading
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, List, Optional, Union
+
+
+class PluginRegistry:
+    """
+    Associe un nom à une implémentation désignée par 'module:attribut'.
+
+    Le module n'est importé qu'à la première demande ; les plugins tiers sont
+    déclarés par points d'entrée (groupe `group`) et chargés au premier nom
+    inconnu. Les instances sont mises en cache par nom et options.
+
+    Si la classe définit from_config(**options), c'est elle qui construit
+    l'instance ; sinon la classe est appelée sans argument.
+    """
+
+    def __init__(
+        self,
+        group: str,
+        builtins: Dict[str, str],
+        package: Optional[str] = None,
+        unknown_message: str = "Plugin inconnu : {}"
+    ):
+        self.group = group
+        self.package = package
+        self.unknown_message = unknown_message
+        self._targets: Dict[str, Union[str, Callable]] = dict(builtins)
+        self._resolved: Dict[str, Callable] = {}
+        self._instances: Dict[tuple, Any] = {}
+        self._entry_points_loaded = False
+        self._lock = threading.RLock()
+
+    def register(self, name: str, target: Union[str, Callable]) -> None:
+        """Déclare (ou remplace) une implémentation : 'module:attribut' ou classe."""
+        name = name.lower()
+        with self._lock:
+            self._targets[name] = target
+            self._resolved.pop(name, None)
+            for key in [k for k in self._instances if k[0] == name]:
+                del self._instances[key]
+
+    def _load_entry_points(self) -> None:
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        for entry_point in entry_points(group=self.group):
+            # Les implémentations internes restent prioritaires
+            self._targets.setdefault(entry_point.name.lower(), entry_point.value)
+
+    def names(self) -> List[str]:
+        """Noms disponibles (internes et points d'entrée), sans rien importer."""
+        with self._lock:
+            self._load_entry_points()
+            return sorted(self._targets)
+
+    def get_class(self, name: str) -> Callable:
+        """Classe associée au nom (importée à la première demande)."""
+        name = name.lower()
+        with self._lock:
+            resolved = self._resolved.get(name)
+            if resolved is not None:
+                return resolved
+            if name not in self._targets:
+                self._load_entry_points()
+            target = self._targets.get(name)
+            if target is None:
+                raise ValueError(self.unknown_message.format(name))
+            if isinstance(target, str):
+                module_name, _, attribute = target.partition(':')
+                target = getattr(importlib.import_module(module_name, self.package), attribute)
+            self._resolved[name] = target
+            return target
+
+    def create(self, name: str, **options) -> Any:
+        """Nouvelle instance, construite par from_config() si la classe la définit."""
+        cls = self.get_class(name)
+        factory = getattr(cls, 'from_config', None)
+        return factory(**options) if factory is not None else cls()
+
+    def get(self, name: str, **options) -> Any:
+        """Instance partagée pour ce nom et ces options (créée au premier appel)."""
+        try:
+            key = (name.lower(), tuple(sorted(options.items())))
+            hash(key)
+        except TypeError:
+            # Options non hachables (ex. fabrique de connexions) : instance dédiée
+            return self.create(name, **options)
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is None:
+                instance = self.create(name, **options)
+                self._instances[key] = instance
+            return instance
@@ -131,6 +131,56 @@ class ChartGenerator:
         
         return fig
     
+    @staticmethod
+    def create_daily_gains_chart(daily_series: pd.DataFrame) -> go.Figure:
+        """Crée un graphique empilé de l'évolution des gains journaliers."""
+        fig = go.Figure()
+
+        components = [
+            ('time_gain', 'Gain Temps', COLORS['secondary']),
+            ('error_gain', 'Gain Erreurs', COLORS['info']),
+            ('maintenance_gain', 'Gain Maintenance', COLORS['warning']),
+            ('fuel_gain', 'Gain Carburant', COLORS['danger'])
+        ]
+        for column, name, color in components:
+            fig.add_trace(go.Bar(
+                x=daily_series['date'],
+                y=daily_series[column],
+                name=name,
+                marker_color=color
+            ))
+
+        fig.add_trace(go.Scatter(
+            x=daily_series['date'],
+            y=daily_series['total_gain'],
+            name='Total',
+            line=dict(color=COLORS['dark'], width=2),
+            mode='lines'
+        ))
+
+        fig.update_layout(
+            barmode='relative',
+            title=dict(
+                text="Évolution des Gains Journaliers",
+                font=dict(size=14, color=COLORS['dark'])
+            ),
+            xaxis_title="Date",
+            yaxis_title="Gains ($)",
+            height=350,
+            hovermode='x unified',
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=-0.3,
+                xanchor="center",
+                x=0.5
+            )
+        )
+
+        return fig
+
     @staticmethod
     def create_financial_pie_chart(breakdown: dict) -> go.Figure:
         """Crée un camembert pour la répartition des gains."""
@@ -0,0 +1,37 @@
+from datetime import datetime
+import pandas as pd
+import pytest
+from src.finance.baseline import BaselineEstimator
+
+def make_daily(start, days, duration=50.0, errors=3):
+    return pd.DataFrame({
+        'date': pd.date_range(start, periods=days),
+        'nb_operations': [100] * days,
+        'duree_moyenne': [duration] * days,
+        'erreurs': [errors] * days
+    })
+
+def test_estimate_from_reference_window():
+    estimator = BaselineEstimator(window_days=30)
+    assert estimator.update(make_daily('2026-01-01', 60)) == 60
+    estimate = estimator.estimate(datetime(2026, 3, 1))
+    assert estimate['baseline_duration'] == pytest.approx(50.0)
+    assert estimate['baseline_error_rate'] == pytest.approx(0.03)
+    assert estimate['days'] == 30
+    # Historique insuffisant avant la période
+    assert estimator.estimate(datetime(2026, 1, 3)) is None
+
+@pytest.mark.parametrize('method', ['median', 'trimmed_mean', 'seasonal'])
+def test_incremental_update_invalidates_only_changed_windows(method):
+    estimator = BaselineEstimator(window_days=14, method=method)
+    estimator.update(make_daily('2026-01-01', 28))
+    early = estimator.estimate(datetime(2026, 1, 15))
+    late = estimator.estimate(datetime(2026, 1, 29))
+
+    # Rejouer les mêmes données ne modifie rien
+    assert estimator.update(make_daily('2026-01-01', 28)) == 0
+
+    # Correction de la dernière semaine : seule la fenêtre tardive change
+    assert estimator.update(make_daily('2026-01-22', 7, duration=70.0)) == 7
+    assert estimator.estimate(datetime(2026, 1, 15)) is early
+    assert estimator.estimate(datetime(2026, 1, 29))['baseline_duration'] > late['baseline_duration']
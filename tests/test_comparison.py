@@ -0,0 +1,65 @@
+import os
+from datetime import datetime
+import pandas as pd
+import pytest
+from src.data.sync import DataSynchronizer
+from src.finance.calculator import FinancialCalculator
+from src.finance.comparison import PeriodComparator
+
+def test_previous_period_bounds_same_length_no_overlap():
+    start, end = datetime(2026, 2, 1), datetime(2026, 2, 28, 23, 59)
+    prev_start, prev_end = DataSynchronizer.previous_period_bounds(start, end)
+    assert prev_end < start
+    assert (prev_start, prev_end) == (datetime(2026, 1, 4), datetime(2026, 1, 31, 23, 59, 59, 999999))
+
+def test_previous_period_counts_whole_days_for_midnight_end():
+    # Lien partagé : dates sans heure, la fin est à minuit mais le jour compte en entier
+    prev_start, prev_end = DataSynchronizer.previous_period_bounds(datetime(2026, 1, 2), datetime(2026, 1, 3))
+    assert (prev_start, prev_end) == (datetime(2025, 12, 31), datetime(2026, 1, 1, 23, 59, 59, 999999))
+    assert (prev_end.date() - prev_start.date()).days + 1 == 2
+
+def test_period_cache_key_follows_source_files(tmp_path):
+    from src.data.repository import FileDataRepository
+    from tests.test_repository import write_files
+    write_files(tmp_path, [1, 2, 3])
+    sync = DataSynchronizer(use_real_data=False)
+    sync.data_mode, sync.data_repo = "file", FileDataRepository(tmp_path)
+    start, end = datetime(2026, 1, 1), datetime(2026, 1, 3)
+    key = sync._cache_key(start, end)
+    assert sync._cache_key(start, end) == key
+    write_files(tmp_path, [1, 2, 3, 4])
+    assert sync._cache_key(start, end) != key
+
+def test_compare_uses_cached_previous_period():
+    sync = DataSynchronizer(use_real_data=False)
+    calc = FinancialCalculator(type('obj', (object,), {}))
+    current = sync.generator.create_period_data(datetime(2026, 3, 1), datetime(2026, 3, 10), use_current_time=False)
+    comparator = PeriodComparator(sync, calc)
+
+    comparison = comparator.compare(current)
+    assert comparison.has_previous()
+    previous_ops = comparison.previous['total_operations']
+    assert comparison.deltas['total_operations'] == pytest.approx(comparison.current['total_operations'] - previous_ops)
+
+    # Le second appel réutilise la période précédente mise en cache
+    assert sync.load_previous_period_data(current) is sync.load_previous_period_data(current)
+    assert comparator.compare(current).previous == comparison.previous
+
+def test_previous_metrics_follow_rewritten_source(tmp_path):
+    from src.data.repository import FileDataRepository
+    from tests.test_repository import write_files
+    write_files(tmp_path, range(1, 21))
+    pd.DataFrame({'engin': ['A', 'B'], 'total_operations': [500, 450], 'erreurs': [5, 4], 'duree_moyenne': [40.0, 45.0]}).to_csv(
+        tmp_path / 'equipment_performance.csv', index=False)
+    sync = DataSynchronizer(use_real_data=False)
+    sync.data_mode, sync.data_repo = "file", FileDataRepository(tmp_path)
+    comparator = PeriodComparator(sync, FinancialCalculator(type('obj', (object,), {})))
+    current = sync.data_repo.get_period_data(datetime(2026, 1, 11), datetime(2026, 1, 20, 23, 59))
+    before = comparator.compare(current).previous['total_operations']
+
+    # Même période précédente, fichier réécrit avec trois fois plus d'opérations
+    daily = pd.read_csv(tmp_path / 'daily_operations.csv')
+    daily.assign(nb_operations=daily['nb_operations'] * 3).to_csv(tmp_path / 'daily_operations.csv', index=False)
+    stat = os.stat(tmp_path / 'daily_operations.csv')
+    os.utime(tmp_path / 'daily_operations.csv', ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert comparator.compare(current).previous['total_operations'] == pytest.approx(before * 3)
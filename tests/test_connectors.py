@@ -0,0 +1,422 @@
+import gzip
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import pytest
+import pandas as pd
+from src.connectors.api import APIConnector
+from src.connectors.csv import CSVConnector
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serveur HTTP local simulant une API client."""
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.server.hits.append(url.path)
+        status, payload, headers = self.server.routes[url.path](self, parse_qs(url.query))
+        body = json.dumps(payload).encode() if payload is not None else b''
+        if body and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            headers = dict(headers, **{'Content-Encoding': 'gzip'})
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def api_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.routes, server.hits, server.connections = {}, [], 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    APIConnector.close_sessions()
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def operations_csv(tmp_path):
+    df = pd.DataFrame({
+        'date_depart': pd.date_range('2026-01-01', periods=240, freq='6h').strftime('%Y-%m-%d %H:%M:%S'),
+        'vehicule': ['VH-001', 'VH-002', 'VH-003'] * 80,
+        'distance_km': range(240),
+        'client': ['Client-1'] * 240
+    })
+    path = tmp_path / 'operations.csv'
+    df.to_csv(path, index=False)
+    return path, df
+
+def test_csv_streaming_period_filter_and_projection(operations_csv):
+    path, df = operations_csv
+    source = {'path': str(path), 'start_date': '2026-01-10', 'end_date': '2026-01-20 23:59:59'}
+    result = CSVConnector().read(source, chunksize=50, date_column='date_depart', usecols=['vehicule', 'distance_km'])
+
+    dates = pd.to_datetime(df['date_depart'])
+    expected = df[(dates >= '2026-01-10') & (dates <= '2026-01-20 23:59:59')]
+    assert list(result.columns) == ['vehicule', 'distance_km']
+    assert len(result) == len(expected)
+    assert result['distance_km'].tolist() == expected['distance_km'].tolist()
+
+def test_csv_streaming_partial_aggregates(operations_csv):
+    path, df = operations_csv
+    result = CSVConnector().read(
+        str(path),
+        chunksize=7,
+        aggregate=lambda chunk: chunk.groupby('vehicule')['distance_km'].sum().to_frame(),
+        combine=lambda partials: partials.groupby(level=0).sum()
+    )
+    assert result['distance_km'].to_dict() == df.groupby('vehicule')['distance_km'].sum().to_dict()
+
+def test_parquet_skips_row_groups_outside_period(tmp_path, monkeypatch):
+    from src.connectors.parquet import ParquetConnector
+    df = pd.DataFrame({
+        'date_ouverture': pd.date_range('2026-01-01', periods=1000, freq='h'),
+        'ticket_id': range(1000),
+        'duree_minutes': [30.0] * 1000
+    })
+    path = tmp_path / 'tickets.parquet'
+    connector = ParquetConnector()
+    connector.write(df, str(path), row_group_size=100)
+
+    read_groups = []
+    original = ParquetConnector._overlapping_row_groups
+    monkeypatch.setattr(ParquetConnector, '_overlapping_row_groups', staticmethod(
+        lambda *args: read_groups.extend(original(*args)) or read_groups
+    ))
+    source = {'path': str(path), 'start_date': '2026-01-10', 'end_date': '2026-01-12 23:59:59'}
+    result = connector.read(source, columns=['ticket_id'], date_column='date_ouverture', dtype_backend='pyarrow')
+
+    expected = df[(df['date_ouverture'] >= '2026-01-10') & (df['date_ouverture'] <= '2026-01-12 23:59:59')]
+    assert result['ticket_id'].tolist() == expected['ticket_id'].tolist()
+    assert list(result.columns) == ['ticket_id']
+    assert isinstance(result['ticket_id'].dtype, pd.ArrowDtype)
+    assert len(read_groups) < 10
+
+def test_parquet_period_bounds_on_date_and_timezone_columns(tmp_path):
+    from src.connectors.parquet import ParquetConnector
+    connector = ParquetConnector()
+    days = pd.date_range('2026-01-01', periods=10)
+    path = tmp_path / 'jours.parquet'
+    connector.write(pd.DataFrame({'jour': days.date, 'n': range(10)}), str(path), row_group_size=3)
+    # Début « N derniers jours » avec une heure : le premier jour reste inclus
+    source = {'path': str(path), 'start_date': datetime(2026, 1, 3, 8), 'end_date': datetime(2026, 1, 5, 8)}
+    assert connector.read(source, date_column='jour')['n'].tolist() == [2, 3, 4]
+
+    path = tmp_path / 'paris.parquet'
+    stamps = pd.date_range('2026-01-01 00:30', periods=48, freq='h', tz='Europe/Paris')
+    connector.write(pd.DataFrame({'t': stamps, 'n': range(48)}), str(path), row_group_size=5)
+    # Bornes naïves : heures locales du fuseau de la colonne, pour le filtre comme pour les statistiques
+    source = {'path': str(path), 'start_date': datetime(2026, 1, 2), 'end_date': datetime(2026, 1, 2, 23, 59)}
+    result = connector.read(source, date_column='t')
+    assert result['n'].tolist() == list(range(24, 48))
+
+def test_excel_stream_mode_and_parallel_sheets(tmp_path):
+    from src.connectors.excel import ExcelConnector
+    path = tmp_path / 'classeur.xlsx'
+    cours = pd.DataFrame({
+        'date_cours': pd.date_range('2026-01-05', periods=20),
+        'classe': ['6ème A', '6ème B'] * 10,
+        'duree_minutes': [45, 60, 90, 60] * 5
+    })
+    with pd.ExcelWriter(path) as writer:
+        cours.to_excel(writer, sheet_name='Cours', index=False)
+        cours.head(5).to_excel(writer, sheet_name='Semaine', index=False)
+
+    connector = ExcelConnector()
+    streamed = connector.read(str(path), sheet_name='Cours', mode='stream', usecols=['date_cours', 'duree_minutes'])
+    assert list(streamed.columns) == ['date_cours', 'duree_minutes']
+    assert pd.api.types.is_datetime64_any_dtype(streamed['date_cours'])
+    assert streamed['duree_minutes'].tolist() == cours['duree_minutes'].tolist()
+
+    sheets = connector.read(str(path), sheet_name=['Cours', 'Semaine'], mode='stream', max_workers=2)
+    assert {name: len(df) for name, df in sheets.items()} == {'Cours': 20, 'Semaine': 5}
+
+    # Blocs typés de chunk_rows lignes : seul un bloc est gardé en objets Python
+    from src.connectors.excel import _stream_chunks
+    chunks = list(_stream_chunks(str(path), 'Cours', dtype={'duree_minutes': 'float32'}, chunk_rows=6))
+    assert [len(chunk) for chunk in chunks] == [6, 6, 6, 2]
+    assert all(chunk['duree_minutes'].dtype == 'float32' for chunk in chunks)
+    chunked = connector.read(str(path), sheet_name='Cours', mode='stream', dtype={'duree_minutes': 'float32'}, chunk_rows=6)
+    pd.testing.assert_frame_equal(chunked, cours.astype({'duree_minutes': 'float32'}), check_dtype=False)
+    assert chunked['duree_minutes'].dtype == 'float32'
+
+
+def test_api_pooled_session_reuses_connections_and_retries(api_server):
+    rows = [{'ticket_id': i, 'duree_minutes': 30 + i} for i in range(50)]
+    api_server.routes['/tickets'] = lambda handler, query: (200, {'data': {'tickets': rows}}, {})
+    failures = {'left': 2}
+
+    def flaky(handler, query):
+        if failures['left']:
+            failures['left'] -= 1
+            return 503, {'error': 'indisponible'}, {}
+        return 200, rows[:3], {}
+    api_server.routes['/flaky'] = flaky
+
+    connector = APIConnector(retries=3, backoff_factor=0)
+    for _ in range(5):
+        df = connector.read(f"{api_server.base_url}/tickets", json_path='data.tickets')
+        assert len(df) == 50
+    # Keep-alive : une seule connexion TCP pour les cinq appels
+    assert api_server.connections == 1
+    # Pool partagé entre instances, session (et cookies) propre à chacune
+    assert APIConnector().adapter is APIConnector().adapter
+    assert APIConnector().session is not APIConnector().session
+
+    df = connector.read(f"{api_server.base_url}/flaky")
+    assert len(df) == 3
+    assert api_server.hits.count('/flaky') == 3
+
+
+def test_api_cookie_set_for_one_connector_is_not_sent_by_another(api_server):
+    sent = []
+
+    def login(handler, query):
+        sent.append(handler.headers.get('Cookie'))
+        return 200, [{'ok': 1}], {'Set-Cookie': 'sessionid=USER_A_SECRET; Path=/'}
+    api_server.routes['/login'] = login
+
+    first, second = APIConnector(), APIConnector()
+    first.read(f"{api_server.base_url}/login")
+    first.read(f"{api_server.base_url}/login")
+    second.read(f"{api_server.base_url}/login")
+    # Cookie explicitement passé : envoyé pour cette requête seulement
+    second.read(f"{api_server.base_url}/login", cookies={'sessionid': 'USER_B'})
+    assert sent == [None, None, None, 'sessionid=USER_B']
+
+def test_api_paginated_reads_assemble_pages_in_order(api_server):
+    rows = [{'id': i, 'duree_minutes': i % 60} for i in range(1050)]
+
+    def paged(handler, query):
+        page, size = int(query['page'][0]), int(query['per_page'][0])
+        return 200, {'items': rows[(page - 1) * size:page * size], 'meta': {'total': len(rows)}}, {}
+
+    def offset(handler, query):
+        start, limit = int(query['offset'][0]), int(query['limit'][0])
+        return 200, rows[start:start + limit], {}
+
+    def cursor(handler, query):
+        start = int(query.get('cursor', ['0'])[0])
+        following = start + 400 if start + 400 < len(rows) else None
+        return 200, {'items': rows[start:start + 400], 'next': following}, {}
+
+    api_server.routes.update({'/paged': paged, '/offset': offset, '/cursor': cursor})
+    connector = APIConnector(backoff_factor=0)
+
+    df = connector.read(f"{api_server.base_url}/paged", json_path='items',
+                        pagination={'type': 'page', 'total_path': 'meta.total'}, concurrency=4)
+    assert df['id'].tolist() == list(range(1050))
+    assert api_server.hits.count('/paged') == 11
+
+    df = connector.read(f"{api_server.base_url}/offset", pagination={'type': 'offset', 'page_size': 250}, concurrency=3)
+    assert df['id'].tolist() == list(range(1050))
+
+    df = connector.read(f"{api_server.base_url}/cursor", json_path='items',
+                        pagination={'type': 'cursor', 'next_path': 'next'})
+    assert df['id'].tolist() == list(range(1050))
+    assert api_server.hits.count('/cursor') == 3
+
+
+def test_api_conditional_cache_serves_frame_on_304(api_server, tmp_path):
+    state = {'etag': '"v1"', 'rows': [{'id': i, 'engin': f"E{i % 3}"} for i in range(20)]}
+
+    def versioned(handler, query):
+        if handler.headers.get('If-None-Match') == state['etag']:
+            return 304, None, {'ETag': state['etag']}
+        return 200, state['rows'], {'ETag': state['etag']}
+    api_server.routes['/versioned'] = versioned
+
+    connector = APIConnector(backoff_factor=0, cache_dir=tmp_path / 'api')
+    first = connector.read(f"{api_server.base_url}/versioned")
+    # Nouveau connecteur : l'index est relu depuis le disque
+    second = APIConnector(backoff_factor=0, cache_dir=tmp_path / 'api').read(f"{api_server.base_url}/versioned")
+    pd.testing.assert_frame_equal(first, second)
+    assert any(p.suffix == '.arrow' for p in (tmp_path / 'api').iterdir())
+
+    state.update(etag='"v2"', rows=state['rows'][:5])
+    assert len(connector.read(f"{api_server.base_url}/versioned")) == 5
+    assert connector.cache.total_bytes > 0
+
+
+def test_api_cache_is_keyed_by_credentials_and_shared_between_instances(api_server, tmp_path):
+    from src.connectors.http_cache import ResponseCache
+
+    def private(handler, query):
+        token = handler.headers.get('Authorization')
+        if handler.headers.get('If-None-Match') == f'"{token}"':
+            return 304, None, {'ETag': f'"{token}"'}
+        return 200, [{'owner': token}], {'ETag': f'"{token}"'}
+    api_server.routes['/private'] = private
+
+    url = f"{api_server.base_url}/private"
+    alice = APIConnector(backoff_factor=0, cache_dir=tmp_path / 'api').read(url, headers={'Authorization': 'alice'})
+    bob = APIConnector(backoff_factor=0, cache_dir=tmp_path / 'api').read(url, headers={'Authorization': 'bob'})
+    assert alice['owner'].tolist() == ['alice'] and bob['owner'].tolist() == ['bob']
+
+    # Deux instances sur le même dossier : aucune entrée perdue, fichiers orphelins comptés
+    first, second = ResponseCache(tmp_path / 'shared', max_bytes=10_000), ResponseCache(tmp_path / 'shared', max_bytes=10_000)
+    frame = pd.DataFrame({'valeur': range(200)})
+    first.store('a', frame, '"1"', None)
+    second.store('b', frame, '"1"', None)
+    assert first.validators('b') and second.validators('a')
+    (tmp_path / 'shared' / 'orphelin.pkl').write_bytes(b'x' * 20_000)
+    first.store('c', frame, '"1"', None)
+    assert first.total_bytes <= 10_000
+    assert not (tmp_path / 'shared' / 'orphelin.pkl').exists()
+    assert first.load('c') is not None
+
+
+def test_sql_period_filter_and_sector_aggregation(tmp_path):
+    import sqlite3
+    from datetime import datetime
+    from src.connectors.sql import SQLConnector
+    from src.data.sync import DataSynchronizer
+    from src.sectors.telecom.data_simulator import generate_sample_data
+
+    database = tmp_path / 'ops.db'
+    tickets = generate_sample_data(start_date=datetime(2026, 1, 1), end_date=datetime(2026, 1, 31))
+    tickets = tickets[['ticket_id', 'date_ouverture', 'equipement', 'duree_minutes', 'resolution_a_distance']]
+    with sqlite3.connect(database) as conn:
+        conn.execute("CREATE TABLE tickets (ticket_id INTEGER, date_ouverture TEXT, equipement TEXT, "
+                     "duree_minutes INTEGER, resolution_a_distance INTEGER)")
+    connector = SQLConnector(str(database), pool_size=2)
+    connector.write(tickets, 'tickets')
+
+    df = connector.read('tickets', date_column='date_ouverture',
+                        start_date=datetime(2026, 1, 10), end_date=datetime(2026, 1, 12, 23, 59))
+    assert set(pd.to_datetime(df['date_ouverture']).dt.day) == {10, 11, 12}
+
+    sync = DataSynchronizer(use_real_data=True, sector_name='telecom', connector_type='sql',
+                            connector_config={'database': str(database)}, data_source='tickets')
+    daily = sync.load_aggregate('daily', datetime(2026, 1, 1), datetime(2026, 1, 31, 23, 59))
+    expected = tickets.groupby(tickets['date_ouverture'].dt.strftime('%Y-%m-%d')).size()
+    assert daily['date'].tolist() == expected.index.tolist()
+    assert daily['nb_tickets'].tolist() == expected.tolist()
+    per_equipment = sync.load_aggregate('per_equipment')
+    assert per_equipment['duree_totale'].sum() == tickets['duree_minutes'].sum()
+
+    with pytest.raises(RuntimeError):
+        connector.read('tickets; DROP TABLE tickets')
+
+    # Colonne texte sans heure : le premier jour de la période est conservé
+    with sqlite3.connect(database) as conn:
+        conn.execute("CREATE TABLE jours (jour TEXT, nb INTEGER)")
+        conn.executemany("INSERT INTO jours VALUES (?, ?)", [(f"2026-01-{d:02d}", d) for d in range(8, 14)])
+    df = connector.read('jours', date_column='jour', start_date=datetime(2026, 1, 10), end_date=datetime(2026, 1, 12))
+    assert df['nb'].tolist() == [10, 11, 12]
+
+    # Horodatages ISO texte séparés par 'T' : le dernier jour est conservé
+    with sqlite3.connect(database) as conn:
+        conn.execute("CREATE TABLE releves (horodatage TEXT, nb INTEGER)")
+        conn.executemany("INSERT INTO releves VALUES (?, ?)",
+                         [(f"2026-01-{d:02d}T08:00:00", d) for d in range(8, 14)])
+    df = connector.read('releves', date_column='horodatage',
+                        start_date=datetime(2026, 1, 10), end_date=datetime(2026, 1, 12, 23, 59, 59))
+    assert df['nb'].tolist() == [10, 11, 12]
+    query, params = connector.build_query('releves', date_column='horodatage',
+                                          start_date=datetime(2026, 1, 10), end_date=datetime(2026, 1, 12, 12))
+    assert query.endswith('"horodatage" <= ?') and params[-1] == '2026-01-12 12:00:00'
+
+
+def test_cached_connector_converts_once_and_filters_period(operations_csv, tmp_path, monkeypatch):
+    from src.connectors.cache import CachedConnector
+    path, df = operations_csv
+    inner = CSVConnector()
+    calls = []
+    original = inner.read
+    monkeypatch.setattr(inner, 'read', lambda *a, **k: calls.append(a) or original(*a, **k))
+    connector = CachedConnector(inner, tmp_path / 'conversions')
+
+    options = dict(date_column='date_depart', usecols=['vehicule', 'distance_km'])
+    january = connector.read({'path': str(path), 'start_date': '2026-01-10', 'end_date': '2026-01-20 23:59:59'}, **options)
+    expected = CSVConnector().read({'path': str(path), 'start_date': '2026-01-10', 'end_date': '2026-01-20 23:59:59'},
+                                   **options)
+    pd.testing.assert_frame_equal(january, expected.reset_index(drop=True))
+    # Autre période, même fichier et mêmes options : servie depuis la conversion Arrow
+    later = connector.read({'path': str(path), 'start_date': '2026-02-01'}, **options)
+    assert len(calls) == 1
+    assert len(later) == (pd.to_datetime(df['date_depart']) >= '2026-02-01').sum()
+
+    # Contenu modifié : nouvelle clé, nouvelle conversion ; limite de taille appliquée
+    df.head(10).to_csv(path, index=False)
+    connector.max_bytes = 0
+    assert len(connector.read(str(path))) == 10
+    assert len(calls) == 2
+    assert not list((tmp_path / 'conversions').glob('*.arrow'))
+
+    # Source au-delà de max_source_bytes : pas de conversion, période transmise au connecteur
+    kwargs = []
+    monkeypatch.setattr(inner, 'read', lambda *a, **k: kwargs.append((a, k)) or original(*a, **k))
+    big = CachedConnector(inner, tmp_path / 'big', max_source_bytes=0)
+    big.read({'path': str(path), 'start_date': '2026-01-01'}, date_column='date_depart')
+    source, options = kwargs[-1]
+    assert source[0]['start_date'] == '2026-01-01' and options['date_column'] == 'date_depart'
+    assert not (tmp_path / 'big').exists()
+
+
+def test_csv_multi_file_skips_by_filename_and_orders_by_date(tmp_path):
+    from datetime import datetime
+    import src.data.loader as loader_module
+    from src.data.sync import DataSynchronizer
+    from src.sectors.logistics.data_simulator import generate_sample_data
+
+    deliveries = generate_sample_data(start_date=datetime(2026, 1, 1), end_date=datetime(2026, 1, 10))
+    days = pd.to_datetime(deliveries['date_depart']).dt.strftime('%Y%m%d')
+    # Fichiers écrits dans le désordre : l'ordre vient de la date du nom
+    for day in sorted(days.unique(), reverse=True):
+        deliveries[days == day].to_csv(tmp_path / f"livraisons_{day}.csv", index=False)
+
+    files = CSVConnector.list_files(str(tmp_path / '*.csv'), datetime(2026, 1, 3), datetime(2026, 1, 5, 23, 59))
+    assert [f[-12:-4] for f in files] == ['20260103', '20260104', '20260105']
+
+    source = {'path': str(tmp_path), 'start_date': datetime(2026, 1, 3), 'end_date': datetime(2026, 1, 5, 23, 59)}
+    df = CSVConnector().read(source, date_column='date_depart', max_workers=2)
+    expected = deliveries[days.between('20260103', '20260105')]
+    assert df['livraison_id'].tolist() == expected['livraison_id'].tolist()
+    # Fichiers analysés dans le pool partagé (spawn), réutilisé d'une lecture à l'autre
+    pool = loader_module._parse_pool
+    assert pool is not None and pool._mp_context.get_start_method() == 'spawn'
+    CSVConnector().read(source, date_column='date_depart', max_workers=2)
+    assert loader_module._parse_pool is pool
+
+    sync = DataSynchronizer(use_real_data=True, sector_name='logistics', connector_type='csv',
+                            data_source=str(tmp_path / 'livraisons_*.csv'))
+    data = sync.load_data(sync.data_source, datetime(2026, 1, 3), datetime(2026, 1, 5, 23, 59))
+    reference = sync.sector.transform(expected.reset_index(drop=True))
+    assert len(data) == len(reference)
+    assert list(data.columns) == list(reference.columns)
+
+
+@pytest.mark.parametrize('codec', ['gzip', 'bz2', 'xz'])
+def test_csv_detects_compression_from_content(operations_csv, tmp_path, codec):
+    import bz2
+    import lzma
+    from src.connectors.compression import detect_compression
+    path, df = operations_csv
+    opener = {'gzip': gzip.open, 'bz2': bz2.open, 'xz': lzma.open}[codec]
+    # Extension trompeuse : seul le contenu compte (fichiers importés nommés par empreinte)
+    compressed = tmp_path / 'upload.csv'
+    with open(path, 'rb') as src, opener(compressed, 'wb') as dst:
+        dst.write(src.read())
+    assert detect_compression(compressed) == codec
+    assert detect_compression(path) is None
+
+    result = CSVConnector().read(str(compressed), chunksize=50)
+    pd.testing.assert_frame_equal(result, df)
+    result = CSVConnector().read({'path': str(compressed), 'start_date': '2026-01-10', 'end_date': '2026-01-10 23:59'},
+                                 date_column='date_depart')
+    assert len(result) == 4
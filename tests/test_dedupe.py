@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import pytest
+import numpy as np
+import pandas as pd
+import src.data.sync as sync_module
+from src.data.dedupe import DedupeIndex, drop_duplicate_keys, key_hashes
+from src.data.sync import DataSynchronizer
+from src.sectors.telecom.data_simulator import generate_sample_data
+
+def test_index_remembers_keys_across_runs_and_compaction(tmp_path):
+    index = DedupeIndex(tmp_path, shard_bits=2, max_runs=3)
+    batches = [pd.DataFrame({'ticket_id': range(i * 100, i * 100 + 150)}) for i in range(6)]
+    total_new = 0
+    for batch in batches:
+        new, skipped = index.filter_new(batch, ['ticket_id'])
+        total_new += len(new)
+        assert len(new) + skipped == len(batch)
+    assert total_new == 650
+    # Chaque fragment reste sous max_runs tableaux triés
+    for shard in range(4):
+        assert 1 <= len(list(tmp_path.glob(f"shard_{shard:03d}_*.npy"))) <= 3
+
+    reopened = DedupeIndex(tmp_path, shard_bits=2)
+    new, skipped = reopened.filter_new(pd.DataFrame({'ticket_id': [5, 649, 650, 650]}), ['ticket_id'])
+    assert new['ticket_id'].tolist() == [650] and skipped == 3
+
+    df, dropped = drop_duplicate_keys(pd.DataFrame({'a': [1, 1, 2], 'b': ['x', 'x', 'x']}), ['a', 'b'])
+    assert dropped == 1 and df.index.tolist() == [0, 2]
+
+def test_ingest_processes_only_new_rows_of_overlapping_extracts(tmp_path, monkeypatch):
+    monkeypatch.setattr(sync_module, 'DEDUPE_DIR', tmp_path / 'dedupe')
+    monkeypatch.setattr(sync_module, 'CONVERSION_CACHE_DIR', tmp_path / 'conversions')
+    monkeypatch.setattr(sync_module, '_dedupe_indexes', {})
+    tickets = generate_sample_data(start_date=datetime(2026, 1, 1), end_date=datetime(2026, 1, 20))
+    days = tickets['date_ouverture'].dt.day
+    first, second = tmp_path / 'extrait_1.csv', tmp_path / 'extrait_2.csv'
+    tickets[days <= 12].to_csv(first, index=False)
+    tickets[days >= 8].to_csv(second, index=False)
+
+    sync = DataSynchronizer(use_real_data=True, sector_name='telecom', connector_type='csv', data_source=str(first))
+    assert len(sync.ingest()) == (days <= 12).sum()
+    new = sync.ingest(str(second))
+    assert len(new) == (days > 12).sum()
+    assert sync.last_duplicates == ((days >= 8) & (days <= 12)).sum()
+    assert np.array_equal(np.sort(new['ticket_id']), np.sort(tickets.loc[days > 12, 'ticket_id']))
+
+    # Transformation en échec : les clés ne sont pas enregistrées, le réimport les reprend
+    third = tmp_path / 'extrait_3.csv'
+    tickets[days == 20].assign(ticket_id=tickets.loc[days == 20, 'ticket_id'] + 10**6).to_csv(third, index=False)
+    transform = sync.sector.transform
+    monkeypatch.setattr(sync.sector, 'transform', lambda df: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        sync.ingest(str(third))
+    monkeypatch.setattr(sync.sector, 'transform', transform)
+    assert len(sync.ingest(str(third))) == (days == 20).sum()
+
+def test_resent_rows_are_counted_as_duplicates_not_quarantined(tmp_path, monkeypatch):
+    monkeypatch.setattr(sync_module, 'DEDUPE_DIR', tmp_path / 'dedupe')
+    monkeypatch.setattr(sync_module, '_dedupe_indexes', {})
+    tickets = generate_sample_data(start_date=datetime(2026, 1, 1), end_date=datetime(2026, 1, 5))
+    source = tmp_path / 'extrait.csv'
+    pd.concat([tickets, tickets.head(4)]).to_csv(source, index=False)
+
+    sync = DataSynchronizer(use_real_data=True, sector_name='telecom', connector_type='csv', data_source=str(source))
+    assert len(sync.ingest()) == len(tickets)
+    # Doublons du lot : retirés sur la clé naturelle, pas rejetés par la règle unique
+    assert sync.last_duplicates == 4 and sync.last_validation.rows_rejected == 0
+    assert len(sync.ingest()) == 0 and sync.last_duplicates == len(tickets) + 4
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        indexes = set(map(id, pool.map(sync_module._dedupe_index, ['education'] * 16)))
+    assert len(indexes) == 1
+
+def test_key_hashes_ignore_the_dtype_read():
+    as_int = pd.DataFrame({'id': [5, 6], 'jour': pd.to_datetime(['2026-01-02', '2026-01-03'])})
+    as_float = pd.DataFrame({'id': [5.0, 6.0], 'jour': pd.to_datetime(['2026-01-02', '2026-01-03']).as_unit('s')})
+    assert np.array_equal(key_hashes(as_int, ['id', 'jour']), key_hashes(as_float, ['id', 'jour']))
+    with_missing = pd.DataFrame({'id': [5.0, np.nan]})
+    assert key_hashes(with_missing, ['id'])[0] == key_hashes(as_int, ['id'])[0]
+    assert key_hashes(pd.DataFrame({'id': [5.5]}), ['id'])[0] != key_hashes(as_int, ['id'])[0]
@@ -39,4 +39,36 @@ def test_calculate_basic(sample_period_data):
     assert metrics.daily_gains > 0
     assert metrics.period_gains == metrics.daily_gains * 5
     assert 'time_gain' in metrics.breakdown
-    assert metrics.transaction_hash.startswith('0x')
\ No newline at end of file
+    assert metrics.transaction_hash.startswith('0x')
+
+def test_daily_series_reconciles_with_period(sample_period_data):
+    session_state = type('obj', (object,), {
+        'baseline_duration': 50,
+        'hourly_cost': 30,
+        'baseline_error_rate': 0.03,
+        'error_cost': 200,
+        'fuel_saving_per_truck': 1.5
+    })
+    metrics = FinancialCalculator(session_state).calculate(sample_period_data)
+    series = metrics.daily_series
+
+    assert len(series) == len(sample_period_data.daily_data)
+    assert list(series.columns) == ['date', 'time_gain', 'error_gain', 'maintenance_gain', 'fuel_gain', 'total_gain']
+    for name in ('time_gain', 'error_gain', 'maintenance_gain', 'fuel_gain'):
+        assert series[name].sum() == pytest.approx(metrics.breakdown[f'{name}_period'], abs=0.05)
+    assert series['total_gain'].sum() == pytest.approx(metrics.period_gains, abs=0.05)
+    assert len(metrics.to_dict()['daily_series']) == 5
+
+def test_daily_series_follows_period_floor_and_truck_cap(sample_period_data):
+    # Durée de référence sous la moyenne : gain temps planché à zéro sur la période ;
+    # un jour au-delà du plafond de 500 camions, mais pas la moyenne
+    daily = sample_period_data.daily_data.assign(nb_operations=[100, 110, 105, 2000, 115])
+    period = PeriodData(daily, sample_period_data.engins_data, sample_period_data.hourly_data,
+                        sample_period_data.recent_ops, sample_period_data.start_date, sample_period_data.end_date, "Test")
+    session_state = type('obj', (object,), {'baseline_duration': 40, 'fuel_saving_per_truck': 1.5})
+    metrics = FinancialCalculator(session_state).calculate(period)
+    series = metrics.daily_series
+
+    assert metrics.breakdown['time_gain_period'] == 0 and (series['time_gain'] == 0).all()
+    assert series['fuel_gain'].sum() == pytest.approx(metrics.breakdown['fuel_gain_period'], abs=0.05)
+    assert series['total_gain'].sum() == pytest.approx(metrics.period_gains, abs=0.05)
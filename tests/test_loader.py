@@ -0,0 +1,58 @@
+import threading
+import time
+from datetime import datetime
+import pandas as pd
+import pytest
+import src.data.sync as sync_module
+from src.connectors.factory import ConnectorFactory
+from src.data.loader import load_concurrently, parse_pool, shutdown_parse_pool
+from src.data.sync import DataSynchronizer
+from src.sectors.telecom.data_simulator import generate_sample_data
+
+def test_tables_load_in_parallel_in_declared_order():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def slow(value):
+        def load():
+            # Ne se débloque que si les trois chargements tournent en même temps
+            barrier.wait()
+            time.sleep(0.1)
+            return value
+        return load
+
+    tables = load_concurrently({'daily': slow(1), 'operations': slow(2), 'equipment': slow(3)})
+    assert list(tables.items()) == [('daily', 1), ('operations', 2), ('equipment', 3)]
+
+    def failing():
+        raise FileNotFoundError('absent')
+    with pytest.raises(FileNotFoundError):
+        load_concurrently({'daily': lambda: 1, 'operations': failing})
+    assert load_concurrently({'daily': lambda: 1, 'operations': lambda: 2}, max_workers=1) == {'daily': 1, 'operations': 2}
+
+def test_parse_pool_does_not_fork_the_server():
+    try:
+        assert parse_pool()._mp_context.get_start_method() == 'spawn'
+    finally:
+        shutdown_parse_pool()
+
+def test_load_sources_keeps_one_report_per_table(tmp_path, monkeypatch):
+    monkeypatch.setattr(sync_module, '_sector_frames', sync_module.OrderedDict())
+    monkeypatch.setattr(sync_module, 'CONVERSION_CACHE_DIR', tmp_path / 'conversions')
+    tickets = generate_sample_data(start_date=datetime(2026, 1, 1), end_date=datetime(2026, 1, 10))
+    clean, resent = tmp_path / 'clean.csv', tmp_path / 'resent.csv'
+    tickets.to_csv(clean, index=False)
+    pd.concat([tickets, tickets.head(7)]).to_csv(resent, index=False)
+
+    sync = DataSynchronizer(use_real_data=True, sector_name='telecom', connector_type='csv', data_source=str(clean))
+    created = []
+    create = ConnectorFactory.create_connector
+    monkeypatch.setattr(ConnectorFactory, 'create_connector', lambda *a, **k: created.append(create(*a, **k)) or created[-1])
+    tables = sync.load_sources({'clean': str(clean), 'resent': str(resent)})
+    assert len(tables['clean']) == len(tables['resent']) == len(tickets)
+    # Un connecteur propre à chaque source, distinct de l'instance partagée du registre
+    assert len(set(map(id, created))) == 2 and sync.source_connector not in created
+    # Chaque table garde son bilan : les doublons renvoyés sont comptés dans 'resent' seulement,
+    # retirés par la clé naturelle plutôt que mis en quarantaine
+    duplicates = {name: reports[2] for name, reports in sync.last_source_reports.items()}
+    assert duplicates == {'clean': 0, 'resent': 7}
+    assert sync.last_source_reports['resent'][0].rows_rejected == 0
@@ -0,0 +1,101 @@
+import hashlib
+import pytest
+from datetime import datetime
+import pandas as pd
+from src.data.models import PeriodData
+from src.finance.merkle import MerkleTree, PeriodMerkleIndex, day_digests
+
+def make_period(days):
+    daily = pd.DataFrame({
+        'date': pd.date_range('2026-01-01', periods=days),
+        'nb_operations': range(100, 100 + days),
+        'duree_moyenne': [45.0] * days,
+        'erreurs': [2] * days
+    })
+    engins = pd.DataFrame({'engin': ['A', 'B'], 'total_operations': [500, 450], 'erreurs': [10, 8]})
+    hourly = pd.DataFrame({'heure': [8], 'nb_operations': [20]})
+    recent = pd.DataFrame({
+        'timestamp': pd.to_datetime(['2026-01-01 08:00', '2026-01-02 09:30']),
+        'engin': ['A', 'B'],
+        'duree_minutes': [20, 25]
+    })
+    return PeriodData(daily, engins, hourly, recent, datetime(2026, 1, 1), datetime(2026, 1, days), "Test")
+
+@pytest.mark.parametrize('size', [1, 2, 5, 8, 13])
+def test_incremental_tree_matches_rebuild(size):
+    leaves = [f"leaf-{i}".encode() for i in range(size)]
+    incremental = MerkleTree()
+    for leaf in leaves:
+        incremental.append(leaf)
+    assert incremental.root == MerkleTree(leaves).root
+
+    incremental.update(size // 2, b"corrected")
+    leaves[size // 2] = b"corrected"
+    assert incremental.root == MerkleTree(leaves).root
+    for i, leaf in enumerate(leaves):
+        assert MerkleTree.verify(leaf, incremental.proof(i), incremental.root)
+    assert not MerkleTree.verify(b"forged", incremental.proof(0), incremental.root)
+
+def test_period_index_appends_and_proves_days():
+    index = PeriodMerkleIndex()
+    assert index.sync(make_period(10)) > 0
+    assert index.sync(make_period(10)) == 0
+
+    # Un jour ajouté : une seule feuille recalculée dans la table journalière
+    assert index.sync(make_period(11)) == 1
+    fresh = PeriodMerkleIndex()
+    fresh.sync(make_period(11))
+    assert index.root == fresh.root
+
+    proof = index.proof('daily', '2026-01-05')
+    assert PeriodMerkleIndex.verify('daily', proof, index.root)
+    assert index.proof('daily', '2025-12-31') is None
+
+def test_sliding_window_reuses_day_leaves():
+    history = make_period(31)
+    def window(first, days):
+        start = datetime(2026, 1, 1) + pd.Timedelta(days=first)
+        end = start + pd.Timedelta(days=days - 1)
+        daily = history.daily_data[history.daily_data['date'].between(start, end)]
+        recent = history.recent_ops[history.recent_ops['timestamp'].between(start, end + pd.Timedelta(days=1))]
+        return PeriodData(daily, history.engins_data, history.hourly_data, recent, start, end, "Fenêtre")
+
+    index = PeriodMerkleIndex()
+    index.sync(window(0, 30))
+    # Fenêtre décalée d'un jour : seul le nouveau jour est haché dans l'arbre
+    assert index.sync(window(1, 30)) == 1
+    fresh = PeriodMerkleIndex()
+    fresh.sync(window(1, 30))
+    assert index.root == fresh.root
+    assert index.proof('daily', '2026-01-01') is None
+    proof = index.proof('daily', '2026-01-31')
+    assert PeriodMerkleIndex.verify('daily', proof, index.root)
+    assert not PeriodMerkleIndex.verify('daily', {**proof, 'leaf': b'forged'}, index.root)
+    assert PeriodMerkleIndex.verify('engins', index.proof('engins', 'B'), index.root)
+
+    # Retour à la fenêtre initiale : feuilles encore en cache, rien à recalculer
+    assert index.sync(window(0, 30)) == 0
+    initial = PeriodMerkleIndex()
+    initial.sync(window(0, 30))
+    assert index.root == initial.root
+
+def test_root_ignores_display_columns_and_dtypes():
+    period = make_period(5)
+    root = PeriodMerkleIndex()
+    root.sync(period)
+    reference = root.root
+
+    # Colonne d'affichage ajoutée, types différents (lecture CSV ou Parquet)
+    period.engins_data['taux_erreur'] = period.engins_data['erreurs'] / period.engins_data['total_operations'] * 100
+    daily = period.daily_data.astype({'nb_operations': 'float64', 'erreurs': 'int32'})
+    daily['date'] = daily['date'].dt.strftime('%Y-%m-%d')
+    retyped = PeriodData(daily, period.engins_data, period.hourly_data, period.recent_ops,
+                         period.start_date, period.end_date, period.period_name)
+    for data in (period, retyped):
+        index = PeriodMerkleIndex()
+        index.sync(data)
+        assert index.root == reference
+
+    # Feuille recalculable à partir des seules valeurs (SHA-256 des lignes canoniques)
+    row = '\x1f'.join(['2026-01-02', '101', '45', '', '2'])
+    assert day_digests(retyped)['daily']['2026-01-02'] == hashlib.sha256(row.encode()).digest()
@@ -0,0 +1,60 @@
+import pandas as pd
+from datetime import datetime
+import src.data.partitions as partitions
+from src.data.partitions import PartitionedDataset
+from src.data.repository import FileDataRepository, partition_repository
+
+def write_history(directory):
+    days = pd.date_range('2025-11-01', '2026-02-28', freq='D')
+    pd.DataFrame({
+        'date': days.strftime('%Y-%m-%d'),
+        'nb_operations': range(len(days)),
+        'duree_moyenne': 45.0,
+        'erreurs': 2
+    }).to_csv(directory / 'daily_operations.csv', index=False)
+    pd.DataFrame({'engin': ['A', 'B'], 'total_operations': [500, 450]}).to_csv(
+        directory / 'equipment_performance.csv', index=False)
+    stamps = pd.date_range('2025-11-01 06:00', '2026-02-28 18:00', freq='6h')
+    pd.DataFrame({
+        'timestamp': stamps.strftime('%Y-%m-%d %H:%M:%S'),
+        'engin': ['A', 'B'] * (len(stamps) // 2) + ['A'] * (len(stamps) % 2),
+        'duree_minutes': 20
+    }).to_csv(directory / 'recent_operations.csv', index=False)
+
+def test_partitioned_repository_opens_only_overlapping_months(tmp_path, monkeypatch):
+    source, target = tmp_path / 'csv', tmp_path / 'partitioned'
+    source.mkdir()
+    write_history(source)
+    dataset = partition_repository(source, target)
+    assert dataset.tables() == ['daily', 'equipment', 'operations']
+    assert (target / 'daily' / '2026' / '01' / 'part.parquet').exists()
+    assert len(dataset.partitions('daily')) == 4
+
+    opened = []
+    original = partitions.pq.read_table
+    monkeypatch.setattr(partitions.pq, 'read_table', lambda path, *a, **k: opened.append(path) or original(path, *a, **k))
+    start, end = datetime(2026, 1, 25), datetime(2026, 2, 3, 23, 59)
+    period = FileDataRepository(target).get_period_data(start, end)
+    reference = FileDataRepository(source).get_period_data(start, end)
+
+    assert sorted({str(p.relative_to(target).parent) for p in opened}) == [
+        'daily/2026/01', 'daily/2026/02', 'equipment', 'operations/2026/01', 'operations/2026/02'
+    ]
+    pd.testing.assert_frame_equal(period.daily_data.reset_index(drop=True), reference.daily_data.reset_index(drop=True))
+    pd.testing.assert_frame_equal(period.recent_ops.reset_index(drop=True), reference.recent_ops.reset_index(drop=True))
+    pd.testing.assert_frame_equal(period.hourly_data, reference.hourly_data)
+    assert period.engins_data['engin'].tolist() == ['A', 'B']
+
+def test_append_extends_month_and_manifest(tmp_path):
+    dataset = PartitionedDataset(tmp_path)
+    first = pd.DataFrame({'date': pd.to_datetime(['2026-03-02', '2026-03-01']), 'valeur': [2, 1]})
+    dataset.write('daily', first, 'date')
+    dataset.write('daily', pd.DataFrame({'date': pd.to_datetime(['2026-03-20', '2026-04-02']), 'valeur': [3, 4]}),
+                  'date', append=True)
+
+    reopened = PartitionedDataset(tmp_path)
+    assert reopened.read('daily')['valeur'].tolist() == [1, 2, 3, 4]
+    assert reopened.read('daily', datetime(2026, 3, 2), datetime(2026, 3, 31), columns=['valeur'])['valeur'].tolist() == [2, 3]
+    empty = reopened.read('daily', datetime(2027, 1, 1))
+    assert empty.empty and list(empty.columns) == ['date', 'valeur']
+    assert len(reopened.partitions('daily', datetime(2026, 4, 1))) == 1
@@ -0,0 +1,36 @@
+import pytest
+from datetime import datetime
+from src.data.models import SiteConfig
+from src.finance.portfolio import PortfolioCalculator
+
+@pytest.fixture
+def session_state():
+    return type('obj', (object,), {
+        'baseline_duration': 50,
+        'hourly_cost': 30,
+        'baseline_error_rate': 0.03,
+        'error_cost': 200,
+        'monthly_fixed': 5000,
+        'commission_rate': 0.1,
+        'working_days': 22
+    })
+
+@pytest.mark.parametrize('use_processes', [False, True])
+def test_portfolio_consolidation(session_state, use_processes):
+    sites = [SiteConfig('LUBUMBASHI', 'site_a'), SiteConfig('KASUMBALESA', 'site_b')]
+    calc = PortfolioCalculator(session_state, sites, max_workers=2, use_processes=use_processes)
+    portfolio = calc.calculate(datetime(2026, 1, 1), datetime(2026, 1, 10))
+
+    assert list(portfolio.sites) == ['LUBUMBASHI', 'KASUMBALESA']
+    assert portfolio.failed_sites == {}
+    total = sum(m.period_gains for m in portfolio.sites.values())
+    assert portfolio.consolidated.period_gains == pytest.approx(total)
+    total_ops = sum(m.period_summary['total_operations'] for m in portfolio.sites.values())
+    assert portfolio.consolidated.period_summary['total_operations'] == total_ops
+    # Les sites ont des hashs de données distincts, donc des résultats distincts
+    hashes = {m.transaction_hash for m in portfolio.sites.values()}
+    assert len(hashes) == 2
+
+def test_portfolio_rejects_duplicate_names(session_state):
+    with pytest.raises(ValueError):
+        PortfolioCalculator(session_state, [SiteConfig('A', 'x'), SiteConfig('A', 'y')])
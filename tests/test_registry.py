@@ -0,0 +1,32 @@
+import sys
+from importlib.metadata import EntryPoint
+import pytest
+import src.utils.registry as registry_module
+from src.connectors.csv import CSVConnector
+from src.connectors.factory import ConnectorFactory
+from src.utils.registry import PluginRegistry
+
+def test_registry_resolves_lazily_and_caches_instances(monkeypatch):
+    monkeypatch.delitem(sys.modules, 'colorsys', raising=False)
+    registry = PluginRegistry('opsgain.test', {'hsv': 'colorsys:rgb_to_hsv', 'csv': 'src.connectors.csv:CSVConnector'})
+    assert 'colorsys' not in sys.modules
+    assert registry.get_class('HSV').__name__ == 'rgb_to_hsv'
+    assert 'colorsys' in sys.modules
+
+    assert registry.get('csv') is registry.get('csv')
+    assert registry.get('csv', sep=';') is not registry.get('csv')
+    with pytest.raises(ValueError):
+        registry.get('inconnu')
+
+def test_registry_loads_entry_points(monkeypatch):
+    plugin = EntryPoint('maison', 'src.connectors.csv:CSVConnector', 'opsgain.connectors')
+    monkeypatch.setattr(registry_module, 'entry_points', lambda group: [plugin] if group == 'opsgain.connectors' else [])
+    registry = PluginRegistry('opsgain.connectors', {})
+    assert registry.names() == ['maison']
+    assert isinstance(registry.get('maison'), CSVConnector)
+
+def test_connector_factory_shares_configured_instances(tmp_path):
+    database = str(tmp_path / 'ops.db')
+    sql = ConnectorFactory.get_connector('sql', database=database)
+    assert ConnectorFactory.get_connector('SQL', database=database) is sql
+    assert sql.pool is not None
@@ -0,0 +1,79 @@
+import os
+import pandas as pd
+from datetime import datetime
+import src.data.repository as repository
+from src.data.repository import FileDataRepository
+
+def write_files(directory, days):
+    pd.DataFrame({
+        'date': [f"2026-01-{d:02d}" for d in days],
+        'nb_operations': [100 + d for d in days],
+        'duree_moyenne': [45.0] * len(days),
+        'erreurs': [2] * len(days)
+    }).to_csv(directory / 'daily_operations.csv', index=False)
+    pd.DataFrame({'engin': ['A', 'B'], 'total_operations': [500, 450]}).to_csv(
+        directory / 'equipment_performance.csv', index=False)
+    pd.DataFrame({
+        'timestamp': ['2026-01-05 08:00:00', '2026-01-03 09:30:00'],
+        'engin': ['A', 'B'],
+        'duree_minutes': [20, 25]
+    }).to_csv(directory / 'recent_operations.csv', index=False)
+
+def test_parsed_files_are_cached_until_modified(tmp_path, monkeypatch):
+    write_files(tmp_path, [3, 1, 2, 5, 4])
+    reads = []
+    original = pd.read_csv
+    monkeypatch.setattr(repository.pd, 'read_csv', lambda path, *a, **k: reads.append(path) or original(path, *a, **k))
+    repo = FileDataRepository(tmp_path)
+
+    period = repo.get_period_data(datetime(2026, 1, 2), datetime(2026, 1, 4))
+    assert period.daily_data['nb_operations'].tolist() == [102, 103, 104]
+    assert period.recent_ops['engin'].tolist() == ['B']
+    FileDataRepository(tmp_path).get_period_data(datetime(2026, 1, 1), datetime(2026, 1, 5))
+    # Le journal est lu par le TailReader (BytesIO) ; les deux CSV une seule fois
+    assert [path.name for path in reads if hasattr(path, 'name')] == ['daily_operations.csv', 'equipment_performance.csv']
+
+    write_files(tmp_path, [1, 2, 3, 4, 5, 6])
+    stat = os.stat(tmp_path / 'daily_operations.csv')
+    os.utime(tmp_path / 'daily_operations.csv', ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    period = repo.get_period_data(datetime(2026, 1, 5), datetime(2026, 1, 6))
+    assert period.daily_data['nb_operations'].tolist() == [105, 106]
+
+def test_engins_derived_from_period_operations(tmp_path, monkeypatch):
+    write_files(tmp_path, [1, 2, 3, 4, 5])
+    pd.DataFrame({
+        'timestamp': ['2026-01-02 08:00:00', '2026-01-03 09:00:00', '2026-01-03 10:00:00', '2026-01-05 11:00:00'],
+        'engin': ['A', 'B', 'A', 'A'],
+        'duree_minutes': [20, 30, 40, 90],
+        'erreur': [0, 1, 1, 1]
+    }).to_csv(tmp_path / 'recent_operations.csv', index=False)
+    (tmp_path / 'equipment_performance.csv').unlink()
+    monkeypatch.setattr(repository, '_derived_engins', repository.OrderedDict())
+    repo = FileDataRepository(tmp_path, engins_from_operations=True)
+
+    engins = repo.get_period_data(datetime(2026, 1, 2), datetime(2026, 1, 3, 23, 59)).engins_data
+    assert engins.to_dict('list') == {
+        'engin': ['A', 'B'], 'total_operations': [2, 1], 'erreurs': [1, 1], 'duree_moyenne': [30.0, 30.0]
+    }
+    # Même période, journal inchangé : agrégat réutilisé ; une autre période a le sien
+    engins['taux_erreur'] = 0
+    assert 'taux_erreur' not in repo.get_period_data(datetime(2026, 1, 2), datetime(2026, 1, 3, 23, 59)).engins_data
+    assert len(repository._derived_engins) == 1
+    later = repo.get_period_data(datetime(2026, 1, 4), datetime(2026, 1, 5, 23, 59)).engins_data
+    assert later['total_operations'].tolist() == [1] and len(repository._derived_engins) == 2
+
+    with open(tmp_path / 'recent_operations.csv', 'a') as f:
+        f.write('2026-01-03 12:00:00,B,10,0\n')
+    engins = repo.get_period_data(datetime(2026, 1, 2), datetime(2026, 1, 3, 23, 59)).engins_data
+    assert engins['total_operations'].tolist() == [2, 2]
+
+def test_resent_port_operations_are_counted_once(tmp_path, monkeypatch):
+    write_files(tmp_path, [1, 2, 3, 3])
+    with open(tmp_path / 'recent_operations.csv', 'a') as f:
+        # Extrait renvoyé : la même opération réapparaît en fin de journal
+        f.write('2026-01-03 09:30:00,B,25\n2026-01-03 09:30:00,A,25\n')
+    monkeypatch.setattr(repository, '_tail_readers', {})
+    period = FileDataRepository(tmp_path).get_period_data(datetime(2026, 1, 1), datetime(2026, 1, 5, 23, 59))
+    assert period.daily_data['nb_operations'].tolist() == [101, 102, 103]
+    assert sorted(period.recent_ops['engin'].tolist()) == ['A', 'A', 'B']
+    assert period.hourly_data['nb_operations'].sum() == 3
@@ -0,0 +1,59 @@
+import os
+import pandas as pd
+from src.data.tail import TailReader
+
+HEADER = "timestamp,engin,duree_minutes\n"
+
+def line(minute, engin='TRACTEUR_01'):
+    return f"2026-01-03 14:{minute:02d}:00,{engin},{20 + minute}\n"
+
+def test_tail_reads_only_appended_lines(tmp_path):
+    path = tmp_path / 'recent_operations.csv'
+    path.write_text(HEADER + line(0) + line(1))
+    reader = TailReader(path, 'timestamp', timestamp_format='%Y-%m-%d %H:%M:%S')
+    assert len(reader.refresh()) == 2
+
+    with open(path, 'a') as f:
+        f.write(line(2) + line(3)[:12])  # dernière ligne en cours d'écriture
+    offset = reader.offset
+    assert len(reader.refresh()) == 3
+    with open(path, 'a') as f:
+        f.write(line(3)[12:])
+    df = reader.refresh()
+    assert df['duree_minutes'].tolist() == [20, 21, 22, 23]
+    assert reader.offset == os.path.getsize(path) > offset
+    assert reader.last_timestamp == pd.Timestamp('2026-01-03 14:03:00')
+
+    # Ligne complète sans fin de ligne : visible, mais pas encore intégrée
+    with open(path, 'a') as f:
+        f.write(line(4).rstrip('\n'))
+    assert len(reader.refresh()) == 5 and len(reader.frame) == 4
+
+def test_tail_handles_rotation_and_truncation(tmp_path):
+    path = tmp_path / 'recent_operations.csv'
+    path.write_text(HEADER + line(0) + line(1))
+    reader = TailReader(path, 'timestamp', timestamp_format='%Y-%m-%d %H:%M:%S')
+    reader.refresh()
+
+    # Rotation : nouveau fichier qui reprend la dernière ligne connue
+    path.rename(tmp_path / 'recent_operations.csv.1')
+    path.write_text(HEADER + line(1) + line(2))
+    assert reader.refresh()['duree_minutes'].tolist() == [20, 21, 22]
+
+    # Troncature puis réécriture plus longue avec un autre contenu
+    path.write_text(HEADER + line(5, 'CHARIOT_01') + line(6) + line(7))
+    assert reader.refresh()['duree_minutes'].tolist() == [20, 21, 22, 25, 26, 27]
+
+def test_rotation_keeps_new_rows_of_the_last_second_and_late_rows(tmp_path):
+    path = tmp_path / 'recent_operations.csv'
+    path.write_text(HEADER + line(1) + line(3))
+    reader = TailReader(path, 'timestamp', timestamp_format='%Y-%m-%d %H:%M:%S')
+    reader.refresh()
+
+    # Le nouveau fichier reprend line(3), ajoute une autre opération à la même
+    # seconde, une opération en retard (minute 2) et un vrai doublon de line(3)
+    path.rename(tmp_path / 'recent_operations.csv.1')
+    path.write_text(HEADER + line(3) + line(3, 'CHARIOT_01') + line(2) + line(3))
+    df = reader.refresh()
+    assert df['duree_minutes'].tolist() == [21, 22, 23, 23, 23]
+    assert df['engin'].tolist().count('CHARIOT_01') == 1
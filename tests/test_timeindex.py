@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import datetime
+import src.data.sync as sync_module
+from src.data.sync import DataSynchronizer
+from src.data.timeindex import period_bounds, slice_period, sort_by_time
+from src.sectors.telecom.data_simulator import generate_sample_data
+
+@pytest.fixture
+def frame():
+    times = pd.to_datetime(['2026-01-03 00:00', '2026-01-01 00:00', None, '2026-01-02 12:00', '2026-01-02 00:00', '2026-01-05 00:00'])
+    return pd.DataFrame({'date': times, 'valeur': [3, 1, 0, 22, 2, 5]})
+
+def test_slice_matches_boolean_mask_without_copy(frame):
+    ordered = sort_by_time(frame, 'date')
+    assert ordered['valeur'].tolist() == [1, 2, 22, 3, 5]
+    assert sort_by_time(ordered, 'date') is ordered
+
+    start, end = datetime(2026, 1, 2), datetime(2026, 1, 3)
+    expected = ordered[(ordered['date'] >= start) & (ordered['date'] <= end)]
+    part = slice_period(ordered, 'date', start, end)
+    pd.testing.assert_frame_equal(part, expected)
+    # Tranche contiguë : les données ne sont pas recopiées
+    assert np.shares_memory(part['valeur'].to_numpy(), ordered['valeur'].to_numpy())
+
+    assert period_bounds(ordered['date'], end_date=datetime(2025, 12, 31)) == (0, 0)
+    assert period_bounds(ordered['date'], datetime(2026, 2, 1)) == (5, 5)
+    assert len(slice_period(ordered, 'date')) == 5
+
+def test_slice_accepts_timezone_mismatch(frame):
+    ordered = sort_by_time(frame, 'date')
+    aware = ordered.assign(date=ordered['date'].dt.tz_localize('UTC'))
+    part = slice_period(aware, 'date', datetime(2026, 1, 2), datetime(2026, 1, 2, 23, 59))
+    assert part['valeur'].tolist() == [2, 22]
+    with pytest.raises(TypeError):
+        sort_by_time(frame.astype({'date': str}), 'date')
+
+@pytest.fixture
+def tickets_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(sync_module, '_sector_frames', sync_module.OrderedDict())
+    monkeypatch.setattr(sync_module, '_sector_frames_bytes', 0)
+    monkeypatch.setattr(sync_module, 'CONVERSION_CACHE_DIR', tmp_path / 'conversions')
+    tickets = generate_sample_data(start_date=datetime(2026, 1, 1), end_date=datetime(2026, 1, 20))
+    source = tmp_path / 'tickets.csv'
+    tickets.sample(frac=1, random_state=0).to_csv(source, index=False)
+    return tickets, source
+
+def spied_synchronizer(source, monkeypatch):
+    sync = DataSynchronizer(use_real_data=True, sector_name='telecom', connector_type='csv', data_source=str(source))
+    # Analyses du fichier source, avec ou sans conversion Arrow
+    reads = []
+    original = sync.source_connector.read
+    monkeypatch.setattr(sync.source_connector, 'read', lambda *a, **k: reads.append(a[0]) or original(*a, **k))
+    return sync, reads
+
+def test_synchronizer_reads_local_source_once_across_periods(tickets_source, tmp_path, monkeypatch):
+    tickets, source = tickets_source
+    sync, reads = spied_synchronizer(source, monkeypatch)
+
+    first = sync.load_data(str(source), datetime(2026, 1, 3), datetime(2026, 1, 5, 23, 59))
+    report = sync.last_validation
+    sync.last_validation = None
+    second = sync.load_data(str(source), datetime(2026, 1, 10), datetime(2026, 1, 12, 23, 59))
+    assert len(reads) == 1
+    # Un seul cache : la source indexée en mémoire n'est pas convertie en Arrow
+    assert not list((tmp_path / 'conversions').glob('*.arrow'))
+    # Bilan de la lecture complète restauré depuis le cache
+    assert sync.last_validation is report and report is not None
+    assert 0 < sync_module._sector_frames_bytes <= sync_module.SECTOR_FRAMES_MAX_MB * 1024 * 1024
+    days = tickets['date_ouverture'].dt.day
+    assert len(first) == days.between(3, 5).sum() and len(second) == days.between(10, 12).sum()
+    assert first['date_ouverture'].is_monotonic_increasing
+
+def test_large_sources_are_read_by_period(tickets_source, monkeypatch):
+    tickets, source = tickets_source
+    days = tickets['date_ouverture'].dt.day
+    periods = [(datetime(2026, 1, 3), datetime(2026, 1, 5, 23, 59)), (datetime(2026, 1, 10), datetime(2026, 1, 12, 23, 59))]
+
+    # Source au-delà du seuil : lecture filtrée par le connecteur à chaque période
+    monkeypatch.setattr(sync_module, 'CONVERSION_CACHE_MAX_SOURCE_MB', 0)
+    sync, reads = spied_synchronizer(source, monkeypatch)
+    assert [len(sync.load_data(str(source), *period)) for period in periods] == [days.between(3, 5).sum(), days.between(10, 12).sum()]
+    assert [read['start_date'] for read in reads] == [start for start, _ in periods]
+    assert not sync_module._sector_frames
+
+def test_unindexable_source_is_read_by_period_from_arrow(tickets_source, tmp_path, monkeypatch):
+    tickets, source = tickets_source
+    days = tickets['date_ouverture'].dt.day
+    sync, reads = spied_synchronizer(source, monkeypatch)
+    transform = sync.sector.transform
+    monkeypatch.setattr(sync.sector, 'transform', lambda df: transform(df).astype({'date_ouverture': str}))
+
+    first = sync.load_data(str(source), datetime(2026, 1, 3), datetime(2026, 1, 5, 23, 59))
+    second = sync.load_data(str(source), datetime(2026, 1, 10), datetime(2026, 1, 12, 23, 59))
+    assert len(first) == days.between(3, 5).sum() and len(second) == days.between(10, 12).sum()
+    third = sync.load_data(str(source), datetime(2026, 1, 15), datetime(2026, 1, 15, 23, 59))
+    assert len(third) == (days == 15).sum()
+    # Lecture complète, puis conversion Arrow unique servant toutes les périodes
+    assert len(reads) == 2
+    assert len(list((tmp_path / 'conversions').glob('*.arrow'))) == 1
@@ -0,0 +1,36 @@
+import io
+import os
+import time
+from src.data.uploads import UploadStore
+
+def test_identical_uploads_share_one_file(tmp_path):
+    store = UploadStore(tmp_path, max_bytes=10_000, max_age_seconds=3600, chunk_size=7)
+    payload = b"date,engin,duree\n" * 100
+    first = store.save(io.BytesIO(payload), '.csv')
+    second = store.save(io.BytesIO(payload), '.CSV')
+    assert first == second
+    assert first.read_bytes() == payload
+    assert [p for p in tmp_path.iterdir()] == [first]
+
+def test_eviction_by_age_then_size(tmp_path):
+    store = UploadStore(tmp_path, max_bytes=2_500, max_age_seconds=3600)
+    old = store.save(io.BytesIO(b"a" * 1000), '.csv')
+    os.utime(old, (time.time() - 7200, time.time() - 7200))
+    kept = store.save(io.BytesIO(b"b" * 1000), '.csv')
+    assert not old.exists()
+
+    newest = store.save(io.BytesIO(b"c" * 2000), '.csv')
+    # Taille dépassée : le moins récent part, le fichier qui vient d'être importé reste
+    assert newest.exists() and not kept.exists()
+
+def test_recently_used_file_survives_eviction(tmp_path):
+    store = UploadStore(tmp_path, max_bytes=2_500, max_age_seconds=3600, in_use_seconds=600)
+    shared = store.save(io.BytesIO(b"a" * 1000), '.csv')
+    idle = store.save(io.BytesIO(b"b" * 1000), '.csv')
+    for path in (shared, idle):
+        os.utime(path, (time.time() - 1200, time.time() - 1200))
+    # Une autre session lit encore shared : il est protégé malgré la taille dépassée
+    assert store.touch(shared)
+    store.save(io.BytesIO(b"c" * 1000), '.csv')
+    assert shared.exists() and not idle.exists()
+    assert not store.touch(idle)
@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+from src.data.validation import REASON_COLUMN, validate_frame
+from src.sectors import SectorFactory
+
+@pytest.fixture
+def deliveries():
+    return pd.DataFrame({
+        'livraison_id': [1, 2, 3, 4, 4],
+        'date_depart': ['2026-01-01 08:00', '2026-01-01 09:00', 'pas une date', '2026-01-02 08:00', '2026-01-02 09:00'],
+        'date_arrivee': ['2026-01-01 10:00', '2026-01-01 08:00', '2026-01-01 12:00', '2026-01-02 11:00', '2026-01-02 12:00'],
+        'distance_km': ['120', '80', '95', '60', '-4'],
+        'carburant_litres': [30.0, 20.0, 25.0, 15.0, 5.0],
+        'statut': ['à temps', 'retard', 'à temps', 'à temps', 'retard']
+    })
+
+def test_validation_quarantines_rows_with_reasons(deliveries):
+    sector = SectorFactory.get_sector('logistics')
+    clean, quarantine, report = validate_frame(deliveries, sector.schema, sector.relations)
+
+    assert clean['livraison_id'].tolist() == [1, 4]
+    # Colonnes converties une seule fois, réutilisables par le transformateur
+    assert pd.api.types.is_datetime64_any_dtype(clean['date_depart'])
+    assert pd.api.types.is_numeric_dtype(clean['distance_km'])
+    assert report.rows_read == 5 and report.rows_rejected == 3
+
+    assert quarantine[REASON_COLUMN].tolist() == [
+        'date_arrivee >= date_depart non respecté',
+        'date_depart : type invalide',
+        'livraison_id : doublon; distance_km : inférieur à 0'
+    ]
+    # Valeurs brutes conservées en quarantaine
+    assert quarantine['date_depart'].iloc[1] == 'pas une date'
+    assert report.reasons['livraison_id : doublon'] == 1
+    sector.transform(clean)
+
+def test_validation_requires_declared_columns(deliveries):
+    sector = SectorFactory.get_sector('logistics')
+    with pytest.raises(ValueError, match='statut'):
+        validate_frame(deliveries.drop(columns=['statut']), sector.schema, sector.relations)